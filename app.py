@@ -1,7 +1,14 @@
 # app.py
+import os
+import re
+import uuid
+
 import streamlit as st
-from calculator import compute_benefits, quota_copertura_from_kwp
-from pdf_report import build_pdf
+from calculator import compute_benefits, ottimizza_moduli, quota_copertura_from_kwp
+from config import CFG
+from lavori_pdf import GestoreLavori
+from montecarlo import simula_monte_carlo
+from simulazione_oraria import parametri_autoconsumo, zona_da_resa
 
 st.set_page_config(
     page_title="Configuratore CER — Next S.r.l.",
@@ -10,234 +17,20 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+CARTELLA_DATI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dati")
+
 # =========================================================
 # CUSTOM CSS
 # =========================================================
-st.markdown("""
-<style>
-@import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&family=JetBrains+Mono:wght@400;500&display=swap');
-
-html, body, [class*="css"] {
-    font-family: 'DM Sans', sans-serif !important;
-}
-
-.stApp {
-    background-color: #f8f7fb;
-}
-
-#MainMenu {visibility: hidden;}
-footer {visibility: hidden;}
-header {visibility: hidden;}
-
-h1 {
-    font-family: 'DM Sans', sans-serif !important;
-    font-size: 28px !important;
-    font-weight: 600 !important;
-    color: #1e1b2e !important;
-}
-h2 {
-    font-family: 'DM Sans', sans-serif !important;
-    font-size: 20px !important;
-    font-weight: 600 !important;
-    color: #1e1b2e !important;
-}
-
-p, span, label, .stMarkdown, div {
-    font-size: 15px !important;
-    color: #1e1b2e !important;
-}
-
-.stTextInput label, .stNumberInput label, .stSelectbox label {
-    font-size: 14px !important;
-    font-weight: 500 !important;
-    color: #6b5f99 !important;
-}
-
-.stTextInput input, .stNumberInput input {
-    background-color: #ffffff !important;
-    border: 1px solid #e8e5f0 !important;
-    border-radius: 10px !important;
-    font-family: 'DM Sans', sans-serif !important;
-    font-size: 15px !important;
-    color: #1e1b2e !important;
-    padding: 10px 14px !important;
-}
-.stTextInput input:focus, .stNumberInput input:focus {
-    border-color: #7c3aed !important;
-    box-shadow: 0 0 0 2px rgba(124,58,237,0.12) !important;
-}
-
-.stButton > button {
-    background-color: #7c3aed !important;
-    color: white !important;
-    border: none !important;
-    border-radius: 10px !important;
-    font-family: 'DM Sans', sans-serif !important;
-    font-size: 15px !important;
-    font-weight: 500 !important;
-    padding: 10px 28px !important;
-}
-.stButton > button:hover {
-    background-color: #6d28d9 !important;
-    box-shadow: 0 4px 12px rgba(124,58,237,0.25) !important;
-}
-
-.stDownloadButton > button {
-    background-color: #7c3aed !important;
-    color: white !important;
-    border: none !important;
-    border-radius: 10px !important;
-    font-size: 15px !important;
-    font-weight: 500 !important;
-}
-
-[data-testid="stMetricValue"] {
-    font-family: 'JetBrains Mono', monospace !important;
-    font-size: 26px !important;
-    font-weight: 600 !important;
-    color: #7c3aed !important;
-}
-[data-testid="stMetricLabel"] {
-    font-size: 14px !important;
-    color: #6b5f99 !important;
-    font-weight: 500 !important;
-}
-
-.stAlert { border-radius: 10px !important; font-size: 15px !important; }
-
-hr { border-color: #e8e5f0 !important; margin: 28px 0 !important; }
-
-.page-title {
-    font-family: 'DM Sans', sans-serif !important;
-    font-size: 32px !important;
-    font-weight: 700 !important;
-    color: #1e1b2e !important;
-    margin: 0 0 6px 0 !important;
-    line-height: 1.2 !important;
-}
-
-.page-subtitle {
-    font-size: 14px !important;
-    color: #9b8fc7 !important;
-    margin: 0 !important;
-}
-
-.section-hdr {
-    display: flex;
-    align-items: center;
-    gap: 14px;
-    margin: 36px 0 20px 0;
-}
-.section-icon {
-    width: 40px;
-    height: 40px;
-    border-radius: 10px;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    font-size: 20px;
-    flex-shrink: 0;
-}
-.section-title {
-    font-size: 20px !important;
-    font-weight: 600 !important;
-    color: #1e1b2e !important;
-    margin: 0 !important;
-}
-.section-sub {
-    font-size: 14px !important;
-    color: #9b8fc7 !important;
-    margin: 2px 0 0 0 !important;
-}
-
-.metric-card {
-    background: #ffffff;
-    border: 1px solid #e8e5f0;
-    border-radius: 12px;
-    padding: 22px;
-    text-align: center;
-}
-.metric-card .mc-value {
-    font-family: 'JetBrains Mono', monospace;
-    font-size: 24px;
-    font-weight: 600;
-    color: #7c3aed;
-    margin-bottom: 6px;
-}
-.metric-card .mc-label {
-    font-size: 14px;
-    color: #6b5f99;
-    font-weight: 500;
-}
-.metric-card.green .mc-value { color: #16a34a; }
-.metric-card.amber .mc-value { color: #d97706; }
-.metric-card.bold .mc-value { font-weight: 700; font-size: 26px; }
-.metric-card.bold .mc-label { font-weight: 600; color: #1e1b2e; }
-
-.highlight-box {
-    background: rgba(124,58,237,0.06);
-    border: 1px solid rgba(124,58,237,0.12);
-    border-radius: 12px;
-    padding: 22px 28px;
-    margin: 16px 0;
-}
-.highlight-box .hb-value {
-    font-family: 'JetBrains Mono', monospace;
-    font-size: 30px;
-    font-weight: 600;
-    color: #7c3aed;
-}
-.highlight-box .hb-label {
-    font-size: 15px;
-    color: #6b5f99;
-    margin-top: 6px;
-}
-
-.highlight-green {
-    background: rgba(22,163,74,0.06);
-    border: 1px solid rgba(22,163,74,0.12);
-    border-radius: 12px;
-    padding: 22px 28px;
-    margin: 16px 0;
-}
-.highlight-green .hb-value {
-    font-family: 'JetBrains Mono', monospace;
-    font-size: 30px;
-    font-weight: 600;
-    color: #16a34a;
-}
-.highlight-green .hb-label {
-    font-size: 15px;
-    color: #166534;
-    margin-top: 6px;
-}
-
-.intro-box {
-    background: #ffffff;
-    border: 1px solid #e8e5f0;
-    border-radius: 12px;
-    padding: 24px 28px;
-    margin: 16px 0 24px 0;
-    line-height: 1.7;
-}
-.intro-box p {
-    font-size: 15px !important;
-    color: #1e1b2e !important;
-    margin-bottom: 10px !important;
-}
-.intro-box ul {
-    margin: 8px 0 8px 20px;
-    padding: 0;
-}
-.intro-box ul li {
-    font-size: 15px !important;
-    color: #1e1b2e !important;
-    margin-bottom: 4px;
-}
-
-.row-widget.stHorizontalBlock { gap: 16px; }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def foglio_stile():
+    """CSS della pagina (dati/app.css), letto una volta per processo."""
+    with open(os.path.join(CARTELLA_DATI, "app.css"), encoding="utf-8") as f:
+        return f"<style>\n{f.read()}</style>"
+
+# Streamlit toglie gli elementi non riemessi a ogni rerun completo, quindi
+# il CSS va rimandato: con il form i rerun completi arrivano solo con "Calcola"
+st.markdown(foglio_stile(), unsafe_allow_html=True)
 
 
 # =========================================================
@@ -255,6 +48,9 @@ def section(icon, color, title, subtitle=""):
     </div>
     """, unsafe_allow_html=True)
 
+def nome_report(cliente):
+    return "Report_" + (re.sub(r"[^\w -]+", "_", cliente).strip(" _") or "cliente") + ".pdf"
+
 def metric_card(label, value, style=""):
     st.markdown(f"""
     <div class="metric-card {style}">
@@ -264,6 +60,42 @@ def metric_card(label, value, style=""):
     """, unsafe_allow_html=True)
 
 
+# =========================================================
+# CALCOLI IN CACHE (condivisi tra le sessioni)
+# =========================================================
+@st.cache_data(max_entries=512, show_spinner=False)
+def copertura_oraria(consumo, base_kwp, bonus_kwp, resa):
+    return parametri_autoconsumo(consumo, base_kwp, bonus_kwp, resa, zona=zona_da_resa(resa))
+
+@st.cache_data(max_entries=1024, show_spinner=False)
+def benefici(parametri):
+    return compute_benefits(**parametri)
+
+@st.cache_data(max_entries=256, show_spinner="Confronto delle configurazioni...")
+def configurazioni_ordinate(parametri, limite_tetto, criterio):
+    return ottimizza_moduli(
+        consumo_kwh=parametri["consumo_kwh"], resa_kwh_kwp=parametri["resa_kwh_kwp"],
+        prezzo_energia=parametri["prezzo_energia"], rid_eur_kwh=parametri["rid_eur_kwh"],
+        cer_eur_kwh=parametri["cer_eur_kwh"], quota_condivisa=parametri["quota_condivisa"],
+        autoc_base_perc=parametri["autoc_base_perc"],
+        incremento_prezzo_annuo=parametri["incremento_prezzo_annuo"],
+        limite_tetto_kwp=limite_tetto or None, criterio=criterio,
+    )
+
+@st.cache_data(max_entries=256, show_spinner="Simulazione Monte Carlo...")
+def incertezza(parametri, vol_prezzo, vol_rid, vol_cer):
+    return simula_monte_carlo(
+        parametri,
+        volatilita_prezzo=vol_prezzo, volatilita_rid=vol_rid, volatilita_cer=vol_cer,
+        tolleranza=0.002,
+    )
+
+# Un solo gestore per processo: il limite di report contemporanei e' globale
+@st.cache_resource
+def gestore_lavori():
+    return GestoreLavori()
+
+
 # =========================================================
 # HEADER
 # =========================================================
@@ -297,58 +129,75 @@ st.divider()
 # =========================================================
 # DATI CLIENTE E IMPIANTO
 # =========================================================
-section("👤", "#7c3aed", "Dati cliente e impianto", "Inserisci i dati del cliente e la configurazione dell'impianto")
+# Un form: i valori arrivano allo script tutti insieme con "Calcola", non a
+# ogni cifra digitata (ogni widget fuori dal form rilancerebbe la pagina)
+with st.form("dati_cliente", border=False):
+    section("👤", "#7c3aed", "Dati cliente e impianto", "Inserisci i dati del cliente e la configurazione dell'impianto")
 
-col1, col2, col3 = st.columns(3)
+    col1, col2, col3 = st.columns(3)
 
-with col1:
-    cliente = st.text_input("Nome cliente", value="Cliente Demo")
-    consumo = st.number_input("Consumo annuo (kWh)", min_value=500, max_value=50000, value=5400, step=1)
+    with col1:
+        cliente = st.text_input("Nome cliente", value="Cliente Demo")
+        consumo = st.number_input("Consumo annuo (kWh)", min_value=500, max_value=50000, value=5400, step=1)
 
-with col2:
-    base_kwp = st.number_input("Potenza impianto base (kWp)", value=6.56, step=0.01)
-    bonus_kwp = st.number_input("Potenza impianto upgrade (kWp)", value=9.02, step=0.01)
+    with col2:
+        base_kwp = st.number_input("Potenza impianto base (kWp)", value=6.56, step=0.01)
+        bonus_kwp = st.number_input("Potenza impianto upgrade (kWp)", value=9.02, step=0.01)
 
-with col3:
-    costo = st.number_input("Costo impianto (€)", value=13560.0, step=50.0)
-    autoc_base_perc = st.number_input("Autoconsumo base %", value=0.80, step=0.01)
+    with col3:
+        costo = st.number_input("Costo impianto (€)", value=13560.0, step=50.0)
+        autoc_base_perc = st.number_input("Autoconsumo base %", value=0.80, step=0.01)
 
-autoc_bonus_perc = quota_copertura_from_kwp(bonus_kwp)
-st.markdown(f'<p style="font-size:14px;color:#16a34a;margin-top:4px">Copertura calcolata automaticamente: <strong>{autoc_bonus_perc * 100:.1f}%</strong></p>', unsafe_allow_html=True)
+    simulazione = st.checkbox(
+        "Copertura da simulazione oraria (accumulo 16 kWh, inverter 6 kW)",
+        help="Simula 8760 ore di produzione, consumi e batteria invece di usare le percentuali fisse",
+    )
 
-st.divider()
+    st.divider()
 
-# =========================================================
-# PARAMETRI ECONOMICI
-# =========================================================
-section("⚙️", "#d97706", "Parametri economici", "Configura i parametri della simulazione")
+    # =========================================================
+    # PARAMETRI ECONOMICI
+    # =========================================================
+    section("⚙️", "#d97706", "Parametri economici", "Configura i parametri della simulazione")
+
+    col4, col5, col6 = st.columns(3)
 
-col4, col5, col6 = st.columns(3)
+    with col4:
+        prezzo_energia = st.number_input("Prezzo energia evitata €/kWh", value=0.30, step=0.01)
+        incremento = st.number_input("Incremento annuo costo energia (%)", min_value=0.0, max_value=15.0, value=3.0, step=0.5) / 100
 
-with col4:
-    prezzo_energia = st.number_input("Prezzo energia evitata €/kWh", value=0.30, step=0.01)
-    incremento = st.number_input("Incremento annuo costo energia (%)", min_value=0.0, max_value=15.0, value=3.0, step=0.5) / 100
+    with col5:
+        rid = st.number_input("RID €/kWh", value=0.137, step=0.001)
+        cer = st.number_input("CER €/kWh", value=0.06, step=0.005)
 
-with col5:
-    rid = st.number_input("RID €/kWh", value=0.137, step=0.001)
-    cer = st.number_input("CER €/kWh", value=0.06, step=0.005)
+    with col6:
+        quota = st.number_input("Quota energia condivisa (%)", value=50, step=5) / 100
+        resa = st.number_input("Resa zona (kWh/kWp)", value=1200, step=50)
 
-with col6:
-    quota = st.number_input("Quota energia condivisa (%)", value=50, step=5) / 100
-    resa = st.number_input("Resa zona (kWh/kWp)", value=1200, step=50)
+    st.form_submit_button("Calcola")
 
 st.divider()
 
 # =========================================================
 # CALCOLO
 # =========================================================
-res = compute_benefits(
+if simulazione:
+    quote = copertura_oraria(consumo, base_kwp, bonus_kwp, resa)
+    autoc_base_perc = quote["autoc_base_perc"]
+    autoc_bonus_perc = quote["autoc_bonus_perc"]
+    st.markdown(f'<p style="font-size:14px;color:#16a34a;margin-top:4px">Copertura da simulazione oraria: base <strong>{autoc_base_perc * 100:.1f}%</strong> &middot; upgrade <strong>{autoc_bonus_perc * 100:.1f}%</strong></p>', unsafe_allow_html=True)
+else:
+    autoc_bonus_perc = quota_copertura_from_kwp(bonus_kwp)
+    st.markdown(f'<p style="font-size:14px;color:#16a34a;margin-top:4px">Copertura calcolata automaticamente: <strong>{autoc_bonus_perc * 100:.1f}%</strong></p>', unsafe_allow_html=True)
+
+parametri = dict(
     consumo_kwh=consumo, base_kwp=base_kwp, bonus_kwp=bonus_kwp,
     prezzo_energia=prezzo_energia, rid_eur_kwh=rid, cer_eur_kwh=cer,
     quota_condivisa=quota, costo_impianto=costo, resa_kwh_kwp=resa,
     autoc_base_perc=autoc_base_perc, autoc_bonus_perc=autoc_bonus_perc,
     incremento_prezzo_annuo=incremento,
 )
+res = benefici(parametri)
 
 # =========================================================
 # RISULTATI — ENERGIA
@@ -438,22 +287,140 @@ with c16:
 
 st.divider()
 
+# =========================================================
+# MIGLIORE CONFIGURAZIONE
+# =========================================================
+section("🏆", "#16a34a", "Migliore configurazione", "Tutte le configurazioni da 410 Wp delle due fasce, ordinate")
+
+# Frammento: cambiare ordinamento o limite rilancia solo questa sezione
+@st.fragment
+def migliore_configurazione(parametri):
+    o1, o2 = st.columns(2)
+    with o1:
+        criteri = {"IRR 10 anni": "irr_10", "Rendita 10 anni": "beneficio_10_anni", "Payback": "payback_anni"}
+        criterio = st.selectbox("Ordina per", list(criteri))
+    with o2:
+        limite_tetto = st.number_input("Limite tetto (kWp, 0 = nessun limite)", min_value=0.0, value=0.0, step=0.41)
+
+    configurazioni = configurazioni_ordinate(parametri, limite_tetto, criteri[criterio])
+
+    if configurazioni.empty:
+        st.warning("Nessuna configurazione compatibile con il limite del tetto.")
+    else:
+        st.dataframe(
+            configurazioni[[
+                "fascia", "n_moduli", "bonus_kwp", "costo_impianto",
+                "irr_10", "beneficio_10_anni", "risparmio_complessivo_10", "payback_anni",
+            ]].rename(columns={
+                "fascia": "Fascia", "n_moduli": "Moduli", "bonus_kwp": "kWp",
+                "costo_impianto": "Prezzo €", "irr_10": "IRR 10a %",
+                "beneficio_10_anni": "Rendita 10a €", "risparmio_complessivo_10": "Risparmio 10a €",
+                "payback_anni": "Payback anni",
+            }).style.format({
+                "kWp": "{:.2f}", "Prezzo €": "{:,.0f}", "IRR 10a %": "{:.2f}",
+                "Rendita 10a €": "{:,.0f}", "Risparmio 10a €": "{:,.0f}", "Payback anni": "{:.1f}",
+            }),
+            hide_index=True, width="stretch",
+        )
+
+migliore_configurazione(parametri)
+
+st.divider()
+
+# =========================================================
+# INCERTEZZA (MONTE CARLO)
+# =========================================================
+@st.fragment
+def incertezza_monte_carlo(parametri):
+    with st.expander("Analisi di incertezza su prezzo energia e tariffe (Monte Carlo)"):
+        v1, v2, v3 = st.columns(3)
+        with v1: vol_prezzo = st.number_input("Volatilità prezzo energia (%/anno)", value=8.0, step=1.0) / 100
+        with v2: vol_rid = st.number_input("Volatilità RID (%/anno)", value=10.0, step=1.0) / 100
+        with v3: vol_cer = st.number_input("Volatilità CER (%/anno)", value=5.0, step=1.0) / 100
+
+        mc = incertezza(parametri, vol_prezzo, vol_rid, vol_cer)
+
+        def anni(valore):
+            # +inf: percorsi che non rientrano entro l'orizzonte del piano
+            return f"oltre {CFG.ANNI_PIANO} anni" if valore == float("inf") else f"{valore:.1f} anni"
+
+        for titolo, chiave, formato in [
+            ("Rendita 10 anni", "beneficio_10_anni", "€ {:,.0f}".format),
+            ("Rendita 20 anni", "beneficio_20_anni", "€ {:,.0f}".format),
+            ("Payback", "payback_anni", anni),
+            ("IRR 10 anni", "irr_10", "{:.1f}%".format),
+        ]:
+            q1, q2, q3 = st.columns(3)
+            with q1: metric_card(f"{titolo} — P10", formato(mc[chiave]["p10"]))
+            with q2: metric_card(f"{titolo} — P50", formato(mc[chiave]["p50"]), "bold")
+            with q3: metric_card(f"{titolo} — P90", formato(mc[chiave]["p90"]))
+            st.markdown("")
+
+        nota = f"{mc['n_percorsi']:,} percorsi simulati (seed fisso)."
+        if mc["irr_al_limite"]:
+            nota += (f" In {mc['irr_al_limite']:,} percorsi l'IRR e' fuori da -99% / +1000%"
+                     " ed e' contato al limite.")
+        st.caption(nota)
+
+incertezza_monte_carlo(parametri)
+
+st.divider()
+
 # =========================================================
 # PDF
 # =========================================================
 section("📄", "#6b5f99", "Report PDF", "Genera il report completo per il cliente")
 
-if st.button("Genera Report PDF"):
-    pdf_path = build_pdf(
-        cliente, res, costo, consumo, base_kwp, bonus_kwp,
-        resa, prezzo_energia, rid, cer, quota,
-        autoc_base_perc, autoc_bonus_perc, incremento,
-    )
-    with open(pdf_path, "rb") as f:
-        st.download_button(
-            label="Scarica Report PDF",
-            data=f,
-            file_name=pdf_path,
-            mime="application/pdf"
+if "sessione" not in st.session_state:
+    st.session_state.sessione = uuid.uuid4().hex
+
+gestore = gestore_lavori()
+lavoro = gestore.lavoro(st.session_state.get("lavoro_pdf"))
+in_preparazione = lavoro is not None and not lavoro.concluso
+
+# Frammento: il bottone rilancia solo questa sezione, non i calcoli sopra.
+# Mentre il report e' in preparazione il frammento si rilancia da solo per
+# aggiornare la barra; a lavoro concluso un rerun completo ferma il polling.
+@st.fragment(run_every=0.5 if in_preparazione else None)
+def report_pdf(cliente, parametri, res):
+    lavoro = gestore.lavoro(st.session_state.get("lavoro_pdf"))
+
+    if st.button("Genera Report PDF", disabled=lavoro is not None and not lavoro.concluso):
+        p = parametri
+        lavoro = gestore.invia(
+            st.session_state.sessione, nome_report(cliente),
+            cliente, res, p["costo_impianto"], p["consumo_kwh"], p["base_kwp"], p["bonus_kwp"],
+            p["resa_kwh_kwp"], p["prezzo_energia"], p["rid_eur_kwh"], p["cer_eur_kwh"],
+            p["quota_condivisa"], p["autoc_base_perc"], p["autoc_bonus_perc"],
+            p["incremento_prezzo_annuo"],
         )
-    st.success("PDF generato correttamente.")
+        if lavoro is None:
+            st.warning("Troppi report in preparazione in questo momento: riprova tra qualche secondo.")
+            return
+        st.session_state.lavoro_pdf = lavoro.id
+        st.rerun()
+
+    if lavoro is None:
+        return
+    if not lavoro.concluso:
+        st.progress(lavoro.avanzamento, text=f"Report in preparazione: {lavoro.fase}...")
+        return
+    if in_preparazione:
+        st.rerun()
+
+    if lavoro.errore:
+        st.error(f"Generazione del report non riuscita: {lavoro.errore}")
+        return
+
+    # data come funzione: i byte passano a Streamlit solo al clic, non a ogni
+    # rerun del frammento; il PDF resta nel gestore fino alla scadenza
+    st.download_button(
+        label="Scarica Report PDF",
+        data=lavoro.leggi,
+        file_name=lavoro.nome_file,
+        mime="application/pdf",
+        on_click="ignore",
+    )
+    st.success(f"PDF generato correttamente in {lavoro.durata:.1f} s.")
+
+report_pdf(cliente, parametri, res)
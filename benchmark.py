@@ -0,0 +1,429 @@
+# benchmark.py
+
+"""
+Benchmark di calcolo, grafici e report PDF, con confronto su una baseline.
+
+Ogni caso cronometra una funzione su input fissi (il cliente demo): stessa
+macchina, stessi numeri. Per caso: una chiamata di riscaldamento, poi
+--ripetizioni misure, ciascuna di tanti cicli quanti ne servono per
+durare almeno --tempo-min secondi; il tempo per chiamata e' la mediana.
+
+Casi:
+  calcolo.*   compute_benefits (senza cache risultati), calcola_irr,
+              apply_clipping;
+  grafici.*   schede reportlab (chart_fascia, make_irr_image) disegnate su
+              un canvas e grafici matplotlib (make_confronto_html,
+              make_benefici_cumulato, make_payback_elegant) senza cache;
+  report.*    build_pdf in un processo caldo (moduli importati, cache
+              grafici piena) e in un processo freddo (interprete nuovo e
+              cache grafici vuota: import, calcolo e report).
+
+La cache grafici usa una cartella temporanea dedicata: le misure non
+toccano la cache condivisa. Per il confronto PNG/SVG vedi
+benchmark_report.py.
+
+Con --json i risultati vanno in un file (per esempio la baseline); con
+--confronta si confrontano le mediane con una baseline salvata e si esce
+con 1 se un caso e' piu' lento oltre --soglia.
+
+Uso:
+    python benchmark.py [--casi calcolo grafici ...] [--ripetizioni N] [--json risultati.json]
+    python benchmark.py --confronta baseline.json [--soglia 0.10]
+"""
+
+import argparse
+import dataclasses
+import datetime
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+
+CARTELLA = os.path.dirname(os.path.abspath(__file__))
+
+# Versione del formato JSON dei risultati
+VERSIONE = 1
+
+SOGLIA = 0.10
+
+# Cliente demo, argomenti di compute_benefits
+INPUT_DEMO = {
+    "consumo_kwh": 5400,
+    "base_kwp": 6.56,
+    "bonus_kwp": 9.02,
+    "prezzo_energia": 0.30,
+    "rid_eur_kwh": 0.137,
+    "cer_eur_kwh": 0.06,
+    "quota_condivisa": 0.5,
+    "costo_impianto": 13560,
+    "resa_kwh_kwp": 1200,
+    "autoc_base_perc": 0.80,
+    "autoc_bonus_perc": None,
+    "incremento_prezzo_annuo": 0.03,
+}
+
+_BUILD_FREDDO = """
+import json, sys, time
+t = time.perf_counter()
+import benchmark
+from pdf_report import build_pdf
+t_import = time.perf_counter()
+build_pdf(*benchmark.args_report(), processi_grafici=int(sys.argv[1]),
+          formato_grafici=sys.argv[2] or None)
+t_fine = time.perf_counter()
+print(json.dumps({"import": t_import - t, "totale": t_fine - t}))
+"""
+
+
+def args_report(cliente="Demo"):
+    """Argomenti posizionali di build_pdf per il cliente demo."""
+    from calculator import compute_benefits, quota_copertura_from_kwp
+
+    d = INPUT_DEMO
+    res = compute_benefits(**d)
+    return (
+        cliente, res, d["costo_impianto"], d["consumo_kwh"], d["base_kwp"], d["bonus_kwp"],
+        d["resa_kwh_kwp"], d["prezzo_energia"], d["rid_eur_kwh"], d["cer_eur_kwh"],
+        d["quota_condivisa"], d["autoc_base_perc"], quota_copertura_from_kwp(d["bonus_kwp"]),
+        d["incremento_prezzo_annuo"],
+    )
+
+
+# ---------------------------------------------------------
+# CASI
+# ---------------------------------------------------------
+
+@dataclasses.dataclass
+class Caso:
+    """
+    prepara(opzioni) -> funzione senza argomenti da cronometrare.
+    Con freddo=True la funzione fa da se' la misura di una ripetizione
+    (ritorna i secondi e un dict di dettagli) e non c'e' riscaldamento.
+    """
+    nome: str
+    prepara: object
+    freddo: bool = False
+
+
+def _compute_benefits(opzioni):
+    from calculator import compute_benefits
+
+    return lambda: compute_benefits(**INPUT_DEMO, usa_cache=False)
+
+
+def _calcola_irr(opzioni):
+    from calculator import calcola_irr, compute_benefits
+
+    flussi = compute_benefits(**INPUT_DEMO)["piano_flussi"].flussi_irr(10)
+    return lambda: calcola_irr(flussi)
+
+
+def _apply_clipping(opzioni):
+    from calculator import apply_clipping
+
+    d = INPUT_DEMO
+    return lambda: apply_clipping(d["bonus_kwp"], d["resa_kwh_kwp"], d["consumo_kwh"])
+
+
+def _su_canvas(crea):
+    """Crea la scheda (Flowable) e la disegna su un canvas in memoria."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen.canvas import Canvas
+
+    def disegna():
+        scheda = crea()
+        canvas = Canvas(io.BytesIO(), pagesize=A4)
+        scheda.wrap(*A4)
+        scheda.drawOn(canvas, 0, 0)
+
+    return disegna
+
+
+def _chart_fascia(opzioni):
+    from config import CFG
+    from pdf_report import BW, _args_fascia, chart_fascia
+
+    (fascia, base, massimo, prezzo), _ = CFG.FASCE
+    args = _args_fascia(fascia, base, massimo, prezzo, base, INPUT_DEMO["bonus_kwp"])
+    return _su_canvas(lambda: chart_fascia(*args, larghezza=BW, altezza_max=BW * 7.2 / 7.4))
+
+
+def _make_irr_image(opzioni):
+    from pdf_report import BW, make_irr_image
+
+    d = INPUT_DEMO
+    res = args_report()[1]
+    return _su_canvas(lambda: make_irr_image(
+        d["costo_impianto"], res["piano_flussi"], res["irr_10"], d["incremento_prezzo_annuo"],
+        larghezza=BW,
+    ))
+
+
+def _grafico(nome, argomenti):
+    """Grafico matplotlib senza cache (`.senza_cache` di @in_cache)."""
+    def prepara(opzioni):
+        import pdf_report
+
+        funzione = getattr(pdf_report, nome).senza_cache
+        args = argomenti(args_report()) + (pdf_report._formato_grafici(opzioni.formato),)
+        return lambda: funzione(*args)
+
+    return prepara
+
+
+def _build_pdf_caldo(opzioni):
+    from pdf_report import build_pdf
+
+    args = args_report()
+    # il riscaldamento riempie la cache grafici: si misura il report a cache piena
+    return lambda: build_pdf(*args, processi_grafici=opzioni.processi_grafici,
+                             formato_grafici=opzioni.formato)
+
+
+def _build_pdf_freddo(opzioni):
+    def misura():
+        with tempfile.TemporaryDirectory() as cache:
+            ambiente = dict(os.environ, NEXT_CACHE_GRAFICI=cache, PYTHONPATH=CARTELLA)
+            uscita = subprocess.run(
+                [sys.executable, "-c", _BUILD_FREDDO, str(opzioni.processi_grafici),
+                 opzioni.formato or ""],
+                cwd=CARTELLA, env=ambiente, capture_output=True, text=True, check=True,
+            ).stdout
+        tempi = json.loads(uscita.strip().splitlines()[-1])
+        return tempi["totale"], {"import_ms": tempi["import"] * 1000}
+
+    return misura
+
+
+CASI = [
+    Caso("calcolo.compute_benefits", _compute_benefits),
+    Caso("calcolo.calcola_irr", _calcola_irr),
+    Caso("calcolo.apply_clipping", _apply_clipping),
+    Caso("grafici.chart_fascia", _chart_fascia),
+    Caso("grafici.make_irr_image", _make_irr_image),
+    Caso("grafici.make_confronto_html", _grafico(
+        "make_confronto_html", lambda a: (round(a[1]["irr_10"], 2),))),
+    Caso("grafici.make_benefici_cumulato", _grafico(
+        "make_benefici_cumulato", lambda a: (a[1]["piano_flussi"],))),
+    Caso("grafici.make_payback_elegant", _grafico(
+        "make_payback_elegant", lambda a: (a[2], a[1]["piano_flussi"]))),
+    Caso("report.build_pdf_caldo", _build_pdf_caldo),
+    Caso("report.build_pdf_freddo", _build_pdf_freddo, freddo=True),
+]
+
+
+# ---------------------------------------------------------
+# MISURA
+# ---------------------------------------------------------
+
+def _cicli(funzione, tempo_min):
+    """Cicli per ripetizione: abbastanza da durare almeno tempo_min."""
+    cicli = 1
+    while True:
+        t = time.perf_counter()
+        for _ in range(cicli):
+            funzione()
+        durata = time.perf_counter() - t
+        if durata >= tempo_min or cicli >= 1_000_000:
+            return cicli
+        cicli = max(cicli * 2, int(cicli * tempo_min / max(durata, 1e-9) * 1.2))
+
+
+def misura(caso, opzioni):
+    """Risultato di un caso: tempi per chiamata in ms e statistiche."""
+    funzione = caso.prepara(opzioni)
+    dettagli = {}
+
+    if caso.freddo:
+        cicli, tempi = 1, []
+        for _ in range(opzioni.ripetizioni):
+            secondi, extra = funzione()
+            tempi.append(secondi)
+            for k, v in extra.items():
+                dettagli.setdefault(k, []).append(v)
+        dettagli = {k: statistics.median(v) for k, v in dettagli.items()}
+    else:
+        funzione()   # riscaldamento: import, cache, lru_cache
+        cicli = _cicli(funzione, opzioni.tempo_min)
+        tempi = []
+        for _ in range(opzioni.ripetizioni):
+            gc.collect()
+            t = time.perf_counter()
+            for _ in range(cicli):
+                funzione()
+            tempi.append((time.perf_counter() - t) / cicli)
+
+    ms = [t * 1000 for t in tempi]
+    return {
+        "mediana_ms": statistics.median(ms),
+        "min_ms": min(ms),
+        "max_ms": max(ms),
+        "dev_ms": statistics.stdev(ms) if len(ms) > 1 else 0.0,
+        "ripetizioni": len(ms),
+        "cicli": cicli,
+        "tempi_ms": ms,
+        **dettagli,
+    }
+
+
+def _versione(modulo):
+    try:
+        from importlib.metadata import version
+        return version(modulo)
+    except Exception:
+        return None
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=CARTELLA,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def ambiente():
+    """Dove e con cosa sono state prese le misure (per leggere un confronto)."""
+    return {
+        "python": platform.python_version(),
+        "piattaforma": platform.platform(),
+        "processore": platform.machine(),
+        "core": os.cpu_count(),
+        "numpy": _versione("numpy"),
+        "matplotlib": _versione("matplotlib"),
+        "reportlab": _versione("reportlab"),
+        "commit": _commit(),
+    }
+
+
+def seleziona(filtri):
+    """Casi il cui nome contiene almeno uno dei filtri (tutti se nessuno)."""
+    casi = [c for c in CASI if not filtri or any(f in c.nome for f in filtri)]
+    if not casi:
+        raise ValueError(f"nessun caso per {', '.join(filtri)}; casi: "
+                         + ", ".join(c.nome for c in CASI))
+    return casi
+
+
+def esegui(opzioni):
+    casi = seleziona(opzioni.casi)
+    risultati = {}
+    print(f"{'caso':<34}{'mediana ms':>12}{'min ms':>10}{'dev ms':>10}{'cicli':>8}")
+    for caso in casi:
+        r = risultati[caso.nome] = misura(caso, opzioni)
+        print(f"{caso.nome:<34}{r['mediana_ms']:>12.3f}{r['min_ms']:>10.3f}"
+              f"{r['dev_ms']:>10.3f}{r['cicli']:>8}")
+
+    return {
+        "versione": VERSIONE,
+        "data": datetime.datetime.now().isoformat(timespec="seconds"),
+        "ambiente": ambiente(),
+        "parametri": {
+            "ripetizioni": opzioni.ripetizioni,
+            "tempo_min": opzioni.tempo_min,
+            "processi_grafici": opzioni.processi_grafici,
+            "formato": opzioni.formato,
+        },
+        "casi": risultati,
+    }
+
+
+# ---------------------------------------------------------
+# CONFRONTO
+# ---------------------------------------------------------
+
+def confronta(base, nuovo, soglia=SOGLIA):
+    """
+    Confronto delle mediane caso per caso. Ritorna {caso: variazione}
+    (rapporto nuovo/base - 1) dei soli casi piu' lenti oltre la soglia;
+    i casi presenti in una sola delle due misure vengono segnalati e ignorati.
+    """
+    regressioni = {}
+    print(f"{'caso':<34}{'base ms':>12}{'nuovo ms':>12}{'variazione':>12}")
+    for nome in sorted(base["casi"].keys() | nuovo["casi"].keys()):
+        if nome not in base["casi"] or nome not in nuovo["casi"]:
+            dove = "baseline" if nome not in nuovo["casi"] else "nuova misura"
+            print(f"{nome:<34}{'solo in ' + dove:>36}")
+            continue
+
+        b = base["casi"][nome]["mediana_ms"]
+        n = nuovo["casi"][nome]["mediana_ms"]
+        variazione = n / b - 1
+        esito = ""
+        if variazione > soglia:
+            regressioni[nome] = variazione
+            esito = "  REGRESSIONE"
+        elif variazione < -soglia:
+            esito = "  miglioramento"
+        print(f"{nome:<34}{b:>12.3f}{n:>12.3f}{variazione:>+12.1%}{esito}")
+
+    diversi = [k for k in ("python", "piattaforma", "numpy", "matplotlib", "reportlab")
+               if base.get("ambiente", {}).get(k) != nuovo.get("ambiente", {}).get(k)]
+    if diversi:
+        print(f"attenzione: ambiente diverso dalla baseline ({', '.join(diversi)})")
+
+    return regressioni
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--casi", nargs="+", default=[],
+                        help="solo i casi il cui nome contiene uno di questi testi")
+    parser.add_argument("--ripetizioni", type=int, default=5)
+    parser.add_argument("--tempo-min", type=float, default=0.2,
+                        help="durata minima di una ripetizione, in secondi")
+    parser.add_argument("--processi-grafici", type=int, default=0,
+                        help="processi per i grafici di build_pdf "
+                             "(default 0: in serie, non dipende dai core liberi)")
+    parser.add_argument("--formato", choices=("png", "svg"), default=None,
+                        help="formato dei grafici (default CFG.FORMATO_GRAFICI)")
+    parser.add_argument("--json", help="scrive i risultati in questo file")
+    parser.add_argument("--confronta", help="baseline JSON da confrontare con questa misura")
+    parser.add_argument("--soglia", type=float, default=SOGLIA,
+                        help="rallentamento oltre il quale un caso e' una regressione "
+                             "(0.10 = +10%%)")
+    opzioni = parser.parse_args()
+
+    base = None
+    if opzioni.confronta:
+        with open(opzioni.confronta, encoding="utf-8") as f:
+            base = json.load(f)
+        if base.get("versione") != VERSIONE:
+            parser.error(f"{opzioni.confronta}: formato {base.get('versione')}, atteso {VERSIONE}")
+
+    # etichette con caratteri fuori dal font: stesso avviso a ogni grafico
+    warnings.filterwarnings("ignore", message="Glyph .* missing from font")
+
+    with tempfile.TemporaryDirectory() as cartella:
+        # prima di importare cache_grafici, che legge la cartella all'import
+        os.environ["NEXT_CACHE_GRAFICI"] = cartella
+        try:
+            risultati = esegui(opzioni)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if opzioni.json:
+        with open(opzioni.json, "w", encoding="utf-8") as f:
+            json.dump(risultati, f, indent=2)
+            f.write("\n")
+
+    if base is not None:
+        print()
+        regressioni = confronta(base, risultati, opzioni.soglia)
+        if regressioni:
+            print(f"{len(regressioni)} regressioni oltre {opzioni.soglia:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
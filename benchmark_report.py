@@ -0,0 +1,73 @@
+# benchmark_report.py
+
+"""
+Confronto tra grafici raster (PNG) e vettoriali (SVG) nel report PDF:
+dimensione del PDF e tempo di build_pdf a cache fredda e calda.
+
+La cache grafici usa una cartella temporanea dedicata, cosi' la misura
+a freddo non tocca (ne' svuota) la cache condivisa.
+
+Uso:
+    python benchmark_report.py [--ripetizioni N]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+
+def _cliente_demo():
+    from calculator import compute_benefits, quota_copertura_from_kwp
+
+    res = compute_benefits(5400, 6.56, 9.02, 0.30, 0.137, 0.06, 0.5, 13560, 1200, 0.80, None, 0.03)
+    return (
+        "Demo", res, 13560, 5400, 6.56, 9.02, 1200, 0.30, 0.137, 0.06, 0.5,
+        0.80, quota_copertura_from_kwp(9.02), 0.03,
+    )
+
+
+def misura(formato, ripetizioni=3):
+    import pdf_report
+    from cache_grafici import CACHE_GRAFICI
+
+    args = _cliente_demo()
+
+    freddi = []
+    for _ in range(ripetizioni):
+        CACHE_GRAFICI.svuota(disco=True)
+        t = time.perf_counter()
+        pdf = pdf_report.build_pdf(*args, processi_grafici=0, formato_grafici=formato)
+        freddi.append(time.perf_counter() - t)
+
+    caldi = []
+    for _ in range(ripetizioni):
+        t = time.perf_counter()
+        pdf_report.build_pdf(*args, processi_grafici=0, formato_grafici=formato)
+        caldi.append(time.perf_counter() - t)
+
+    return {
+        "formato": formato,
+        "byte_pdf": len(pdf),
+        "ms_freddo": statistics.median(freddi) * 1000,
+        "ms_caldo": statistics.median(caldi) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ripetizioni", type=int, default=3)
+    opzioni = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cartella:
+        os.environ["NEXT_CACHE_GRAFICI"] = cartella
+
+        print(f"{'formato':<8}{'byte PDF':>12}{'ms freddo':>12}{'ms caldo':>12}")
+        for formato in ("png", "svg"):
+            r = misura(formato, opzioni.ripetizioni)
+            print(f"{r['formato']:<8}{r['byte_pdf']:>12,}{r['ms_freddo']:>12.0f}{r['ms_caldo']:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
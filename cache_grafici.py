@@ -0,0 +1,256 @@
+# cache_grafici.py
+
+"""
+Cache dei grafici renderizzati, indirizzata per contenuto.
+
+La chiave e' lo SHA-256 del nome del grafico, della versione di stile e
+degli argomenti effettivi della funzione che lo disegna: stessi input,
+stesso file. Due livelli:
+  - memoria: LRU per processo, limitata in byte;
+  - disco:   una cartella condivisa da tutte le sessioni e i processi,
+             limitata in byte, sfratto dei file usati meno di recente
+             (mtime aggiornato a ogni hit).
+
+Le scritture passano da un file temporaneo nella stessa cartella e
+os.replace, quindi un lettore vede il file completo o non lo vede.
+"""
+
+import dataclasses
+import functools
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from config import CFG
+
+
+CARTELLA_DEFAULT = os.environ.get(
+    "NEXT_CACHE_GRAFICI", os.path.join(tempfile.gettempdir(), "next_cache_grafici")
+)
+
+# PNG o SVG: il contenuto non dipende dall'estensione
+ESTENSIONE = ".img"
+
+
+def _impronta(h, valore):
+    """Aggiorna l'hash con una rappresentazione stabile di `valore`."""
+    if isinstance(valore, np.ndarray):
+        h.update(f"nd{valore.dtype.str}{valore.shape}".encode())
+        h.update(np.ascontiguousarray(valore).tobytes())
+    elif dataclasses.is_dataclass(valore) and not isinstance(valore, type):
+        h.update(type(valore).__name__.encode())
+        for campo in dataclasses.fields(valore):
+            h.update(campo.name.encode())
+            _impronta(h, getattr(valore, campo.name))
+    elif isinstance(valore, (list, tuple)):
+        h.update(f"{type(valore).__name__}{len(valore)}(".encode())
+        for v in valore:
+            _impronta(h, v)
+        h.update(b")")
+    elif isinstance(valore, dict):
+        h.update(f"dict{len(valore)}(".encode())
+        for k in sorted(valore, key=repr):
+            _impronta(h, k)
+            _impronta(h, valore[k])
+        h.update(b")")
+    elif isinstance(valore, (np.floating, np.integer, np.bool_)):
+        _impronta(h, valore.item())
+    elif valore is None or isinstance(valore, (bool, int, float, str, bytes)):
+        h.update(f"{type(valore).__name__}:{valore!r};".encode())
+    else:
+        raise TypeError(f"argomento non supportato dalla cache grafici: {type(valore).__name__}")
+
+
+def chiave_grafico(nome, versione, args=(), kwargs=None):
+    h = hashlib.sha256()
+    _impronta(h, (nome, versione, tuple(args), dict(kwargs or {})))
+    return h.hexdigest()
+
+
+class CacheGrafici:
+    """
+    Cache a due livelli (memoria + disco) di immagini, in byte.
+    """
+
+    def __init__(self, cartella=CARTELLA_DEFAULT, max_byte_disco=64 << 20,
+                 max_byte_memoria=16 << 20, grazia_s=300):
+        self.cartella = cartella
+        self.max_byte_disco = max_byte_disco
+        self.max_byte_memoria = max_byte_memoria
+        # i file toccati da meno di grazia_s secondi non vengono sfrattati:
+        # un'altra sessione potrebbe stare ancora impaginando il suo report
+        self.grazia_s = grazia_s
+
+        self._memoria = OrderedDict()
+        self._byte_memoria = 0
+        self._lock = threading.Lock()
+        self.hit_memoria = 0
+        self.hit_disco = 0
+        self.miss = 0
+
+    def percorso(self, chiave):
+        return os.path.join(self.cartella, chiave + ESTENSIONE)
+
+    def cerca(self, chiave):
+        """Byte dell'immagine per `chiave` (memoria, poi disco) o None."""
+        with self._lock:
+            dati = self._memoria.get(chiave)
+            if dati is not None:
+                self._memoria.move_to_end(chiave)
+                self.hit_memoria += 1
+                return dati
+
+        dati = self._leggi_disco(chiave)
+        if dati is not None:
+            with self._lock:
+                self.hit_disco += 1
+            self._in_memoria(chiave, dati)
+
+        return dati
+
+    def salva(self, chiave, dati):
+        """Registra un'immagine prodotta altrove (per esempio da un worker)."""
+        with self._lock:
+            self.miss += 1
+        self._scrivi_disco(chiave, dati)
+        self._in_memoria(chiave, dati)
+
+    def ottieni(self, chiave, genera):
+        """
+        Byte dell'immagine per `chiave`; se assente la produce con
+        genera() -> bytes e la salva su entrambi i livelli.
+        """
+        dati = self.cerca(chiave)
+        if dati is None:
+            # rendering fuori dal lock: le altre sessioni non restano bloccate
+            dati = genera()
+            self.salva(chiave, dati)
+
+        return dati
+
+    def svuota(self, disco=False):
+        with self._lock:
+            self._memoria.clear()
+            self._byte_memoria = 0
+            self.hit_memoria = self.hit_disco = self.miss = 0
+        if disco:
+            for voce in self._voci_disco():
+                _rimuovi(voce.path)
+
+    def statistiche(self):
+        with self._lock:
+            return {
+                "hit_memoria": self.hit_memoria,
+                "hit_disco": self.hit_disco,
+                "miss": self.miss,
+                "voci_memoria": len(self._memoria),
+                "byte_memoria": self._byte_memoria,
+            }
+
+    # -- memoria ---------------------------------------------------------
+
+    def _in_memoria(self, chiave, dati):
+        with self._lock:
+            if chiave in self._memoria:
+                self._memoria.move_to_end(chiave)
+                return
+            self._memoria[chiave] = dati
+            self._byte_memoria += len(dati)
+            while self._byte_memoria > self.max_byte_memoria and self._memoria:
+                _, vecchio = self._memoria.popitem(last=False)
+                self._byte_memoria -= len(vecchio)
+
+    # -- disco -----------------------------------------------------------
+
+    def _leggi_disco(self, chiave):
+        p = self.percorso(chiave)
+        try:
+            with open(p, "rb") as f:
+                dati = f.read()
+            os.utime(p)   # LRU: l'mtime segna l'ultimo uso
+        except OSError:
+            return None
+        return dati
+
+    def _scrivi_disco(self, chiave, dati):
+        try:
+            os.makedirs(self.cartella, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cartella, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(dati)
+                os.replace(tmp, self.percorso(chiave))
+            except BaseException:
+                # lo sfratto vede solo le voci finite: il .tmp va tolto qui
+                _rimuovi(tmp)
+                raise
+        except OSError:
+            # disco pieno o cartella non scrivibile: resta la cache in memoria
+            return
+        self._riduci_disco()
+
+    def _voci_disco(self):
+        try:
+            with os.scandir(self.cartella) as it:
+                return [v for v in it if v.name.endswith(ESTENSIONE)]
+        except OSError:
+            return []
+
+    def _riduci_disco(self):
+        voci = []
+        for v in self._voci_disco():
+            try:
+                st = v.stat()
+            except OSError:
+                continue
+            voci.append((st.st_mtime, st.st_size, v.path))
+
+        totale = sum(dim for _, dim, _ in voci)
+        limite_grazia = time.time() - self.grazia_s
+
+        for mtime, dim, p in sorted(voci):
+            if totale <= self.max_byte_disco or mtime > limite_grazia:
+                break
+            _rimuovi(p)
+            totale -= dim
+
+
+def _rimuovi(p):
+    try:
+        os.remove(p)
+    except OSError:
+        pass
+
+
+CACHE_GRAFICI = CacheGrafici(
+    max_byte_disco=CFG.CACHE_GRAFICI_DISCO_MB << 20,
+    max_byte_memoria=CFG.CACHE_GRAFICI_MEMORIA_MB << 20,
+)
+
+
+def in_cache(nome, versione, cache=None):
+    """
+    Decoratore per le funzioni che disegnano un grafico e ne ritornano i
+    byte: la funzione decorata ritorna i byte in cache e ridisegna solo per
+    argomenti mai visti. L'originale resta in
+    `.senza_cache`; `.chiave(*args)` da' la chiave senza disegnare.
+    """
+    def decora(funzione):
+        @functools.wraps(funzione)
+        def grafico(*args, **kwargs):
+            c = CACHE_GRAFICI if cache is None else cache
+            chiave = chiave_grafico(nome, versione, args, kwargs)
+
+            return c.ottieni(chiave, lambda: funzione(*args, **kwargs))
+
+        grafico.senza_cache = funzione
+        grafico.chiave = lambda *args, **kwargs: chiave_grafico(nome, versione, args, kwargs)
+        grafico.cache = lambda: CACHE_GRAFICI if cache is None else cache
+        return grafico
+
+    return decora
@@ -1,5 +1,16 @@
 # calculator.py
 
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+from config import CFG
+from finanza import irr
+
 # ---------------------------------------------------------
 # QUOTA COPERTURA CONSUMI (ex autoconsumo bonus)
 # ---------------------------------------------------------
@@ -43,31 +54,52 @@ def quota_copertura_from_kwp(kwp_bonus: float) -> float:
 # CLIPPING INVERTER 6 kW
 # ---------------------------------------------------------
 
-def apply_clipping(bonus_kwp, resa_kwh_kwp, consumo_kwh):
+# Superficie kWp x resa x consumo generata da genera_superficie_clipping.py
+_PERCORSO_SUPERFICIE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "dati", "superficie_clipping.npz"
+)
 
-    produzione_teorica = bonus_kwp * resa_kwh_kwp
-    riduzione = 0.0
 
-    if consumo_kwh <= 9000:
+def _carica_superficie(percorso=_PERCORSO_SUPERFICIE):
+    with np.load(percorso) as dati:
+        return (dati["kwp"], dati["resa"], dati["consumo"]), dati["clipping"]
 
-        kwp = round(bonus_kwp, 2)
 
-        # Identificazione zona tramite resa
-        if resa_kwh_kwp <= 1250:
-            zona = "nord"
-        elif resa_kwh_kwp <= 1400:
-            zona = "centro"
-        else:
-            zona = "sud"
+_ASSI_CLIPPING, _SUPERFICIE_CLIPPING = _carica_superficie()
 
-        clipping_table = {
-            8.2:  {"nord": 0.015, "centro": 0.019, "sud": 0.023},
-            9.02: {"nord": 0.029, "centro": 0.034, "sud": 0.041},
-            9.84: {"nord": 0.045, "centro": 0.052, "sud": 0.059},
-        }
 
-        if kwp in clipping_table:
-            riduzione = clipping_table[kwp][zona]
+def _pesi_asse(asse, x):
+    """Indice del nodo a sinistra e peso lineare, con x limitato all'asse."""
+    x = np.clip(x, asse[0], asse[-1])
+    i = np.clip(np.searchsorted(asse, x, side="right") - 1, 0, len(asse) - 2)
+
+    return i, (x - asse[i]) / (asse[i + 1] - asse[i])
+
+
+def interpola_clipping(bonus_kwp, resa_kwh_kwp, consumo_kwh):
+    """
+    Quota di clipping dalla superficie: bilineare su kWp x resa per ogni
+    fetta di consumo, lineare tra le fette. Accetta scalari o array.
+    """
+    (ik, wk), (ir, wr), (ic, wc) = (
+        _pesi_asse(asse, np.asarray(x, dtype=float))
+        for asse, x in zip(_ASSI_CLIPPING, (bonus_kwp, resa_kwh_kwp, consumo_kwh))
+    )
+    s = _SUPERFICIE_CLIPPING
+
+    riduzione = 0.0
+    for dk, pk in ((0, 1 - wk), (1, wk)):
+        for dr, pr in ((0, 1 - wr), (1, wr)):
+            for dc, pc in ((0, 1 - wc), (1, wc)):
+                riduzione = riduzione + pk * pr * pc * s[ik + dk, ir + dr, ic + dc]
+
+    return riduzione
+
+
+def apply_clipping(bonus_kwp, resa_kwh_kwp, consumo_kwh):
+
+    produzione_teorica = bonus_kwp * resa_kwh_kwp
+    riduzione = float(interpola_clipping(bonus_kwp, resa_kwh_kwp, consumo_kwh))
 
     produzione_effettiva = produzione_teorica * (1 - riduzione)
 
@@ -78,7 +110,30 @@ def apply_clipping(bonus_kwp, resa_kwh_kwp, consumo_kwh):
 # MOTORE PRINCIPALE
 # ---------------------------------------------------------
 
-def calcola_orizzonte(
+def _serie_geometrica(anni, incremento):
+    """
+    Somma di (1 + incremento)^k per k = 0 .. anni-1.
+
+    ((1+i)^n - 1) / i scritto con expm1/log1p per restare preciso
+    anche con incrementi piccolissimi; per i = 0 vale n.
+    """
+    incremento = np.asarray(incremento, dtype=float)
+    nullo = incremento == 0
+    i = np.where(nullo, 1.0, incremento)
+
+    somma = np.where(nullo, float(anni), np.expm1(anni * np.log1p(i)) / i)
+
+    return float(somma) if somma.ndim == 0 else somma
+
+
+def _verifica_orizzonte(analitico, iterativo, nome):
+    if not np.allclose(analitico, iterativo, rtol=1e-9, atol=1e-6):
+        raise RuntimeError(
+            f"{nome}: forma chiusa {analitico} diversa dal ciclo anno per anno {iterativo}"
+        )
+
+
+def _calcola_orizzonte_iterativo(
     anni,
     prezzo_iniziale,
     incremento,
@@ -88,7 +143,8 @@ def calcola_orizzonte(
     rid_eur_kwh,
     cer_eur_kwh,
     quota_condivisa,
-    detrazione_annua=0
+    detrazione_annua=0,
+    anni_detrazione=None
 ):
     totale = 0
 
@@ -98,27 +154,79 @@ def calcola_orizzonte(
 
         # Benefici variabili legati al prezzo energia
         vantaggio_autoc = delta_autoconsumo * prezzo
-        
 
         rid = energia_immessa * rid_eur_kwh
         cer = energia_immessa * quota_condivisa * cer_eur_kwh
 
+        detrazione = detrazione_annua
+        if anni_detrazione is not None and anno > anni_detrazione:
+            detrazione = 0
+
         beneficio_annuo = (
             vantaggio_autoc
             + rid
             + cer
-            + detrazione_annua
+            + detrazione
         )
 
         totale += beneficio_annuo
 
-        # aggiorna prezzo anno successivo
-        prezzo *= (1 + incremento)
+        # aggiorna prezzo anno successivo (niente *= : prezzo puo' essere un array)
+        prezzo = prezzo * (1 + incremento)
 
     return totale
 
 
-def calcola_risparmio_bolletta_orizzonte(
+def calcola_orizzonte(
+    anni,
+    prezzo_iniziale,
+    incremento,
+    autoconsumo_base,
+    delta_autoconsumo,
+    energia_immessa,
+    rid_eur_kwh,
+    cer_eur_kwh,
+    quota_condivisa,
+    detrazione_annua=0,
+    anni_detrazione=None,
+    verifica=False
+):
+    """
+    Rendita cumulata su `anni` anni in forma chiusa (serie geometrica).
+
+    Solo l'extra autoconsumo segue il prezzo; RID, CER e detrazione sono
+    costanti. La detrazione vale per i primi `anni_detrazione` anni
+    (None = tutto l'orizzonte).
+
+    verifica=True ricalcola con il ciclo anno per anno e solleva
+    RuntimeError se i due risultati divergono.
+    """
+    anni_con_detrazione = anni if anni_detrazione is None else min(anni, anni_detrazione)
+
+    rid = energia_immessa * rid_eur_kwh
+    cer = energia_immessa * quota_condivisa * cer_eur_kwh
+
+    totale = (
+        delta_autoconsumo * prezzo_iniziale * _serie_geometrica(anni, incremento)
+        + anni * (rid + cer)
+        + anni_con_detrazione * detrazione_annua
+    )
+
+    if verifica:
+        _verifica_orizzonte(
+            totale,
+            _calcola_orizzonte_iterativo(
+                anni, prezzo_iniziale, incremento, autoconsumo_base,
+                delta_autoconsumo, energia_immessa, rid_eur_kwh, cer_eur_kwh,
+                quota_condivisa, detrazione_annua, anni_detrazione
+            ),
+            "calcola_orizzonte"
+        )
+
+    return totale
+
+
+def _calcola_risparmio_bolletta_iterativo(
     anni,
     prezzo_iniziale,
     incremento,
@@ -129,32 +237,265 @@ def calcola_risparmio_bolletta_orizzonte(
 
     for _ in range(anni):
         totale += autoconsumo_base * prezzo
-        prezzo *= (1 + incremento)
+        prezzo = prezzo * (1 + incremento)
 
     return totale
 
-def calcola_irr(flussi, guess=0.1, toll=1e-6, max_iter=1000):
+
+def calcola_risparmio_bolletta_orizzonte(
+    anni,
+    prezzo_iniziale,
+    incremento,
+    autoconsumo_base,
+    verifica=False
+):
+    """
+    Risparmio in bolletta cumulato su `anni` anni in forma chiusa.
+    verifica=True come in calcola_orizzonte.
+    """
+    totale = autoconsumo_base * prezzo_iniziale * _serie_geometrica(anni, incremento)
+
+    if verifica:
+        _verifica_orizzonte(
+            totale,
+            _calcola_risparmio_bolletta_iterativo(
+                anni, prezzo_iniziale, incremento, autoconsumo_base
+            ),
+            "calcola_risparmio_bolletta_orizzonte"
+        )
+
+    return totale
+
+# ---------------------------------------------------------
+# PIANO FLUSSI ANNUI (unica fonte per calcolatore e grafici)
+# ---------------------------------------------------------
+
+@dataclass(frozen=True, eq=False)
+class PianoFlussi:
+    """
+    Flussi anno per anno, anni 1..N sull'ultimo asse.
+    Con input array le colonne hanno forma (..., N).
+    """
+    anni: np.ndarray
+    autoconsumo: np.ndarray     # extra autoconsumo (segue il prezzo)
+    rid: np.ndarray
+    cer: np.ndarray
+    detrazione: np.ndarray
+    bolletta: np.ndarray        # risparmio bolletta impianto base
+    totale: np.ndarray
+    cumulato: np.ndarray
+    costo_impianto: np.ndarray
+
+    @property
+    def rendita(self):
+        """Rendita energetica attiva annua (totale senza bolletta)."""
+        return self.totale - self.bolletta
+
+    def flussi_irr(self, anni=10):
+        """[-costo, flusso anno 1, ..., flusso anno `anni`]."""
+        costo = np.broadcast_to(self.costo_impianto, self.totale.shape[:-1]).astype(float)
+        return np.concatenate([-costo[..., None], self.totale[..., :anni]], axis=-1)
+
+    def payback(self):
+        """
+        Anni (frazionari) per recuperare il costo, interpolando nell'anno
+        di rientro. NaN se il rientro cade oltre l'orizzonte del piano.
+        """
+        costo = np.asarray(self.costo_impianto, dtype=float)[..., None]
+        rientrato = self.cumulato >= costo
+
+        idx = np.argmax(rientrato, axis=-1)[..., None]
+        precedente = np.take_along_axis(self.cumulato - self.totale, idx, axis=-1)
+        flusso = np.take_along_axis(self.totale, idx, axis=-1)
+
+        anni = idx + (costo - precedente) / flusso
+        anni = np.where(rientrato.any(axis=-1, keepdims=True), anni, np.nan)[..., 0]
+
+        return float(anni) if anni.ndim == 0 else anni
+
+
+def calcola_piano_flussi(
+    prezzo_energia,
+    incremento,
+    autoconsumo_base,
+    delta_autoconsumo,
+    energia_immessa,
+    rid_eur_kwh,
+    cer_eur_kwh,
+    quota_condivisa,
+    detrazione_annua,
+    costo_impianto,
+    anni=CFG.ANNI_PIANO,
+    anni_detrazione=CFG.ANNI_DETRAZIONE
+):
+    """
+    Costruisce il PianoFlussi con le stesse ipotesi di calcola_orizzonte:
+    prezzo energia composto, RID/CER costanti, detrazione nei primi
+    `anni_detrazione` anni.
+    """
+    ax = lambda x: np.asarray(x, dtype=float)[..., None]
+
+    anno = np.arange(1, anni + 1)
+    prezzi = ax(prezzo_energia) * (1 + ax(incremento)) ** (anno - 1)
+
+    return piano_da_percorsi(
+        prezzi,
+        ax(rid_eur_kwh),
+        ax(cer_eur_kwh),
+        autoconsumo_base,
+        delta_autoconsumo,
+        energia_immessa,
+        quota_condivisa,
+        detrazione_annua,
+        costo_impianto,
+        anni_detrazione
+    )
+
+
+def piano_da_percorsi(
+    prezzi,
+    rid_eur_kwh,
+    cer_eur_kwh,
+    autoconsumo_base,
+    delta_autoconsumo,
+    energia_immessa,
+    quota_condivisa,
+    detrazione_annua,
+    costo_impianto,
+    anni_detrazione=CFG.ANNI_DETRAZIONE
+):
     """
-    Calcolo IRR tramite metodo di Newton-Raphson
+    PianoFlussi da percorsi anno per anno di prezzo energia e tariffe
+    RID/CER (ultimo asse = anni, es. forma (percorsi, anni)).
+    Le grandezze energetiche sono per scenario e si estendono sugli anni.
     """
-    r = guess
-    for _ in range(max_iter):
-        npv = 0
-        derivata = 0
+    ax = lambda x: np.asarray(x, dtype=float)[..., None]
+
+    prezzi = np.asarray(prezzi, dtype=float)
+    anno = np.arange(1, prezzi.shape[-1] + 1)
+
+    autoconsumo = ax(delta_autoconsumo) * prezzi
+    bolletta = ax(autoconsumo_base) * prezzi
+    forma = np.broadcast_shapes(
+        autoconsumo.shape, np.shape(rid_eur_kwh), np.shape(cer_eur_kwh)
+    )
+
+    autoconsumo = np.broadcast_to(autoconsumo, forma)
+    bolletta = np.broadcast_to(bolletta, forma)
+    rid = np.broadcast_to(ax(energia_immessa) * rid_eur_kwh, forma)
+    cer = np.broadcast_to(ax(energia_immessa) * ax(quota_condivisa) * cer_eur_kwh, forma)
+    detrazione = np.broadcast_to(
+        np.where(anno <= anni_detrazione, ax(detrazione_annua), 0.0), forma
+    )
+
+    totale = autoconsumo + rid + cer + detrazione + bolletta
+
+    colonne = dict(
+        anni=anno,
+        autoconsumo=autoconsumo,
+        rid=rid,
+        cer=cer,
+        detrazione=detrazione,
+        bolletta=bolletta,
+        totale=totale,
+        cumulato=np.cumsum(totale, axis=-1),
+    )
+    # il piano puo' finire in cache e venire condiviso: sola lettura
+    for colonna in colonne.values():
+        colonna.flags.writeable = False
+
+    return PianoFlussi(costo_impianto=costo_impianto, **colonne)
+
+
+def calcola_irr(flussi, guess=0.1, toll=1e-10, max_iter=100):
+    """
+    IRR di un singolo vettore di flussi (vedi finanza.irr).
+    Ritorna NaN se l'IRR non esiste o non converge.
+    """
+    return float(irr(flussi, guess=guess, toll=toll, max_iter=max_iter).tasso)
+
+
+# ---------------------------------------------------------
+# CACHE RISULTATI (LRU, condivisa da tutte le sessioni del processo)
+# ---------------------------------------------------------
+
+class CacheRisultati:
+    """
+    Cache LRU thread-safe con contatori hit/miss/evizioni.
+    """
+
+    def __init__(self, max_voci):
+        self._voci = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_voci = max_voci
+        self.hit = 0
+        self.miss = 0
+        self.evizioni = 0
+
+    def ottieni(self, chiave, calcola):
+        with self._lock:
+            if chiave in self._voci:
+                self._voci.move_to_end(chiave)
+                self.hit += 1
+                return self._voci[chiave]
+            self.miss += 1
+
+        # calcolo fuori dal lock: le altre sessioni non restano bloccate
+        valore = calcola()
+
+        with self._lock:
+            self._voci[chiave] = valore
+            self._voci.move_to_end(chiave)
+            self._riduci()
+
+        return valore
+
+    def ridimensiona(self, max_voci):
+        with self._lock:
+            self.max_voci = max_voci
+            self._riduci()
+
+    def svuota(self):
+        with self._lock:
+            self._voci.clear()
+            self.hit = self.miss = self.evizioni = 0
+
+    def statistiche(self):
+        with self._lock:
+            return {
+                "hit": self.hit,
+                "miss": self.miss,
+                "evizioni": self.evizioni,
+                "voci": len(self._voci),
+                "max_voci": self.max_voci,
+            }
+
+    def _riduci(self):
+        while len(self._voci) > self.max_voci:
+            self._voci.popitem(last=False)
+            self.evizioni += 1
 
-        for t, cf in enumerate(flussi):
-            npv += cf / (1 + r) ** t
-            if t > 0:
-                derivata -= t * cf / (1 + r) ** (t + 1)
 
-        nuovo_r = r - npv / derivata
+_CACHE_RISULTATI = CacheRisultati(CFG.CACHE_MAX_VOCI)
 
-        if abs(nuovo_r - r) < toll:
-            return nuovo_r
 
-        r = nuovo_r
+def configura_cache(max_voci):
+    """Cambia la dimensione massima della cache (0 = disattivata)."""
+    _CACHE_RISULTATI.ridimensiona(max_voci)
 
-    return r
+
+def statistiche_cache():
+    return _CACHE_RISULTATI.statistiche()
+
+
+def svuota_cache():
+    _CACHE_RISULTATI.svuota()
+
+
+def _normalizza(valore):
+    """Arrotonda gli input a 12 cifre significative: valori che differiscono
+    solo per rumore floating point condividono la voce di cache."""
+    return None if valore is None else float(f"{float(valore):.12g}")
 
 
 def compute_benefits(
@@ -170,6 +511,49 @@ def compute_benefits(
     autoc_base_perc,
     autoc_bonus_perc=None,
     incremento_prezzo_annuo=0.0,
+    usa_cache=True,
+):
+    """
+    Calcolo completo per un cliente. Con usa_cache=True input uguali
+    (dopo l'arrotondamento) costano una lookup nella cache LRU.
+    Ritorna sempre un dict nuovo: modificarlo non tocca la cache.
+    """
+    args = (
+        consumo_kwh,
+        base_kwp,
+        bonus_kwp,
+        prezzo_energia,
+        rid_eur_kwh,
+        cer_eur_kwh,
+        quota_condivisa,
+        costo_impianto,
+        resa_kwh_kwp,
+        autoc_base_perc,
+        autoc_bonus_perc,
+        incremento_prezzo_annuo,
+    )
+
+    if not usa_cache or _CACHE_RISULTATI.max_voci <= 0:
+        return _compute_benefits(*args)
+
+    chiave = tuple(_normalizza(v) for v in args)
+
+    return dict(_CACHE_RISULTATI.ottieni(chiave, lambda: _compute_benefits(*args)))
+
+
+def _compute_benefits(
+    consumo_kwh,
+    base_kwp,
+    bonus_kwp,
+    prezzo_energia,
+    rid_eur_kwh,
+    cer_eur_kwh,
+    quota_condivisa,
+    costo_impianto,
+    resa_kwh_kwp,
+    autoc_base_perc,
+    autoc_bonus_perc=None,
+    incremento_prezzo_annuo=0.0,
 ):
 
     # -------------------------------
@@ -263,9 +647,8 @@ def compute_benefits(
     # 20 ANNI (detrazione solo primi 10)
     # -------------------------------
 
-    # Primi 10 anni con detrazione
-    beneficio_primi_10 = calcola_orizzonte(
-        10,
+    beneficio_20_anni = calcola_orizzonte(
+        20,
         prezzo_energia,
         incremento_prezzo_annuo,
         autoconsumo_base,
@@ -274,25 +657,10 @@ def compute_benefits(
         rid_eur_kwh,
         cer_eur_kwh,
         quota_condivisa,
-        detrazione_annua
-    )
-
-    # Secondi 10 anni SENZA detrazione
-    beneficio_secondi_10 = calcola_orizzonte(
-        10,
-        prezzo_energia * ((1 + incremento_prezzo_annuo) ** 10),
-        incremento_prezzo_annuo,
-        autoconsumo_base,
-        delta_autoconsumo,
-        energia_immessa,
-        rid_eur_kwh,
-        cer_eur_kwh,
-        quota_condivisa,
-        0
+        detrazione_annua,
+        anni_detrazione=10
     )
 
-    beneficio_20_anni = beneficio_primi_10 + beneficio_secondi_10
-
     risparmio_bolletta_20 = calcola_risparmio_bolletta_orizzonte(
         20,
         prezzo_energia,
@@ -302,27 +670,23 @@ def compute_benefits(
     risparmio_complessivo_20 = beneficio_20_anni + risparmio_bolletta_20
 
     # -------------------------------
-    # IRR 10 ANNI
+    # PIANO FLUSSI E IRR 10 ANNI
     # -------------------------------
 
-    flussi_10 = [-costo_impianto]
-
-    prezzo = prezzo_energia
-
-    for anno in range(1, 11):
-
-        vantaggio_autoc = delta_autoconsumo * prezzo
-        rid = energia_immessa * rid_eur_kwh
-        cer = energia_immessa * quota_condivisa * cer_eur_kwh
-        detrazione = detrazione_annua if anno <= 10 else 0
-        bolletta = autoconsumo_base * prezzo
-
-        flusso = vantaggio_autoc + rid + cer + detrazione + bolletta
-        flussi_10.append(flusso)
-
-        prezzo *= (1 + incremento_prezzo_annuo)
+    piano = calcola_piano_flussi(
+        prezzo_energia,
+        incremento_prezzo_annuo,
+        autoconsumo_base,
+        delta_autoconsumo,
+        energia_immessa,
+        rid_eur_kwh,
+        cer_eur_kwh,
+        quota_condivisa,
+        detrazione_annua,
+        costo_impianto
+    )
 
-    irr_10 = calcola_irr(flussi_10) * 100
+    irr_10 = calcola_irr(piano.flussi_irr(10)) * 100
 
     # -------------------------------
     # RETURN
@@ -384,5 +748,414 @@ def compute_benefits(
             ),
 
         "irr_10": irr_10,
-    
-    }
\ No newline at end of file
+        "payback_anni": piano.payback(),
+
+        # Flussi anno per anno (tabelle e grafici)
+        "piano_flussi": piano,
+
+    }
+
+# ---------------------------------------------------------
+# MOTORE BATCH (array NumPy / DataFrame)
+# ---------------------------------------------------------
+
+COLONNE_INPUT = (
+    "consumo_kwh",
+    "base_kwp",
+    "bonus_kwp",
+    "prezzo_energia",
+    "rid_eur_kwh",
+    "cer_eur_kwh",
+    "quota_condivisa",
+    "costo_impianto",
+    "resa_kwh_kwp",
+    "autoc_base_perc",
+    "autoc_bonus_perc",
+    "incremento_prezzo_annuo",
+)
+
+_DEFAULT_BATCH = {
+    "autoc_bonus_perc": np.nan,
+    "incremento_prezzo_annuo": 0.0,
+}
+
+
+def quota_copertura_batch(kwp_bonus):
+    """
+    Versione vettoriale di quota_copertura_from_kwp.
+    """
+    kwp_bonus = np.asarray(kwp_bonus, dtype=float)
+
+    COPERTURA_BASE = 0.80
+    COPERTURA_MAX = 0.85
+
+    fascia_1 = kwp_bonus <= 5.74
+    base_fascia = np.where(fascia_1, 3.28, 6.56)
+    max_fascia = np.where(fascia_1, 5.74, 9.84)
+
+    posizione = np.clip((kwp_bonus - base_fascia) / (max_fascia - base_fascia), 0.0, 1.0)
+
+    return COPERTURA_BASE + posizione * (COPERTURA_MAX - COPERTURA_BASE)
+
+
+def apply_clipping_batch(bonus_kwp, resa_kwh_kwp, consumo_kwh):
+    """
+    Versione vettoriale di apply_clipping.
+    """
+    bonus_kwp = np.asarray(bonus_kwp, dtype=float)
+    resa_kwh_kwp = np.asarray(resa_kwh_kwp, dtype=float)
+
+    produzione_teorica = bonus_kwp * resa_kwh_kwp
+    riduzione = interpola_clipping(bonus_kwp, resa_kwh_kwp, consumo_kwh)
+
+    produzione_effettiva = produzione_teorica * (1 - riduzione)
+
+    return produzione_teorica, riduzione, produzione_effettiva
+
+
+def calcola_irr_batch(flussi, guess=0.1, toll=1e-10, max_iter=100):
+    """
+    IRR di una riga di `flussi` per scenario; NaN dove non converge.
+    """
+    return irr(flussi, guess=guess, toll=toll, max_iter=max_iter).tasso
+
+
+def compute_benefits_batch(dati=None, **colonne):
+    """
+    Versione colonnare di compute_benefits.
+
+    Accetta un DataFrame (o un dict di colonne) con gli stessi nomi degli
+    argomenti di compute_benefits, eventualmente sovrascritti da keyword.
+    Scalari e array vengono combinati per broadcasting.
+
+    autoc_bonus_perc mancante o NaN = calcolo automatico da bonus_kwp.
+
+    Ritorna un dict di array con le stesse chiavi di compute_benefits,
+    oppure un DataFrame (stesso indice) se l'input e' un DataFrame.
+    """
+    indice = getattr(dati, "index", None)
+
+    valori = dict(_DEFAULT_BATCH)
+    if dati is not None:
+        valori.update({k: dati[k] for k in COLONNE_INPUT if k in dati})
+    valori.update(colonne)
+
+    sconosciute = set(valori) - set(COLONNE_INPUT)
+    if sconosciute:
+        raise TypeError(f"Colonne non riconosciute: {sorted(sconosciute)}")
+    mancanti = [k for k in COLONNE_INPUT if k not in valori]
+    if mancanti:
+        raise TypeError(f"Colonne mancanti: {mancanti}")
+
+    valori = {k: np.asarray(v, dtype=float) for k, v in valori.items()}
+    valori = dict(zip(valori, np.broadcast_arrays(*valori.values())))
+    v = valori
+
+    consumo_kwh = v["consumo_kwh"]
+    prezzo_energia = v["prezzo_energia"]
+    rid_eur_kwh = v["rid_eur_kwh"]
+    cer_eur_kwh = v["cer_eur_kwh"]
+    quota_condivisa = v["quota_condivisa"]
+    incremento = v["incremento_prezzo_annuo"]
+
+    # Produzione
+    produzione_base = v["base_kwp"] * v["resa_kwh_kwp"]
+    produzione_bonus_teorica, percentuale_clipping, produzione_bonus = apply_clipping_batch(
+        v["bonus_kwp"],
+        v["resa_kwh_kwp"],
+        consumo_kwh
+    )
+
+    # Copertura
+    autoc_bonus_perc = np.where(
+        np.isnan(v["autoc_bonus_perc"]),
+        quota_copertura_batch(v["bonus_kwp"]),
+        v["autoc_bonus_perc"]
+    )
+
+    autoconsumo_base = np.minimum(consumo_kwh * v["autoc_base_perc"], produzione_base)
+    autoconsumo_bonus = np.minimum(consumo_kwh * autoc_bonus_perc, produzione_bonus)
+
+    delta_autoconsumo = np.maximum(autoconsumo_bonus - autoconsumo_base, 0)
+
+    energia_immessa = np.maximum(produzione_bonus - autoconsumo_bonus, 0)
+
+    # Benefici annui
+    vantaggio_extra_autoconsumo = delta_autoconsumo * prezzo_energia
+    rid_annuo = energia_immessa * rid_eur_kwh
+    cer_prudente = energia_immessa * quota_condivisa * cer_eur_kwh
+
+    totale_benefici_annui = vantaggio_extra_autoconsumo + rid_annuo + cer_prudente
+
+    detrazione_annua = v["costo_impianto"] * 0.50 / 10
+    beneficio_annuale_totale = totale_benefici_annui + detrazione_annua
+
+    risparmio_bolletta = autoconsumo_base * prezzo_energia
+
+    # Orizzonti: la forma chiusa lavora anche su array
+    args_orizzonte = (
+        incremento,
+        autoconsumo_base,
+        delta_autoconsumo,
+        energia_immessa,
+        rid_eur_kwh,
+        cer_eur_kwh,
+        quota_condivisa,
+    )
+
+    beneficio_10_anni = calcola_orizzonte(10, prezzo_energia, *args_orizzonte, detrazione_annua)
+    risparmio_bolletta_10 = calcola_risparmio_bolletta_orizzonte(
+        10, prezzo_energia, incremento, autoconsumo_base
+    )
+
+    beneficio_20_anni = calcola_orizzonte(
+        20, prezzo_energia, *args_orizzonte, detrazione_annua, anni_detrazione=10
+    )
+    risparmio_bolletta_20 = calcola_risparmio_bolletta_orizzonte(
+        20, prezzo_energia, incremento, autoconsumo_base
+    )
+
+    piano = calcola_piano_flussi(
+        prezzo_energia,
+        incremento,
+        autoconsumo_base,
+        delta_autoconsumo,
+        energia_immessa,
+        rid_eur_kwh,
+        cer_eur_kwh,
+        quota_condivisa,
+        detrazione_annua,
+        v["costo_impianto"]
+    )
+
+    # IRR 10 anni
+    irr_10 = calcola_irr_batch(piano.flussi_irr(10)) * 100
+
+    risultati = {
+        "produzione_base": produzione_base,
+        "produzione_bonus_teorica": produzione_bonus_teorica,
+        "percentuale_clipping": percentuale_clipping,
+        "produzione_bonus": produzione_bonus,
+        "autoconsumo_base": autoconsumo_base,
+        "autoconsumo_bonus": autoconsumo_bonus,
+        "delta_autoconsumo": delta_autoconsumo,
+        "energia_immessa": energia_immessa,
+        "vantaggio_extra_autoconsumo": vantaggio_extra_autoconsumo,
+        "rid_annuo": rid_annuo,
+        "cer_prudente": cer_prudente,
+        "totale_benefici_annui": totale_benefici_annui,
+        "detrazione_annua": detrazione_annua,
+        "beneficio_annuale_totale": beneficio_annuale_totale,
+        "risparmio_bolletta": risparmio_bolletta,
+        "beneficio_10_anni": beneficio_10_anni,
+        "beneficio_20_anni": beneficio_20_anni,
+        "risparmio_complessivo_10": beneficio_10_anni + risparmio_bolletta_10,
+        "risparmio_complessivo_20": beneficio_20_anni + risparmio_bolletta_20,
+        "risparmio_complessivo_annuo": beneficio_annuale_totale + risparmio_bolletta,
+        "irr_10": irr_10,
+        "payback_anni": piano.payback(),
+    }
+
+    if indice is not None:
+        import pandas as pd
+        return pd.DataFrame(risultati, index=indice)
+
+    risultati["piano_flussi"] = piano
+
+    return risultati
+
+
+def risultati_scenario(risultati, i):
+    """
+    Risultati dello scenario `i` di compute_benefits_batch (input 1-D, dict)
+    nella forma di compute_benefits: float e PianoFlussi del solo scenario.
+    """
+    scenario = {
+        k: float(v[i]) for k, v in risultati.items() if k != "piano_flussi"
+    }
+
+    piano = risultati.get("piano_flussi")
+    if piano is not None:
+        colonne = {}
+        for campo in fields(piano):
+            v = np.asarray(getattr(piano, campo.name))
+            colonne[campo.name] = v if campo.name == "anni" else v[i]
+        colonne["costo_impianto"] = float(colonne["costo_impianto"])
+        scenario["piano_flussi"] = PianoFlussi(**colonne)
+
+    return scenario
+
+
+# ---------------------------------------------------------
+# SWEEP PARAMETRICO (griglie di sensibilita')
+# ---------------------------------------------------------
+
+def _espandi_blocco(assi, fissi, inizio, fine):
+    """
+    Input del blocco [inizio, fine) del prodotto cartesiano degli assi,
+    ricavati dagli indici piatti senza materializzare la griglia.
+    """
+    nomi = list(assi)
+    indici = np.unravel_index(np.arange(inizio, fine), [len(assi[n]) for n in nomi])
+
+    colonne = dict(fissi)
+    colonne.update({n: assi[n][i] for n, i in zip(nomi, indici)})
+
+    if "n_moduli" in colonne:
+        colonne["bonus_kwp"] = np.round(
+            np.asarray(colonne.pop("n_moduli")) * CFG.POTENZA_MODULO_KWP, 2
+        )
+
+    return colonne
+
+
+def _valuta_blocco(assi, fissi, inizio, fine, chiavi):
+    colonne = _espandi_blocco(assi, fissi, inizio, fine)
+    risultati = compute_benefits_batch(**colonne)
+    risultati.pop("piano_flussi")
+
+    if chiavi is not None:
+        risultati = {k: risultati[k] for k in chiavi}
+
+    return inizio, fine, risultati
+
+
+def sweep(
+    parametri,
+    fissi=None,
+    dimensione_blocco=50_000,
+    processi=None,
+    chiavi=None,
+):
+    """
+    Valuta compute_benefits sul prodotto cartesiano di `parametri`.
+
+    parametri: dict nome argomento -> valori dell'asse. "n_moduli" e'
+               ammesso al posto di bonus_kwp (moduli da 410 Wp).
+    fissi:     dict degli argomenti costanti.
+    processi:  worker del process pool (None = tutti i core, 0 = nel
+               processo corrente).
+    chiavi:    risultati da restituire (None = tutti, senza piano_flussi).
+
+    Generatore: produce (indici, risultati) per blocco man mano che i
+    blocchi sono pronti, non in ordine. `indici` sono le posizioni piatte
+    nella griglia (ordine di np.unravel_index sugli assi). In memoria
+    restano al massimo due blocchi per worker.
+    """
+    assi = {k: np.asarray(v) for k, v in parametri.items()}
+    fissi = dict(fissi or {})
+    totale = int(np.prod([len(v) for v in assi.values()]))
+
+    blocchi = ((i, min(i + dimensione_blocco, totale)) for i in range(0, totale, dimensione_blocco))
+
+    if processi == 0:
+        for inizio, fine in blocchi:
+            _, _, risultati = _valuta_blocco(assi, fissi, inizio, fine, chiavi)
+            yield np.arange(inizio, fine), risultati
+        return
+
+    processi = processi or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=processi) as pool:
+        in_corso = set()
+
+        for inizio, fine in blocchi:
+            in_corso.add(pool.submit(_valuta_blocco, assi, fissi, inizio, fine, chiavi))
+
+            if len(in_corso) >= 2 * processi:
+                pronti, in_corso = wait(in_corso, return_when=FIRST_COMPLETED)
+                for futuro in pronti:
+                    inizio_b, fine_b, risultati = futuro.result()
+                    yield np.arange(inizio_b, fine_b), risultati
+
+        for futuro in _completati(in_corso):
+            inizio_b, fine_b, risultati = futuro.result()
+            yield np.arange(inizio_b, fine_b), risultati
+
+
+def _completati(futuri):
+    while futuri:
+        pronti, futuri = wait(futuri, return_when=FIRST_COMPLETED)
+        yield from pronti
+
+
+# ---------------------------------------------------------
+# OTTIMIZZATORE CONFIGURAZIONE MODULI
+# ---------------------------------------------------------
+
+CRITERI_OTTIMIZZAZIONE = {
+    # criterio -> (colonna, ordine crescente?)
+    "irr_10": ("irr_10", False),
+    "beneficio_10_anni": ("beneficio_10_anni", False),
+    "payback_anni": ("payback_anni", True),
+}
+
+
+def configurazioni_moduli(base_kwp, max_kwp, kwp_modulo=CFG.POTENZA_MODULO_KWP):
+    """
+    Tutte le configurazioni da base_kwp a max_kwp, un modulo alla volta:
+    lista di (n_moduli, kWp, e' la base).
+    """
+    n_base = round(base_kwp / kwp_modulo)
+    n_max = round(max_kwp / kwp_modulo)
+
+    return [
+        (nm, round(nm * kwp_modulo, 2), nm == n_base)
+        for nm in range(n_base, n_max + 1)
+    ]
+
+
+def ottimizza_moduli(
+    consumo_kwh,
+    resa_kwh_kwp,
+    prezzo_energia,
+    rid_eur_kwh,
+    cer_eur_kwh,
+    quota_condivisa,
+    autoc_base_perc,
+    incremento_prezzo_annuo=0.0,
+    limite_tetto_kwp=None,
+    criterio="irr_10",
+    fasce=CFG.FASCE,
+):
+    """
+    Valuta in un solo passaggio batch ogni numero di moduli feasible di
+    ogni fascia (costo = prezzo della fascia, base = kWp base della fascia)
+    e ordina le configurazioni secondo `criterio`
+    (irr_10, beneficio_10_anni o payback_anni).
+
+    limite_tetto_kwp esclude le configurazioni che non stanno sul tetto.
+    Ritorna un DataFrame, migliore configurazione in prima riga.
+    """
+    import pandas as pd
+
+    if criterio not in CRITERI_OTTIMIZZAZIONE:
+        raise ValueError(f"Criterio sconosciuto: {criterio}")
+
+    righe = [
+        {"fascia": fascia, "n_moduli": nm, "base_kwp": base, "bonus_kwp": kwp, "costo_impianto": prezzo}
+        for fascia, base, massimo, prezzo in fasce
+        for nm, kwp, _ in configurazioni_moduli(base, massimo)
+        if limite_tetto_kwp is None or kwp <= limite_tetto_kwp
+    ]
+    configurazioni = pd.DataFrame(righe, columns=["fascia", "n_moduli", "base_kwp", "bonus_kwp", "costo_impianto"])
+
+    if configurazioni.empty:
+        return configurazioni
+
+    risultati = compute_benefits_batch(
+        configurazioni,
+        consumo_kwh=consumo_kwh,
+        resa_kwh_kwp=resa_kwh_kwp,
+        prezzo_energia=prezzo_energia,
+        rid_eur_kwh=rid_eur_kwh,
+        cer_eur_kwh=cer_eur_kwh,
+        quota_condivisa=quota_condivisa,
+        autoc_base_perc=autoc_base_perc,
+        incremento_prezzo_annuo=incremento_prezzo_annuo,
+    )
+
+    tabella = pd.concat([configurazioni, risultati], axis=1)
+    colonna, crescente = CRITERI_OTTIMIZZAZIONE[criterio]
+
+    return tabella.sort_values(colonna, ascending=crescente, na_position="last").reset_index(drop=True)
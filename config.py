@@ -8,5 +8,28 @@ class Config:
     QUOTA_CONDIVISA = 0.50
     DETRAZIONE = 0.50
     ANNI_DETRAZIONE = 10
+    ANNI_PIANO = 30
+    CACHE_MAX_VOCI = 512
+    CACHE_GRAFICI_DISCO_MB = 64
+    CACHE_GRAFICI_MEMORIA_MB = 16
+    # Processi per il rendering dei grafici del report (None = auto, 0 = in serie)
+    PROCESSI_GRAFICI = None
+    # Grafici del report: "png" (raster) o "svg" (vettoriale, richiede svglib)
+    FORMATO_GRAFICI = "png"
+    # Pagine di solo testo del report dal modello gia' impaginato (False = impaginazione completa)
+    PAGINE_MODELLO = True
+    # Report PDF dell'interfaccia: preparati insieme al massimo e in attesa oltre quelli
+    REPORT_PARALLELI = 2
+    REPORT_IN_CODA = 6
+    # Secondi dopo i quali un PDF pronto e non piu' richiesto viene scartato
+    REPORT_TTL_S = 900
+    POTENZA_MODULO_KWP = 0.41
+    # Fasce della promozione: (fascia, kWp base, kWp massimo, prezzo impianto base)
+    FASCE = ((1, 3.28, 5.74, 11900), (2, 6.56, 9.84, 13690))
+    # Accumulo e inverter ibrido della promozione
+    BATTERIA_KWH = 16.0
+    BATTERIA_KW = 6.0
+    RENDIMENTO_BATTERIA = 0.95     # per verso (carica e scarica)
+    INVERTER_KW = 6.0
 
 CFG = Config()
@@ -0,0 +1,93 @@
+# controlla_import.py
+
+"""
+Tempo di avvio dell'interfaccia: importa in un interprete nuovo gli stessi
+moduli che app.py importa in testa e fallisce (exit 1) se si supera il
+budget o se tra i moduli caricati compare uno di quelli del report PDF,
+che devono arrivare solo con il primo build_pdf.
+
+Uso:
+    python controlla_import.py [--budget-ms MS] [--ripetizioni N]
+"""
+
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+
+
+CARTELLA = os.path.dirname(os.path.abspath(__file__))
+
+# Budget in millisecondi per gli import di app.py (streamlit compreso)
+BUDGET_MS = 400
+
+# Moduli che l'avvio non deve caricare
+MODULI_PESANTI = ("matplotlib", "reportlab", "PIL", "svglib", "pdf_report")
+
+_MISURA = """
+import json, sys, time
+t = time.perf_counter()
+exec(compile(sys.argv[1], "app.py", "exec"), {})
+ms = (time.perf_counter() - t) * 1000
+print(json.dumps({"ms": ms, "moduli": sorted(sys.modules)}))
+"""
+
+
+def import_app(percorso=os.path.join(CARTELLA, "app.py")):
+    """Le istruzioni di import al livello del modulo di app.py, come sorgente."""
+    with open(percorso, encoding="utf-8") as f:
+        sorgente = f.read()
+    albero = ast.parse(sorgente)
+
+    return "\n".join(
+        ast.get_source_segment(sorgente, nodo)
+        for nodo in albero.body
+        if isinstance(nodo, (ast.Import, ast.ImportFrom))
+    )
+
+
+def misura(ripetizioni=5):
+    """Tempo minimo (ms) degli import di app.py e moduli pesanti caricati."""
+    codice = import_app()
+    tempi = []
+    pesanti = set()
+
+    for _ in range(ripetizioni):
+        uscita = subprocess.run(
+            [sys.executable, "-c", _MISURA, codice],
+            cwd=CARTELLA, capture_output=True, text=True, check=True,
+        )
+        r = json.loads(uscita.stdout.strip().splitlines()[-1])
+        tempi.append(r["ms"])
+        pesanti.update(
+            m for m in r["moduli"] if m.split(".")[0] in MODULI_PESANTI
+        )
+
+    return min(tempi), sorted(m for m in pesanti if "." not in m)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    parser.add_argument("--ripetizioni", type=int, default=5)
+    opzioni = parser.parse_args()
+
+    ms, pesanti = misura(opzioni.ripetizioni)
+    print(f"import app.py: {ms:.0f} ms (budget {opzioni.budget_ms:.0f} ms)")
+
+    errori = []
+    if ms > opzioni.budget_ms:
+        errori.append(f"budget superato di {ms - opzioni.budget_ms:.0f} ms")
+    if pesanti:
+        errori.append("moduli del report caricati all'avvio: " + ", ".join(pesanti))
+
+    for e in errori:
+        print("ERRORE:", e)
+
+    sys.exit(1 if errori else 0)
+
+
+if __name__ == "__main__":
+    main()
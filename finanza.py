@@ -0,0 +1,108 @@
+# finanza.py
+
+"""
+VAN e IRR vettoriali.
+
+Ogni riga di `flussi` e' uno scenario: flussi[..., 0] e' l'esborso
+iniziale (t = 0), flussi[..., t] il flusso dell'anno t.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+# Intervallo di ricerca dell'IRR: da -99% a +1000% annuo
+IRR_MIN = -0.99
+IRR_MAX = 10.0
+
+
+class RisultatoIRR(NamedTuple):
+    tasso: np.ndarray          # NaN dove non converge
+    convergente: np.ndarray    # bool, stessa forma di tasso
+    iterazioni: int
+
+
+def van(flussi, tasso):
+    """
+    Valore attuale netto di ogni riga di `flussi` al `tasso` (broadcast).
+    """
+    flussi = np.asarray(flussi, dtype=float)
+    t = np.arange(flussi.shape[-1])
+    sconto = (1 + np.asarray(tasso, dtype=float)[..., None]) ** -t
+
+    return (flussi * sconto).sum(axis=-1)
+
+
+def _van_e_derivata(flussi, tasso):
+    t = np.arange(flussi.shape[-1])
+    sconto = (1 + tasso[:, None]) ** -t
+    termini = flussi * sconto
+
+    return termini.sum(axis=1), -(t * termini).sum(axis=1) / (1 + tasso)
+
+
+def irr(flussi, guess=0.1, toll=1e-10, max_iter=100, limiti=(IRR_MIN, IRR_MAX)):
+    """
+    IRR di molti vettori di flussi in un colpo solo.
+
+    Newton-Raphson protetto da bisezione: ogni riga mantiene un intervallo
+    [basso, alto] in cui il VAN cambia segno; se il passo di Newton esce
+    dall'intervallo o la derivata e' nulla si dimezza l'intervallo.
+    Le righe senza cambio di segno nei `limiti`, o che non convergono in
+    `max_iter` iterazioni, hanno tasso NaN e convergente False.
+    """
+    flussi = np.asarray(flussi, dtype=float)
+    forma = flussi.shape[:-1]
+    flussi = flussi.reshape(-1, flussi.shape[-1])
+    n = flussi.shape[0]
+
+    basso = np.full(n, float(limiti[0]))
+    alto = np.full(n, float(limiti[1]))
+    van_basso = van(flussi, basso)
+    van_alto = van(flussi, alto)
+
+    tasso = np.full(n, np.nan)
+    convergente = np.zeros(n, dtype=bool)
+
+    # radice esatta su un estremo
+    for estremo, valore in ((basso, van_basso), (alto, van_alto)):
+        esatta = valore == 0
+        tasso[esatta] = estremo[esatta]
+        convergente |= esatta
+
+    attivi = ~convergente & (np.sign(van_basso) != np.sign(van_alto))
+    r = np.clip(np.full(n, float(guess)), basso, alto)
+    iterazioni = 0
+
+    while attivi.any() and iterazioni < max_iter:
+        iterazioni += 1
+        idx = np.flatnonzero(attivi)
+
+        ra, lo, hi = r[idx], basso[idx], alto[idx]
+        f, df = _van_e_derivata(flussi[idx], ra)
+
+        # restringe l'intervallo tenendo il cambio di segno
+        stesso_segno = np.sign(f) == np.sign(van_basso[idx])
+        lo = np.where(stesso_segno, ra, lo)
+        hi = np.where(stesso_segno, hi, ra)
+        van_basso[idx] = np.where(stesso_segno, f, van_basso[idx])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            nuovo = ra - f / df
+        fuori = ~np.isfinite(nuovo) | (nuovo <= lo) | (nuovo >= hi)
+        nuovo = np.where(fuori, (lo + hi) / 2, nuovo)
+
+        fatti = (f == 0) | (np.abs(nuovo - ra) <= toll * (1 + np.abs(ra))) | (hi - lo <= toll)
+        nuovo = np.where(f == 0, ra, nuovo)
+
+        r[idx], basso[idx], alto[idx] = nuovo, lo, hi
+        tasso[idx[fatti]] = nuovo[fatti]
+        convergente[idx[fatti]] = True
+        attivi[idx[fatti]] = False
+
+    return RisultatoIRR(
+        tasso=tasso.reshape(forma),
+        convergente=convergente.reshape(forma),
+        iterazioni=iterazioni,
+    )
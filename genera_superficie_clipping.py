@@ -0,0 +1,107 @@
+# genera_superficie_clipping.py
+
+"""
+Strumento offline: genera la superficie di clipping dell'inverter 6 kW
+su una griglia kWp x resa x consumo e la salva in dati/superficie_clipping.npz,
+che calculator.py carica all'import.
+
+La superficie e' calibrata sui valori misurati (8,20 / 9,02 / 9,84 kWp per
+nord / centro / sud) e li raccorda:
+  - kWp: nessun clipping fino a KWP_SENZA_CLIPPING, poi lineare tra i punti
+    misurati ed estrapolato con l'ultima pendenza;
+  - resa: il valore misurato della zona vale su tutta la sua fascia di
+    resa (nord fino a 1250, centro fino a 1400, sud oltre), come nella
+    tabella originale, con un gradino sotto il kWh/kWp tra una fascia e l'altra;
+  - consumo: piena fino a 9000 kWh, rampa a zero entro 10000 kWh.
+
+Uso:
+    python genera_superficie_clipping.py [--output PATH]
+"""
+
+import argparse
+import os
+
+import numpy as np
+
+
+# Valori misurati: kWp -> (nord, centro, sud)
+CLIPPING_MISURATO = {
+    8.2:  (0.015, 0.019, 0.023),
+    9.02: (0.029, 0.034, 0.041),
+    9.84: (0.045, 0.052, 0.059),
+}
+
+# Limite superiore della resa (kWh/kWp) di nord e centro; sud oltre
+LIMITI_ZONE = (1250, 1400)
+
+# Larghezza del gradino tra due fasce: ogni resa intera cade dentro una
+# fascia e prende il valore misurato della zona
+GRADINO_RESA = 1e-3
+
+# Sotto questa potenza il rapporto DC/AC non produce clipping (6 kW AC)
+KWP_SENZA_CLIPPING = 7.38
+
+# Rampa sul consumo: clipping pieno fino a 9000 kWh, nullo da 10000 kWh
+CONSUMO_PIENO = 9000
+CONSUMO_NULLO = 10000
+
+# Griglia: passo kWp = 1/10 di modulo da 410 Wp, cosi' ogni configurazione
+# reale cade su un nodo
+PASSO_KWP = 0.041
+KWP_MAX = 12.3
+RESA = np.array([LIMITI_ZONE[0], LIMITI_ZONE[0] + GRADINO_RESA,
+                 LIMITI_ZONE[1], LIMITI_ZONE[1] + GRADINO_RESA])
+# zona di ciascun nodo di RESA (0 = nord, 1 = centro, 2 = sud)
+ZONA_RESA = (0, 1, 1, 2)
+CONSUMO = np.array([0, CONSUMO_PIENO, CONSUMO_NULLO, 50000], dtype=float)
+
+PERCORSO_DEFAULT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dati", "superficie_clipping.npz")
+
+
+def clipping_kwp(kwp, zona):
+    """Curva continua del clipping in funzione dei kWp per una zona."""
+    punti_kwp = [KWP_SENZA_CLIPPING] + sorted(CLIPPING_MISURATO)
+    punti_val = [0.0] + [CLIPPING_MISURATO[k][zona] for k in sorted(CLIPPING_MISURATO)]
+
+    valori = np.interp(kwp, punti_kwp, punti_val, left=0.0)
+
+    # oltre l'ultimo punto misurato: prosegue con l'ultima pendenza
+    pendenza = (punti_val[-1] - punti_val[-2]) / (punti_kwp[-1] - punti_kwp[-2])
+    oltre = kwp > punti_kwp[-1]
+    valori[oltre] = punti_val[-1] + pendenza * (kwp[oltre] - punti_kwp[-1])
+
+    return valori
+
+
+def genera_superficie():
+    kwp = np.arange(0, round(KWP_MAX / PASSO_KWP) + 1) * PASSO_KWP
+
+    # fuori dai nodi l'interpolazione resta costante: nord sotto 1250, sud sopra 1400
+    kwp_resa = np.stack([clipping_kwp(kwp, z) for z in ZONA_RESA], axis=1)
+
+    fattore_consumo = np.interp(CONSUMO, [CONSUMO_PIENO, CONSUMO_NULLO], [1.0, 0.0])
+    superficie = kwp_resa[:, :, None] * fattore_consumo[None, None, :]
+
+    return {
+        "kwp": kwp,
+        "resa": RESA,
+        "consumo": CONSUMO,
+        "clipping": np.clip(superficie, 0.0, 1.0),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", default=PERCORSO_DEFAULT)
+    args = parser.parse_args()
+
+    superficie = genera_superficie()
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    np.savez_compressed(args.output, **superficie)
+
+    print(f"{args.output}: {superficie['clipping'].shape} "
+          f"({os.path.getsize(args.output) / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
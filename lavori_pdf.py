@@ -0,0 +1,150 @@
+# lavori_pdf.py
+
+"""
+Report PDF preparati in background per l'interfaccia.
+
+Il bottone dell'app non chiama piu' build_pdf dentro il rerun: consegna
+il lavoro a un GestoreLavori condiviso da tutte le sessioni e poi
+interroga il lavoro a intervalli (fase e avanzamento) finche' il PDF non
+e' pronto. Il gestore:
+  - prepara al massimo `paralleli` report insieme (un thread ciascuno: i
+    grafici vanno gia' sul pool di processi di pdf_report);
+  - rifiuta nuovi lavori (invia -> None) quando ce ne sono gia'
+    `paralleli + in_coda` in corso, invece di accumulare memoria;
+  - tiene solo in memoria il PDF pronto, al massimo uno per sessione, e
+    lo scarta dopo `ttl_s` secondi senza richieste: niente file su disco,
+    niente nomi condivisi tra sessioni con lo stesso cliente.
+
+pdf_report viene importato dal primo lavoro, non all'avvio dell'app.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from config import CFG
+
+
+# Fasi di un lavoro e avanzamento (0-1) mostrato all'inizio di ciascuna
+FASI = {
+    "in coda": 0.0,
+    "grafici": 0.1,
+    "impaginazione": 0.5,
+    "pronto": 1.0,
+    "errore": 1.0,
+}
+
+
+class LavoroPDF:
+    """Un report richiesto da una sessione: fase corrente, poi PDF o errore."""
+
+    def __init__(self, sessione, nome_file):
+        self.id = uuid.uuid4().hex
+        self.sessione = sessione
+        self.nome_file = nome_file
+        self.fase = "in coda"
+        self.pdf = None
+        self.errore = None
+        self.creato = self.accesso = time.monotonic()
+        self.durata = None
+
+    @property
+    def concluso(self):
+        return self.fase in ("pronto", "errore")
+
+    @property
+    def avanzamento(self):
+        return FASI[self.fase]
+
+    def leggi(self):
+        """Byte del PDF, per il download (rinnova la scadenza)."""
+        self.accesso = time.monotonic()
+        return self.pdf
+
+
+class GestoreLavori:
+    """
+    Coda dei report PDF con limite globale di lavori contemporanei.
+    Thread-safe: lo usano tutte le sessioni del server.
+    """
+
+    def __init__(self, paralleli=CFG.REPORT_PARALLELI, in_coda=CFG.REPORT_IN_CODA,
+                 ttl_s=CFG.REPORT_TTL_S):
+        self.paralleli = paralleli
+        self.max_attivi = paralleli + in_coda
+        self.ttl_s = ttl_s
+        self._pool = ThreadPoolExecutor(max_workers=paralleli, thread_name_prefix="report-pdf")
+        self._lavori = {}
+        self._lock = threading.Lock()
+
+    def invia(self, sessione, nome_file, *args, **kwargs):
+        """
+        Accoda build_pdf(*args, **kwargs) per `sessione` e ritorna il
+        LavoroPDF. Se la sessione ha gia' un lavoro in corso ritorna quello;
+        None se il server ha gia' troppi lavori aperti.
+        Il lavoro concluso precedente della sessione viene scartato.
+        """
+        with self._lock:
+            self._scarta_scaduti()
+            precedenti = [l for l in self._lavori.values() if l.sessione == sessione]
+            for l in precedenti:
+                if not l.concluso:
+                    return l
+            if sum(not l.concluso for l in self._lavori.values()) >= self.max_attivi:
+                return None
+
+            for l in precedenti:
+                del self._lavori[l.id]
+            lavoro = LavoroPDF(sessione, nome_file)
+            self._lavori[lavoro.id] = lavoro
+
+        self._pool.submit(self._esegui, lavoro, args, kwargs)
+        return lavoro
+
+    def lavoro(self, id_lavoro):
+        """LavoroPDF per id (rinnova la scadenza); None se scaduto o sconosciuto."""
+        with self._lock:
+            self._scarta_scaduti()
+            lavoro = self._lavori.get(id_lavoro)
+            if lavoro is not None:
+                lavoro.accesso = time.monotonic()
+            return lavoro
+
+    def stato(self):
+        """Lavori per fase, per il monitoraggio."""
+        with self._lock:
+            self._scarta_scaduti()
+            conteggio = dict.fromkeys(FASI, 0)
+            for l in self._lavori.values():
+                conteggio[l.fase] += 1
+            return conteggio
+
+    def _scarta_scaduti(self):
+        # chiamata con il lock; i lavori in corso non scadono
+        limite = time.monotonic() - self.ttl_s
+        for id_lavoro in [
+            i for i, l in self._lavori.items() if l.concluso and l.accesso < limite
+        ]:
+            del self._lavori[id_lavoro]
+
+    def chiudi(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _esegui(self, lavoro, args, kwargs):
+        def fase(nome):
+            lavoro.fase = nome
+
+        t0 = time.perf_counter()
+        try:
+            # anche l'import dentro il try: un errore qui deve arrivare alla sessione
+            from pdf_report import build_pdf
+
+            lavoro.pdf = build_pdf(*args, avanzamento=fase, **kwargs)
+            lavoro.fase = "pronto"
+        except Exception as e:
+            lavoro.errore = f"{type(e).__name__}: {e}"
+            lavoro.fase = "errore"
+        finally:
+            lavoro.durata = time.perf_counter() - t0
+            lavoro.accesso = time.monotonic()
@@ -0,0 +1,150 @@
+# montecarlo.py
+
+"""
+Simulazione Monte Carlo dell'incertezza su prezzo energia e tariffe.
+
+Il prezzo energia cresce in media di `incremento_prezzo_annuo` con uno
+shock lognormale annuo; RID e CER seguono passeggiate lognormali senza
+deriva attorno al valore di partenza. Ogni percorso passa per la stessa
+matematica del piano flussi del calcolatore (matrici percorsi x anni).
+"""
+
+import numpy as np
+
+from calculator import compute_benefits, piano_da_percorsi
+from config import CFG
+from finanza import IRR_MAX, IRR_MIN, irr, van
+
+
+QUANTILI = (0.10, 0.50, 0.90)
+
+METRICHE = ("beneficio_10_anni", "beneficio_20_anni", "payback_anni", "irr_10")
+
+
+def _percorsi_lognormali(rng, n, anni, partenza, crescita, volatilita):
+    """
+    Valori anno 1..anni: anno 1 = partenza, poi crescita media `crescita`
+    con shock lognormali di deviazione `volatilita` (mediana = deterministico).
+    """
+    shock = rng.standard_normal((n, anni - 1))
+    passi = np.log1p(crescita) + volatilita * shock
+    log_fattori = np.concatenate([np.zeros((n, 1)), np.cumsum(passi, axis=1)], axis=1)
+
+    return partenza * np.exp(log_fattori)
+
+
+def _valuta_percorsi(rng, n, anni, base, cliente, volatilita):
+    prezzi = _percorsi_lognormali(
+        rng, n, anni, cliente["prezzo_energia"],
+        cliente.get("incremento_prezzo_annuo", 0.0), volatilita["prezzo"]
+    )
+    rid = _percorsi_lognormali(rng, n, anni, cliente["rid_eur_kwh"], 0.0, volatilita["rid"])
+    cer = _percorsi_lognormali(rng, n, anni, cliente["cer_eur_kwh"], 0.0, volatilita["cer"])
+
+    piano = piano_da_percorsi(
+        prezzi,
+        rid,
+        cer,
+        base["autoconsumo_base"],
+        base["delta_autoconsumo"],
+        base["energia_immessa"],
+        cliente["quota_condivisa"],
+        base["detrazione_annua"],
+        cliente["costo_impianto"],
+    )
+
+    rendita = piano.rendita
+    payback = piano.payback()
+
+    # IRR senza radice tra IRR_MIN e IRR_MAX (in pratica perdite oltre il
+    # -99%): il percorso conta al limite dalla parte della radice invece di
+    # sparire dai quantili, e viene contato
+    flussi = piano.flussi_irr(10)
+    tasso = irr(flussi).tasso
+    al_limite = np.isnan(tasso)
+    tasso = np.where(al_limite & (van(flussi, IRR_MAX) > 0), IRR_MAX, tasso)
+    tasso = np.where(np.isnan(tasso), IRR_MIN, tasso)
+
+    metriche = {
+        "beneficio_10_anni": rendita[:, :10].sum(axis=1),
+        "beneficio_20_anni": rendita[:, :20].sum(axis=1),
+        # rientro oltre l'orizzonte: +inf, cosi' entra nei quantili alti (vedi _quantili)
+        "payback_anni": np.where(np.isnan(payback), np.inf, payback),
+        "irr_10": tasso * 100,
+    }
+
+    return metriche, int(al_limite.sum())
+
+
+def _quantili(valori):
+    # np.quantile, non nanquantile: i quantili descrivono sempre tutti i percorsi.
+    # inverted_cdf ritorna un valore osservato invece di interpolare tra due
+    # vicini: tra due payback +inf l'interpolazione lineare darebbe NaN
+    return {
+        f"p{int(q * 100)}": float(v)
+        for q, v in zip(QUANTILI, np.quantile(valori, QUANTILI, method="inverted_cdf"))
+    }
+
+
+def simula_monte_carlo(
+    cliente,
+    n_percorsi=10_000,
+    volatilita_prezzo=0.08,
+    volatilita_rid=0.10,
+    volatilita_cer=0.05,
+    seed=42,
+    blocco=2_000,
+    tolleranza=None,
+):
+    """
+    P10/P50/P90 di beneficio 10 e 20 anni, payback e IRR 10 anni.
+
+    cliente:    argomenti di compute_benefits (dict).
+    seed:       stesso seed = stessi percorsi = stessi quantili.
+    tolleranza: se impostata, i percorsi vengono generati a blocchi e la
+                simulazione si ferma quando tra due blocchi consecutivi
+                nessun quantile cambia piu' di `tolleranza` (relativa).
+
+    Ritorna {metrica: {"p10", "p50", "p90"}, "n_percorsi": usati,
+    "convergenza": True se fermata da `tolleranza`, "irr_al_limite":
+    percorsi con IRR fuori da finanza.IRR_MIN..IRR_MAX, contati al limite}.
+    """
+    base = compute_benefits(**cliente)
+    volatilita = {"prezzo": volatilita_prezzo, "rid": volatilita_rid, "cer": volatilita_cer}
+    anni = CFG.ANNI_PIANO
+
+    rng = np.random.default_rng(seed)
+    passo = n_percorsi if tolleranza is None else min(blocco, n_percorsi)
+
+    raccolti = {m: [] for m in METRICHE}
+    precedenti = None
+    convergenza = False
+    generati = irr_al_limite = 0
+
+    while generati < n_percorsi:
+        n = min(passo, n_percorsi - generati)
+        metriche, al_limite = _valuta_percorsi(rng, n, anni, base, cliente, volatilita)
+        for m, valori in metriche.items():
+            raccolti[m].append(valori)
+        irr_al_limite += al_limite
+        generati += n
+
+        quantili = {m: _quantili(np.concatenate(v)) for m, v in raccolti.items()}
+
+        if tolleranza is not None and precedenti is not None:
+            variazioni = [
+                abs(quantili[m][p] - precedenti[m][p]) / max(abs(precedenti[m][p]), 1e-12)
+                for m in METRICHE for p in quantili[m]
+                if np.isfinite(quantili[m][p]) and np.isfinite(precedenti[m][p])
+            ]
+            if max(variazioni, default=0.0) < tolleranza:
+                convergenza = True
+                break
+
+        precedenti = quantili
+
+    quantili["n_percorsi"] = generati
+    quantili["convergenza"] = convergenza
+    quantili["irr_al_limite"] = irr_al_limite
+
+    return quantili
@@ -3,30 +3,40 @@ report_next_definitivo.py
 Struttura originale fedelissima + schede impianti LED + tabelle migliorate
 Palette Verde Foresta #1B4332 + Oro #E9C46A
 """
-import datetime, os, math
-import numpy_financial as npf
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch
+import atexit, datetime, functools, io, os, math, multiprocessing, re, threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 import numpy as np
 
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm, inch
 from reportlab.lib import colors
+from reportlab.lib.utils import ImageReader
+from reportlab.graphics.shapes import Drawing, Group
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 from reportlab.platypus import (
     BaseDocTemplate, PageTemplate, Frame,
     Paragraph, Spacer, Table, TableStyle,
-    PageBreak, Image, HRFlowable, KeepTogether
+    PageBreak, Image, HRFlowable, KeepTogether, Flowable
 )
+from reportlab.pdfbase import pdfdoc
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+from cache_grafici import in_cache
+from calculator import configurazioni_moduli
+from config import CFG
 
 PW, PH = A4
 ML=14*mm; MR=14*mm; HDR_H=17*mm; HDR_LINE=2*mm; FTR_H=7*mm
 MT=16*mm; MB=12*mm; BW=PW-ML-MR
 
+# Versione dello stile grafici: incrementarla quando cambia l'aspetto di un
+# grafico, cosi' la cache non riusa le immagini vecchie
+STILE_GRAFICI = 1
+
 # âââ PALETTE ââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââ
 G1  = colors.HexColor("#1B4332"); G2 = colors.HexColor("#2D6A4F")
 G3  = colors.HexColor("#52B788"); G4 = colors.HexColor("#95D5B2")
@@ -61,35 +71,29 @@ def fmt(n): return f"{int(round(n)):,}".replace(",",".")
 def fmtD(n): return ("+" if n>=0 else "") + fmt(n)
 
 # âââ LOGO VECTOR ââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââ
-LOGO_PATH = None  # set to path string to use real PNG
-# âââ LOGHI NEXT (embedded base64 — sempre disponibili) âââââââââââââââââââââââ
-import base64 as _b64, io as _io
-_LOGO_WHITE_B64 = "iVBORw0KGgoAAAANSUhEUgAAAoUAAABQCAYAAABvRQ9hAABPVklEQVR42u19eZRU1fX1vjXPPdBMKsaBH2oGFINzUBGcSGIiJmpEQBGi0WiQBAWHoGJEiBqJoiKoiUMUPxGjgigqiKDGiEoEESckQlSgm67xze98f+i5uVV000Wgm+rut9d6i+7qouoN9567zz7DFc899xztu+++SCaTEEIAAFzXRTAYhOu6ICK0Jvx+P2zbxsaNG/H222/jvffeQzabRTweRyqVguM4CAQCcBwHrusiEAjAdV3Ytg2fz4dgMAjTNOVnOY4DIoLf74cQotXPv9IRCASg6zrC4TAuvfRSeb99Pp+8Z0QEIoIQomgMEBFyuRzuvPNORCIRuK4L13UBAOFwGKZpys9pLRARIpEIMpkMTjrpJBx66KEwDAPxeBy2bcvz9dA5Yds21qxZg6effhpVVVUwDAM+n0/aDR6vrQXHcRCPx5FOp9GzZ0+ce+65CAaDMAwDoVAIQgj4fD7Yti3Pice1z+cryz75fD58+umnePzxx5HL5bDnnnuioaEB0WhUnoPP54MQQs5tvvbWvv7dDb5/zdkB0zQhhEA4HIbjOAiFQgCAdDqN6upq2LYNv9+PLVu2IBgM4thjj8XRRx+NaDQKTdPk82oOfM/9fr9cp/icbNuW3yeEwOLFi/Hmm29K+8rn1JpwXVeui7FYDOl0GjU1Nbj44ovhOE7F20+/3y+vg9d/IQTy+TwymQyWL1+ODz74AIVCAT6fD/F4HLFYDJqmwefzIRQKobGxEcFgEIlEApqmQQiBaDSKTCYjn8/O3N9wOIyxY8dC13XJSXjNrXT+IYSQY7BQKGDVqlUIHHjggdhjjz0QCoXkBbDBUslDaxrVQCCAuro6dO/eHb169cIrr7yC5557Du+9954IhULbkL7Sn/l313UhhJCTs7UnXHtBKpXC5MmTqa6uDuFwuEmjyqRQfZ2IEI/Hkc/ncccddwghBOLxOCzLgmVZbbLgBAIB2LaNvfbai8aMGYOePXvKgczP3EPnhc/nw5YtW7BgwQKsW7dODmBe1NsC1dXVaGxsxKxZs6hXr15yLvGiy4uZupCw49rS+GXS0bVrV3z22WeYMmUK3n//faGO/9KFx3OG/4tQKIRwOIxsNlv0ejKZLHqtV69eNHr0aBx//PHo3r07bNtGXV1di8+HnyMAGIYBIkI4HJa2VNd1RCIRGIaB/v37Y/To0aJQKEjHoS3sp8/nk2toJBLBtGnTKJVKbbMWVCrp5/urOj+1tbXQdR2pVAo9evTAyy+/jBdeeAEff/yx4HnBToBpmggGg7Asq+izd4WNCIVCuP7666m2tha2bRc9e57rlU4KXdeFz+eDZVkwDAOioaGBampqQETyprOxNU2zRU9pVxj1UkMJQHoCd955J+bMmYNPPvlERCIRycbj8Tiy2az0Am3bhm3bRRfLKlhnxjceEq1YsQJ77703NE2D67qIRqMwDGMbb4YHNJPCQCCAZ599FmeffbbI5/NFz4290NYeH0SEs846ix5++GHouo5QKCQ9MU8p9EghAIwePRoPP/ywEEJA13U591t7fPj9fpimid69e9Pq1aulEm/bNuLxuCQLHH1R55fjOAgGgy1en+u60DRNft5dd92FadOmYf369YL/HggEpAOl2r7ShbCpRaEjKofqoszqjW3bUkG1LAuRSAR+vx+//vWvafTo0ejdu7ckcmwjW1o/eJ20bRuRSESOx0KhAACIxWIoFAqIxWIAgCuvvBK33HKLCIfD0DSt1e0nCyO8jtfV1dG//vUvdO3aVdr4SoZt23LelEYB+dmygwQAS5cuxYwZM7BkyRJs3rxZEBFSqRQymYy8D6FQCIFAAJlMZqfvfzwex4oVK6h3797I5XJF6yqfe3sghXwf1q1bhwARyXBsU4t8a6ttHGZhds8eTSAQQE1NDSZPnozrr78eDz/8ME2bNg0fffSRCAQCKBQK8v+wh8ZysWVZ8rw7u1r4TQhY1NTUEA+CWCwGIQQikQhs294uKeRFJ5/PIxaLwXVdaTSb8r5aY9G3bRs1NTWwLAuFQgGBQACxWEyGCj10XuRyOcRiMfTq1QumaSIUCslxySSpLUhpNpuVc4kJIZ8DL8icAhOJROTvLdkn0zTh9/sRi8VgmiZM08TFF1+Ms88+G7fccgvdfvvtgm23rutFi6mnFkJGOthWMCEMBAI48cQTaerUqejTp08RmWdnk9WmlkgLrzuqOujz+WTKDYdtOZXH5/NJQtja61M4HJaKZDAYRDAYRNeuXaHrurzW9kL0OYTM6xIANDQ0IJVKIZvNIhAI4Nhjj8Wxxx6LDz74AHPmzKFZs2Zh48aNQhWO2CYwodxZUtWtWzdYliWdsXA4DJ/Ph3A43Orr464iheraH+BfAoGA9KxV76q1DQt/BxtMn88niSkT1lwuh/POOw/nnXce/vKXv9CNN96ITz75RPj9fukBlpJbdcJ2dlIYCoWgaZr0jHmx4b9tL6dQnThs0Dg8ZVlWq9/feDyOxsZG+Wxra2vl81XHiofOiVQqBdM05XhVHYW2mP88H7766ivx//7f/6ORI0ciHA4jk8kgGo2iUCggHA4jEAhADWvx4lFOeIltHCscmqahtrYW1113HUaMGEFTpkzBww8/LFQSxKkfbRVC352LmpoCoy5unHsWDAZlKN+2bZxwwgl0/fXX4+ijj5a5noZhyKhTqSq1PTDBZJvKZNBxHGiaJnOiY7EYNm/ejKefflrmIKqRubZQ3Phg54lJa6U/X0lWSqKWruuitrZWkl81p/PAAw/ElVdeifPOOw833XQTzZ49WwSDQRkmrampwdatW3f6/qtpa6wGc2RAXW8rFSy68Hn6fD4E1JwUnmBqAmprk0I1XK0SEjWxtLq6WqoC55xzDk455RTcfffdNHnyZMGEhQtj2AvgAdTaSkGlw+fzIRaLESsOKtkrTYxWw238PiJCdXW1zJtiI8Kh/NY2Ko2NjfJ8IpEITNOUDgQXm3jovCgUCojH49Io86LH+UKtPT7VvLBRo0aJjz/+mMaNG4dYLCaVGcuykMvl5O+GYcjE/5bsKxPCbDaLZDIpc8R4ITrwwAPx17/+Fb/85S/ppptuwoIFCwTwdb6Umu7R2RxhFVxUsP/++9OUKVNw+umnS9snhEAwGJQRJiZMah5eS0pcoVCQhJLFCb/fLyNgADBnzhxcffXV+Oyzz4QaYWmL8ckKluM4iEajUn1ui0LBXfksuWhLVXFZmOBD0zRYloVYLIZAIIBvfetbmDlzJs466ywaN24cVq5cKUKhkCSEu+L+sw1i5zQajcp1tD2sT2pB2jc1HgGZt8WkUCVorZ1zwuFAZvFMRjgWT0RobGxENBpFNBqFZVno0aMHrr32Whx77LE0duxYrF27VliWhVAoJFUtnpydXSn8JiQvgsEgqfeXQ+zNKYUqSbQsC42NjdKAmqYpQ1WtfX85/KYOWs718ZRgD6zsZLNZmVICQCpkrT0+hBAIhUJSHbjxxhvFI488Qtdeey1GjhwJwzBklbBlWQiHwzIUXE6hCafX1NTUyM9Qw2eWZSGbzeLoo4/G/Pnz8eSTT9If/vAHvP3226Kz5FSXXiOvX2y7IpEI3XzzzRg2bBhSqRQAyHQYNZTLqQdMpNTiy5Ycb04J4DHI4coXX3wRd9xxB+bPny/U10tVsNa0/2onDl4T+Xvbg/1UU5lUXsLRTSbybA+i0agkOo7jIJ/P44QTTsCKFStwzTXX0J/+9CfB92Znrz8YDBKPG3Ud5e9NJBIVr8QyoZZKoRq65TeoylFrGxXOU1Nj+0xaeNJUV1cXKVS5XA6u62LQoEF4/vnnMX78eHr00UcFez5q7kFnz6vhXBleLHVdRzweL5o4pYaV7xsRQdd19OrVS/5NJWJsZFoT7L2zIsOFBJFIpE2+30Nlg4s1OJrAChyHbduiwpMJKKtP69atExdeeCFmzJhBkyZNwsCBA5FIJGROoNruq6Xxy7lq7IRFIhFwTnUsFoNlWaitrZXhytNPPx0nn3wy7rvvPrrxxhuxZcsWsSOEqqM4wmyjJk6cSCNHjsQBBxwAx3Gk+sfKDi/ovJC7rivveTkqj1rkwOk14XAYK1aswPTp0/G3v/1N8D1Wc0g50tLa97/0OtixtyyrXXRvUMOvzFWYePn9fkl4AcgoUjQalaF527aRSqWQTqcRiUQwZcoUHHjggTRhwgR8+eWXYmev3zAM4bouMYfhOR2JRJBKpSpeKWRngQ/btuFjBq7m8al5Y+rfVSPGf2fi1tyh3nR+v5p8rRI3/h71QfNk4vfxQ4/H43AcB927d8df//pXjB8/nvj71IpaNg5qPkKlVwTt6kUzFAoR51ryhGFC2JSnqr7G7RRKQ/ttRbjV58f5ObzQc6Wld3TeQ+1WwOOlLQmhCrW4w7IsrFixQpx22mli1KhR+Oc//4l4PA6/3y9Dyeo8Y5vINk4lOEx8OTdO7XGnpoCw3YtGoxgzZgzWrFmDsWPHEqsYqu1tKjLQ3NzbnVDtNqtxqg1XbTkrsgDwi1/8glasWEGTJ09G7969i1qZcSiV/1XvAYsK/HogEIBhGDJsr+u6vIfqZ3Ju4datW3H11Vdj4MCB4rHHHhP8vEqhFgW19qLP15VMJtHY2Ch4rLD9r+RD5Q5qrYPa+5PnBau9pV1UeE4IIaBpGkaOHInHH38c++67L5WOITXkX874Z67C56P2PeR1s7XtHxNPtgccfeV7xmOVxz5X4fP/Z+GFFW9fOYOKiQDnofn9fik5tnTSwWBQ/h82nNznznGcosafbExVeb1cTJ06Fddffz35/X65GPAA4u/lZFTOOfDQPqCmNdTX1yMejxc1MvWOznvkcrkiY8zEoZx8sLZSOp544glxwgkniAsvvBCbNm1CMpmEbduy4W4gEEA+n0c6nZahR5XwtuQ0qXZYhoACAUQiEdx222147bXXaPTo0aRW3jLhZBLLKTxMfvjvFeLUFqmlvE7wgsbPXNM0/OhHP6KXXnqJ/vKXv6Bv3767JHTJ+YVEJMOBvOBz4YKmaXjggQdw3HHH4aabbhL5fL4iKk+JSEbjstks9txzT8rn89KJqvT5zY5WqSjBBHBHQqRM4GzbxoABA/DUU09hn332IXXMs9oYCoXKGv9+v5+Yz/B8jUQiMlWkte8PCyVsNwzDkCkSTHK5RQ5fu9r9gKvj2Q5omoZAOUZHrcRi5s03rKUbp2kawuGw9HRLmb8aJuaHrbanaUnVY6/Asixce+216NKlC11++eWyuSvn5PBEZnAD0UovGe/s4ERuHgddunSBbdvI5XLtQp730LrgXDvDMIp2N4pEIhVRecvEq1Ao4N577xVPPvkkjR07FpdeeilSqZR0grkHoZo6U07OrBqxUcNAvNBlMhl897vfxaxZs3DmmWfS1KlT8dJLLwl21IPBoCTWpYsoqx+7E2rBB1dfcxUtL2S6ruOoo46iyy67DEOHDkUoFEI+n98lfUx59wsO/UejUXm/OGXh8ccfx/Tp0/GPf/xDqIUQXJy3u0lhoVCQvfo2b96MSCSyTfpQpUJNZ1O5gGEYME2zRXGHewU6joNwOAy/3490Oo1oNIq+ffvi+eefx5FHHil5gmma6NKlC+rr68tqGaTruojH48TnxvUP4XAYuVyuSN1uTaeJU6yYEGqaVqScl0YgWFVUUwU5X7ksUqh6lKocriYoNodkMin/H++CwcTP7/cXsVaVZKql/S154nxRmqbh4osvRiqVovPPP1/woOHWANyugR+2RwgrH0zkQ6EQcrmc9Ix4QfVa0nRupNNpqXDxfE4kEsjlchWxswe3fWJi09DQIK655ho888wzdPHFF2PEiBHQNK2o4S0rd6pd3B7p5O9RSSjbZl4kstksBg0ahMGDB2P69Ok0a9YsvP/++4IVLy7mUlN1KkkpZBWH7yM79Pvssw9dcsklGD58OLp16ybJIqcX7SwKhQIcx0EikZA2iNXCV155BX/84x8xf/58Afy3UTXwdSh7dxNCdf1mZZDFmfr6elRXV1d8oQmLUhwqZtLNO9W09IxLIwdqIYppmujTpw8WLFhAgwcPFty+qL6+vqy5x/zDsixs3boVyWQS1dXV0iFRm5m3FlhQY8Krvs72saqqSlZps1PFubOsujOBjMfjLZNCtdKNDYVK7FryxtW8BQ4Tq61vmKSxmqj2GitHHvb7/XKXi2AwiHw+jzPOOEMSw4aGBrmlEeeGcLipUkJMHpoH50N88cUXRYs9L3SqN+Sh84Fb0Xz66ady0WNHohKKKIQQRQsS28M333xT/OMf/8ADDzxAN910E4466ijZZDmZTEqC29KiUpoXphaw8HeHw2G51VssFsPYsWMxbNgw3HHHHTRjxgyRz+fl7lW8yFVSAQrn8nET72w2i6qqKhoxYgTGjx+Pbt26yWgRE1s+drY5MytR6XQa8XgciUQCa9aswcyZMzF9+nTBa5AQQuZycS/JSohEqb0xebzU19eje/fuMlRayVB7KrJ6zvlv5TxbVtG5Y4VlWTKf17Zt5PN59O/fH/feey8NHz5c8PMqNye5UCigUChg7733lgTMcRxkMhnE4/FWz2tmNZ/HXX19PaqqquSc4fHL6Q/cUJtzC3mesNKZz+eB+vp6cl2XHMchy7LItm2yLItc1yXLssiyLHIch1zXJdu2yTRNsm2bHMchx3Hof4Ft22QYBpmmSUQkv9t1XSIisiyLTNOU57O9g9+rHkRE2WyWFi1aRD179iRVsSwlHJ0BdXV19MUXX5DjOPKe8T1XX1OfK99XIqJ33nmHShN/22p7LB6svXr1ovnz55NlWeTBA8OyLHr11VeptrZWLhysFlYKoeFwbOm4DoVC0mifffbZtH79eiIiafsMw2jR/vHBtpjtNttptoUMwzBoy5Yt8ntWr15Nw4YNo1ISxOr87garH2ro8KyzzqIVK1bI56/rOmmaVrR+6Lou15qdOQzDkDZn06ZN9Pvf/5441J9MJqU40tQ9q6SCRt7eDQDGjx8vbX97gW3b2zzfcuaHYRikaZr8HF3XSdd1chyH8vm8XPuIiC688ELiYjBVZWwJV111FRUKBble8jm2JTRNk2OewffLNM0i+1B6T/nIZDL0+eefk6ivr5d7H7N3yfmDHCpWizU41GCaJgqFAt56662ymCxXc4VCIVRXV6Nnz55y/0WObXOvLy4IKUfCVSek2m+K25a88MIL+NnPfiY3Iefqsc6Ui1ZXV0fvvfceunXrts32dZyz0dyOJsFgEO+++y4OPfRQoaovbRmaY4WwtrYW48ePp4MOOkguXt7ex50bK1aswLRp00RDQ4O0WRwZqCQ1Uy3oUPeZd10XVVVVSKfTSKVSGDduHF144YXo3r17WTmF6o5DbAvVEDKrCNyyhskyV2nzPHr99ddxww03YOHChUKdc5WEwYMH0zf9aWXYiwsIbNuGruuSbKs7x+wsKdU0DY888ghuvPFGrF+/XlRVVcEwDNmChu2o2jaN8+UrQXHlqJhaQHTmmWfS6aefjrq6uoqf4z6fD1VVVejZsye6dOmyTW1CS8/PNM2iOahW/nNomvei3nfffZFOp0W51eFsc84991w67bTTUF1dLVNZQqFQq/MM5lXhcBjHHXcc1q1bhw8//FCe2xFHHIFkMonly5dLhfCbHFypen/88cdoaGiAruu44IILWlYKVTVP13XJgLPZLK1bt47KKSnnWLZq4GpqarD//vvT6NGjac6cOVRfXy+/h1m+pmlle3R8Xo7jSGacz+eJiOjdd9+lb33rW1TqyXWWfLT2rBQ25/WqKox3dN6jdB6rC0YlRAJaUov4HNVr+Pa3v02zZ88uy/65rkumaUrVRLWfqlKgqheFQoEMw5B2P51Oy/c+9dRTdPjhh1Ml2cd+/frRQw89JJXPTCZDuq6TaZpSIeRIFv/L17qzSuG8efPo+9//PvGzKm1txmtaaRPgSnNYS9sftRf7qRLDmpoa9OvXj37961/TSy+9VNbzU9UzHvNERPl8njRNI8dxyDAMKhQKRET0/PPP045GGjiMXfq8Oa2gtVvSCCFwzDHHkOu61KdPH1n0EggE8MEHH5Bt2/Ttb3+7qP3OnDlziIjo/PPPJzWKum7dOmqRFKqEofRGr1mzhnhLoKYGXzmTggdor1696LrrrqONGzdKw6VKsZqmkWEYUip1Xbcs+ZiNx0cffUTf/e53CYBMvi7dU1FtndNRQstCCNTU1OA///lPUWief26JFFqWRatWraLOEmr34GF3kUbVliaTSRx00EH0zDPPyNBPfX29nLtsn3VdlwudYRhFi6Cu62XZR14Y2Yk2TZNmzJghU2/U81T7v/FrpeFxdbHi93JbGXWRL927XCVdQgjU1dXRLbfcQmy7crlcUViYQ+QthQ/VdUS1eYZhyL9blkWZTEa+94UXXqBTTz2VvBG6e6GOD/XnqqoqHHDAAfTAAw/IOaHrOhUKBXJdl9LpdFlOAadpmKYp59RZZ51F3GmlqfFcSeAK+5kzZ9KGDRuK0kACgQDef/99IiLq06dPkSh2zz33kK7rNHny5KL0uvvvv3/3k8LS+H337t1pxowZ0lA1NjZKo5jP5+V3q97h9o5CoSD/z4YNG6TXV/rAm/KqWrucvD2QQsdxaPXq1dRUfpEXuvXgYedDY83ZoVgsBiEEhgwZQkuXLpWE5csvv5QREdd1iyI4juNQNpuVeVQt2UeVMOXzeemMFwoF+uSTT2jChAlFc19N7QGKG0aXKmlM/NTX1IhRabUkv15dXY3x48fTF198Ic/PNE1JWnVdl3mS5VwfXxfnxrOzy9i6dau8X++//z6dd955lEwmvS00K4gUctqaCs7tPPHEE+m1116TBJ+dpFwuV/b4Z+WQiOiVV16hqqqqdmVDlixZQvPmzStSOX0+Hz788EPK5/PUp08fSiaTCIVCGDhwIDU0NBARUd++fUnNN73jjjt2PylUEYlE5MkNGTJEJkQ3NDQUecCqcSg3DKBpGpmmSZs2baL+/fsTG13VAPN3N5UY3llJIRHRBx98QJzEr+496ZFCDx52jVFXCVJTticcDmP06NH02WefSfKnaZq0hbZtUzablQsiK4At2UXTNItsa+nvuq7T6tWrafjw4VR6PttTL9S/c543q4ulJJGd70AggOHDh9M777xTRPhYxWR7xM7+joYP1ehTPp8nwzAol8tJYjhp0iRJBtoTKejIaEpdbgqhUAj3338/maZJuVyuaF6UoyTzfOL5c9ppp1Fzc7GS1j2+J6+++io9+OCDUg1kFZ+L1/L5POXzeVq/fj2ZpkkrV66ks88+m9TKbgC48847K4MUqt4mX8w3zSWlgeDJyw97RzxFtULNcRzaunUrDRgwgJr6bjZQHYUY7gpSuHbtWuKeS5737MHDrjfsqq1UG/2r+V8A0K1bN7rpppuosbFREpxsNttkpXE5OYmcK85RATVPcevWrVKZdF2XFi9eTIMHDyZWbbj5Nat/zeWCNYVAICBtr8/nw8CBA+mZZ54puibTNIuuzbIsSQb595auL5fLyTAxq4OsinLocObMmUXhtUqouvaAJsUHdatGLlxVUzAmTZokyT9XF5cjFjExZH6xcOFC4p1CKlkIYedryZIl9Oijj8o0Lxa8OHx86aWX0pVXXkmff/45ERH97ne/IzXnka+vYkihSgZLZeN99tmH+MKY2BDRDuUM8Ps478ayLKqvr5c5I6oRVmXqjqCE7UqlsHTx8uDBw85hR3KVmIQBQP/+/en++++Xc5fTZDjXmnOrynGa1Rw7tX0H2wH1d9u2adasWZJElYaM2eaULji8jV4p+vTpQ4899pj8js2bNxfl9rHtVu24SmDLub5MJiMVIA6b2bZNCxcupCOOOIJ4reFwZKlA4GH3rl9NzZHS36PRqCTzf/zjH6UjUM74MAyjaB1kAYprEJo7j0raG/zFF1+kRYsWkbpGB4NB/Pvf/ybDMKhr164EAHvttZdMyzj66KOL+E84HMaMGTMqgxSqk6+qqkoSQk5+TKVSWL58eVGRSbmeAF9XLpeTP7Mnkcvl6JxzziEOa1Raj7NKI4VeyNiDh10/P1UD35QtZcWilLiEQiGcfPLJtHjx4qIOEUzwyiGFnJuo5hZydTIfruvK8BOTRl3X6ZprriHVXkcikaKwMV+L+hpvDbfXXnvR1KlTJRFlRU8NY/ORzWaLQr9ss8opNOEUJFY/HcehN954g37+859TKdHma6ik/oIe/hu1a27taSpPddGiRWU5DqrizPOAx9qVV15J21P0K6E6n4nwZZddRq7rFuVCBgIBrFmzhoiIvvOd7xArq7/61a/IMAx6//33qba2tohcLlmyZPeTwuYethBCErVEIoFkMonXXntNkjkmhuUUmqhtGVQSxJ/BBoJ7XJVKsx4p9EihBw9toRqqoVjVrqoLEJNEdTEcNmwYffzxx1Ip5MWtXKVErb5UE/DV1jYcWlPb2PznP/+hiy++mFSbyTZUJVzRaFRGYcaNGyeLZZiAMmFzXVfmSrJtUvMbuWCEiV4518dE9uOPP6YxY8ZQVVVVUWU0L4rqPY7FYh45rDBw7i1XBqvPjsGdRb73ve/R1q1by8qpVXNV1dZ7r7/+OsVisV1WM9GapLCuro4Mw6DLL79cpkH4fD689957ZFkW9e7dm9TcwSVLlpDrunTFFVfIuXvEEUdQJpPZ/aSwqXi9Gs7lh89b1SxcuLAoJFCOUeDzLTV+nGNIRHTRRReRqhZ2lLyS1gofewTRg4ddQwS3FxpTqy9LFwIGq4dVVVW4+uqrZVuvcnd8UMPIqlqnkko1IZ9DsOouDm+88QYNHTp0mxY26oI+dOhQevfdd+W5qXl+/B1MDNkeccGMao/YyS/n+pjATpkyherq6or6L6rnyITDs2mVhZaIeVOOE0cep0yZUhY/KBQKRSIRj7NMJkM9evQgte6gEscIO4l//vOfKZ1OS/UvHA5j3bp1RaFwv9+PaDSKgw8+WM65Qw45hPx+PxYuXEiGYVRW9fH2wA8mGAyCc1DS6XSR5MsET93CZ0eq75g1c++fpgZmeyy0qKmpwb///e+iqsQdaV790UcfEaumpYm3bUFq+RmoHiHneLDT4B0d82BloLmD52NTe2B3hub0ai40Y//996fbbrutSDFU+7yW2sum+huWm5Oofq7rujRnzhw67LDDisJugwYNKioiyWQyO1QdWtqUmg+2T5qmUTablfaMtzJzXZfuu+8+6tu3LzVnQzx0HNKozvd4PI69995bVuQ3pRyrfSvVn9nhUKuQm+rTW0nbQAJAz5496cMPP6RFixYRp0EccsghdPjhhxMrqHzOsVgMBx10EB155JEUiURwww03kGEYX7e1qXRSqDaWVj/zwQcflA+WK+7UPoZM9spVErPZLGWzWZo0aRLxYqSGj7l7vVqI0l4I4q4ghex9laqFu8NTLO195sEDg8OXHSH1Y0fg8/kQiURkVWaXLl3w3e9+l5577jmpxnFPQ65cVkNnlmVROp2WSfblVi+zY53JZGSqjqZpNHv2bDr66KPpkUcekbtV5XI5+Z5y28qweqPu7ar2LOR/1Z1OuPn08ccfL6sxufVGuQqUh/Y5B9S1KRqN4rnnnpPV9axMq5HDlkjhpZdeSs2Nl0pxKtjeCSFw8MEHExHR/PnzKR6Pb5OGou7tzP/edNNNRET0k5/8hEaNGkUVv7LyfoW2bUuViogwYsQIsWnTJvrtb3+LYDCITCYj8wmy2SySyWRZ+w7yHsnhcBiWZeGqq65Cly5d6LLLLhOO46C6uhqNjY2wLEsOBNu2EYvFUCgUOsVk252hYsuy5L3mCsZEIkGJRELufeqh8+Lzzz8XvLdrIBCAYRhFThzvR9uR5ybw9X626n6t9fX1qK+vF6eeeiqGDBlCkyZNQr9+/eQ+sqZpyj1xXddFIBBAKpWC67owDEOSzJb2nmeHnYsCLcuC4zgYNmzY1/uoKojH49B1HYVCAZFIBNFotMXPz+fziMfjiEQi0HUdmqYhGo0iGAwim80iHo8jn88jEokgmUzivffew0033YQ5c+YIdV9c0zSLCKGnEnZcYkhEcF0Xmqbhueeew8CBA+X+30TUpLreHPr06YNAILCNHVH3Ut7dcBxHzqP3339fHHjggfTqq6/iiy++oKuuugrz58/HunXrBAAYhgHHcRCJRHDiiSfSjTfeiAMOOAAjRozAiy++KEaMGFH5pJAvQNd1xONx5HI5uK6LeDyO3/3ud0LTNLrmmmsQDAaRy+UQi8UQi8Xgui78fn+Li0IoFEIul5MMWtd1jBkzBqlUisaMGSMaGxsRDAZhWZY0QIFAAOVumN3RSGFbT4RgMCjv9VFHHUV33nknqqurUVtbKye5h86LTz/9lMaNG4elS5dKCx+NRqFpWqe4fiKSYXZ2gn0+H8LhMPx+P3K5HBYuXCiWLVuGYcOG0fjx47HvvvsWOc9MBIkIgUBAqqzlEELXdSXh4p5xgUBAzkvHcdDY2IhIJCJtLIf9TdNsMcSfSCSgaVoRSTUMo2hBj8fjWLduHW6//XbcfffdwrIs1NbWoqGhAaFQCJZlyWtj4sq2hX/20L7XJiaCHMnz+XywbRtvvvmmVM+ZD7CzyARye9hjjz2aXGfU+bY7odq6YDAIIsLatWvFXnvthUmTJtEdd9yBiRMnYsOGDbR+/XrYto299toL++yzD3r16oUFCxbg5z//OT788EMRCARQW1uLdhGDM00TqVQKmUxGerf5fB5+vx/XXXedKBQKNHnyZOkBGoaBaDQKwzBaDDNaloVEIoHGxkakUilEo1GYpolzzjkHgUCAhg8fLth45PN5JBIJ5HK5ivMWWnPRUSVo/r0tnQLXdfH973+fli5disbGRlRXV8uFrLOFCTuj0d8eDjroICxZsgT9+/enFStWCDaSnUXJF0LAdV25yDFRU0mxEAKZTAZ33323WLBgAY0ePRoXXXQR6urq4DgObNuGEELOJcMwpHrYkhLP6j2TQ8dxEAqFQETSRnfp0gUAUCgUZFNddvRaIoXpdBpVVVUgIqluEhFs20YymUQmk8GsWbMwffp0fP755yIajcKyLDQ0NCAQCEjiyRGeUtviof2vT6W/O44j7caGDRvkc1cdFcuyEA6HWxwDPPaYfLLIVClKs6ZpMirCURJ2niZPniymTJmCoUOH0kknnYQ999wTlmXhP//5D5555hk8/fTTWLt2reB577ouMplM5ZNCZvWZTAbhcFgSPk3T5AOdMmWKqK+vp5kzZ8I0TUkImTlvD+FwGLZty/5ZPAAsy8KwYcOQTCbpJz/5iRwBuVxObtfED6Gjo7mdTNqKEIdCIRxwwAHgcL5hGLKKqhK8NQ+7D4FAALlcDocccgg++OADabQ7S2pHIBCQahcrJbxohUIhSfrYdq5fv15ce+21eOyxx2js2LE4//zz5eLI94w7DZRDnFzXheM4RdvVsV2Mx+Py767rIhgMyvPhdjXlLMqZTAbJZBJ+vx+bNm1Ct27d4LouHnnkEUyePBlr164VbMtZCAiFQtA0DaFQSAoFpTbfI4Uda43i56lGB03TlFFGVtXLdTiB/+4MwiFkFoIqRQxirsLrpG3b0HUdfr8flmXB7/fjoYceEg8++CBCoRBc14Vt21JB9/v9MAwDsVgMuq5/3cqm0h+267pyH0omeqpcylWHc+bMEcOGDUM6nZYeZTmTno2IbdtF4ZdAIIB8Po8f/ehHWLx4Mfl8PkSjUUQiEalSdZZih6ZyCtvKU/L5fAiFQjJHNJvNSkVD1/WirbW8o/MdjuMgkUhgjz32QD6fh6Zp2yRSd2TwglC6YwgrJrZtSwc2HA7L96xbt06MGTNGnHbaaZg3bx78fj9isZj8f0QkIyItKTWsFOZyOWSzWRm+5r/zOQSDQRQKBflzOSk4pmkiHA5L1bFbt2546aWX8OMf/xjnnnuu+PjjjwXvW88Kp23bKBQKUl1kQsjXz3lVXl5hx1mfVPFCXa/8fr/MN2ZwCkO5Thd/h+M4RWp8pSil8Xgc4XBYCmJ8rqXXyeevEkm+T4VCQar9FU8KA4EA0um0fBiWZcktWSzLkgQxnU7j0UcfFRMnToRt27Asa4f7JNq2Lb0BNpL5fB7HH388Fi9eTPF4nHRdl96Dp1K1DSnM5XJS7eBFzbIsb4/STgD2yps72PFjzz0cDktb0VkWfbZdnDvHhp8VOV4AOG+QyVkoFMKCBQvEiBEjxLnnnou33noL8Xhc/l3dPWV785O/lzcZ4HQb0zTl93FBC+cwcrFJOdfm9/uRSCSwcuVKnHHGGTjppJPECy+8IDhHrFAoyIWf38+2QR0LhmHIe1FOPpmH9rE+qGq0Gt5VcwtVR4lth1p8tD370xQJrJSx4/P5kM/nZfQsn88XcRqegxwNME1TRlDV9DfO2QVQ+aSQH6j6UCzL2iYcwATyvvvuEyNHjvya8X4zIEoXCVYTuBiFF5bSsnPXdRGLxZDNZnHsscdi4cKF6NatG7ESqXoS/G80Gt1mm75KUFv5GtWCkXJJMyfxqr+3VW4hf4/aBojlb8/T7zwqdXMHzzUeJ0yOKslwt8UcKZ3vav6UGjJTIyK2bcuK7UceeUQMGjRITJgwAZs3b0Y8Hpdq2/bCZUQkC0e4CpK/U+0W4ff7i/K9eJHiv6kLuvr/g8EgNm7ciOuvvx4/+MEPxJNPPimEEDJvis+Ln72qkKqFhk3dIw/tH009R16vOEWA12reJY3Xj3I6V/B45TlTaSkH6vWXhs9V0UrlS0yGVV4AfB15CwaDaPf9PDiPRFUWn3jiCTF06FDU19fLQcAeLXudHIpuCWyYvil2wBtvvIHa2loyTRM1NTXSsPID0DRNMvNsNuvN2l2sFPGCV/qzd3TOQ3UMShd+L2cMRcnxHGFR1Q+VRJumialTp4q+ffti+vTpbVrExQsSE0nXdfHll1/i3nvvRf/+/XHdddeJXC4nowWc/6Q201e3qitd8Dx48FAe2n1SHBs0JoehUAjRaBSLFi0SZ511Fs2ePRv77bcftm7dKnMTdV2XRK4ltckwDEQiEaku9urVC++88w5OPvlkWrVqlUgmkzKPho0RhypKCauHnVOKWClUlV9PLezcKFXA1bCgpwb9V8lTeziyvVTD71yYIYTAl19+Ka6++mq8+OKLNG/evNZdgL4pFOKUnI0bN2LPPfeEaZoYMWIEFi1aJFKplOw6oVZLm6ZZFAJTK7A9ePDwv6HdzyC1eSt7u2zkFi9eLIYNG4ZVq1ahpqYGPp8PmqaBN4Yux5NkrzQajYKIoGkaevTogcWLF6Nfv36UzWa36eHH1XgeIdy1amFTr3vo3GCFXp2DzVXLd0oD/01YtzSaYtu2JFmO48im0ESEbt260R/+8AeaOXNmmzj1HLkBgD333FNuFvDUU0/hzjvvJG4tk0gkJMFNJBLb2ABWPj2H0YOHnXDUOoJSwMnUbOzY400kEnjjjTfEoEGD6N1330XXrl2Lmq2W06eIDRe3aeDG2KlUCgsWLMAZZ5xB//znPwXnxJRW2XnNUXeeEPJzLu3H1tY9Ez1U7vhQ1SK1NUtnh5pXx3m5rLRxWwqu3LVtG+PGjaMJEyagtra2TRr0sj2OxWIyR5Dbg5mmiV/96lcYOnQo3XPPPbj55psF227VGedm2U05CB48eNhBR7IjXAQvAtz6gFsr5HI5JJNJbNq0SRx++OFYtWqVJGqhUKislghcycfVc+yBBoNB9OjRA3PnzsXxxx9PXAzBVXfl9Ej0UJ7SoXr+pW0HvKNzH5xErlbReYSg2KHlnUbUIhOuvuSdPn7605/SP/7xD7r11ltlH7+26K6gpthw2g0RyS0sTdNEz549cdVVV+Gdd96hX/3qVwT8t6CPyaDq3HsqsQcPnZgUcsiDjYplWSgUCtIwcL7fhg0bxMknn4z33nsP8XhckryWYBgGEomE7JfFpCSXy8E0TfTo0QPPPvssTj31VLJtG/F4XHriXsuatlGKvKPzHqyEcWsqtfDAUwv/O0c4YhGJRIo6JxxzzDH0wAMP0Lx589CvXz/Yti33QG6rnEzu/UpEiMVistCEHW3HcRAOh7HffvvhrrvuwrJly+iEE04g27a3CSPzePCiCB48/G9o9+FjDhWzx6u2PVDVu2AwiE2bNonBgwfjscceoxNPPLEso8H7HHPPLs694W79nKP4xBNP4JJLLqHZs2eLzrLFVluAibVlWbAsq6gvnRcm9MAqPjdaVvNPPbWweMcDJliWZaFv3770m9/8BqNGjQIAWbTB6lw4HC4773pnwLZZTbPhliFAcXoQq5vHHHMMnn32WcybN49+//vf4/PPPxfpdFo26+VzVne58ODBQ5mor68n13XJcRyyLIts2ybLssh13aLfbduWh67rRES0Zs0aKu33oy7SlbJgc2sFPp9EIoEFCxaQrutkGAaZpklERK7rUqFQICKSr6nX3dThOA7lcjkyTZNM06SxY8eS2lNP3TeYDTO3TWir+5NKpfDpp58SEZGu6y1eEz9zy7KIiGj9+vWUSqV223MNhUIIh8N44oknip6JBw9ERHPnzqVkMolAILBN39DOAN6BqZQMqhXZjF69etEf/vAH2rJlC7muW5YtMAxDzjfLssg0TbIsiwzDkOsGv+Y4jrQf/HfVpvLawfaV3+84jvzdMAz5nS0d+XyeHnroITr00ENJtfdsd9X7UmqHPXR89OjRg7Zs2SLHnOu6cuzxGsdjmH82TZMMwyAiotdee42aWu86mhjBc2PcuHHU4WcG7+0XiUSg67rcDmbIkCHib3/7G/3iF78o2pyd91WORqPIZDItdvUnIkSjUVnZPG3aNBiGQXfffbdQG6dys9XSFjoeWlY6/H4/NE3DhRdeKBYtWkS9e/dG165dsXHjRrnNoYfOibfeegsvvPBCUU9Q3gO0MyAUChWFh2OxWFGvVM7RSyaTOPfcc2n8+PHYd999pTLYElzXlaodK/WqEKB2c+A8RHV7Lc6/Vp1kjuYYhiH3pFX7Tqp5xC2pvbFYDD//+c9xwgkn4PHHH6dbb70VGzZsENzChov/uOk9f6b6swcPHv6LDk8KuTs+NztV9yweNWqU+OKLL2jcuHHI5XKywpjDGeVs88SGtbGxEdXV1cjn87jrrrvQvXt3uvnmmwUbUrWoRd16x0PL0DQNwWAQ9fX1ePDBBwXnj3ltJzxEIhG5JVs+n5fOF5OZcrayas/g6+PGz4VCQRbgsNP505/+lMaPH4+jjjoKmqbJveG/+uor1NXVbffzeYs627YRjUZlAV0ul4MQAvF4XJJF3maObSyfQzgcRmNjI0KhEGKxmKx0TiQSReF+tZCvXOTzecTjceyxxx4YO3YszjzzTPzpT3+imTNnCtu25fhgp5+/y0vx8eChaXSKMi02NmwQOJla13VMnDhR3HHHHUgkEigUCnL3E/Zqy/18JoRsJK+55hrceeedFIlEZHK32uDay3UpD2p+GDcm5ibkrAB4R+c9TNPcpu1KZ2oDxfnNlmVJx5cVt/79+9OiRYvo8ccfx5FHHolsNotoNAohBHRdR/fu3Vv8fN6xiZtdE5HcJCAej8MwDGnXHMeRquDs2bPxve99D/fffz9M00R1dTVc1wXvSpJIJJDJZIrmubo9nzr3WyKt+Xxe9lvs1q0b/vjHP+LFF1+kESNGUKFQkJEczk8EIMmzBw8eStDRcwr53DgEwp3zARRt43TVVVcREVF9fT01NjYSEVE+n28xp4XvRSaTkfluuVxO5jstW7aMDjvsMNlGgb/T5/PJc2pttPecwtIQcVvdNw+VD3Us8oIPoCyVvyNdfzAYlPNkv/32o3vuuacob0rTNGmTCoUC6bpOmqaVlU/IUP+PaZpUKBSoUCjI9ziOQ3/729+oX79+RWzuyCOPpDlz5sjP+eqrr+TPjuMU5SGqa03putPUwTAMg9LpdFG+mOu6tHz5cjrxxBOJHYZIJCLHijpePHRMeDmFO8aTxo0bR52i0IQNgQpeNNRzv+iii6SRSafTZRWasJHlgcTGVyWHX375peyvpZ5PW/XTau+kUH1maoI45zJ5R+c+fD6f3KO8LedVpYDbstTU1OC6666jhoYGIiLSNI0KhYJc6NiOu65blm1T7RvbfCZw6jpgWRYtWLCABg8eLG1cLBaT+xQzBg0aRMuXL5ff3djYKNea0qITlSxu7ygUCnIxZ1iWRfl8Xp4fEdFTTz1Fhx9+ODXlQHjwSKFHCjsZKWQvkavSGDU1NZJcsPEaNWqUvMZCoVBW9TEbTzZMhmFQNpvdxit+7LHH6OCDDybOW2wrtGdSWDq+OGyoqrweOjdKlWN2HDpLEVJ1dTUuuOACWrlypVzsMpmMJIDcVYHJVzablRXBLdkB13Upl8vJ/5vL5aT9t22bVq5cSeeddx4xyVIVWi4SA4BkMilf/8UvfkHvvvuu/Dy2M+oaxGtSOaRV13UyTVNWLvPn8cK+detWaYNnzZpF++67L3Wm8eGRQo8UeqRQgUoe1FYx6kLChotfGzZsmBw05ZAnNpwccmaDm8vlpMfLr23atImuuOIKSqVSbeatdgSlsHSced6+h1JVkJvLd6YF/5xzzqHFixcXhYbZJpmmKUPAPJd1XZc/74jT67pukfr26aef0vjx4ymRSBQ9A96buDkbwfY4Ho9j1KhR1NDQQJqmye/hFmHqd2/vUNuJqQs8k8R8Pi8JJ9vgdDpN06ZNI95Oz4NHCj1S2AmVwu0piGzM1EXl9NNPlzmFHBI2DEN6zOX20dI0jXRdl94637uVK1fSqFGjSFUMOQTW3H3jUNn27jEraSqSySTef//9ov5gajipJVL41VdfERd3qO0i2mqwMvkrVVe97aw6D9RwsQqeL2rrk7buA7ozUFNbVCeHd2ZRXwsEAnLMH3/88fTkk0+WZYNacv5KewQyoeI+hmqfwmw2SzNmzKD99ttvl/RyqauroxtuuEEu3JqmyQWZbZVqN9n2tmS/VKWTF3rOh+Tv2bx5M40ZM4ZYxUwkElIYUO87V3azzfEKVDxS6JHCDkwKebKXqk6RSARDhgyRoQdN08h1XdmQtVwlkY0aI5fLyd81TaO33nqLrrjiCurVq9c2Rpara5u6j36/v9mCC97JJRQKwe/3o6qqCuvXr5dGXdM0eT2VTgpVY8yNvwOBQFHBkIfOQwpbeo86J9oyRWNnEAwGi8hhU85PLBZDIBBA7969acaMGWWHf8tRAvP5vCRZakFKNpstCufOnTu3qEn0rgCHm/fZZx+699575cLNxX6chkNE1NjYKJW/cq+dbbW6nrHt5s9eu3YtjRw5Ul6XOoZKm1yX5jR78EihRwo7GClkcLhJCCEJhxACgwcPprVr125TfJJOp8vOeWESpr6f7y8P0o8++ohmzJhBxx13nFQP1SR6JkSl91T92/awZs0aeS78/eWGj3cnKVTvgwePFJaOu1Ao1GSomIsv2ts1qk6gOq/j8TjGjRsnSdHmzZt3CSnkyAf/y44r2zoiopdffpmGDBlCbG84BKzmCe4sKeZr7tu3L82bN69oEc9ms0VKISua5aTCMAFQcxZZBbUsi7Zu3Sod5JdeeokGDRpEagET299SFdeDRwo9UtjBSWGpd8hqGwAceuihxDl5DQ0NkiyVY5TZ83ZdV4aS+V6zh65WzmmaRu+88w5NmjSJjjzySAqHwzJsxGpZKUHk14PBIILBoNwWLhqNoqamBvF4HExsS73lSieFrJaqXjovRn6/3+vV18EPXpDVo6k+on6/X/YDbU7lqVSVsLTwTFXHAeDCCy8kVvrr6+t3mUrIdiCTyciQLLfWIiL66KOP6OyzzyZ2ktXq7l2lwvJncWSDcfLJJ9PLL79ctJizqrkj9pf/b+kWfZzrzbZZVSQfeugh6tu3L4XD4W0iFQy2rx48UuiRwg5GClsybqzE9e7dm1atWiVzWjhxuRyj1FRPLbX/F7ey4feo71+1ahXNmTOHLrroIurbty+xAsKktSn1sBSRSATvvPNOEfHkwd8elEIm7eo4i0ajXkuaTnqUju3S0CuTmPai6KhzmM/d5/PhpJNOorffflsWsan2gdNQdpYUstNqWZb8ng0bNtDEiROpa9euVJqnqTpju5IUqR0FOFwOACNHjqRly5ZJe8URjkwms1371VSxDO9PX9oHkW3d1q1bJeFubGyk6dOnU69evUjtBRkKhbycQo8Uensfd2Tw7gec1O26rlQhuEs+AHz66afipJNOoieffBJHHHEETNMsy1vmLfNM00QkEpHFJIVCAZZlIRaLyUVB7ejP+4N+5zvfwXe+8x2ceeaZcF0XmUyGPv/8c3z88cfYuHEj1qxZA13XUSgUoOs6HMcp+gwhBKqrqxGPx2VH/+YW2EqFuiXVYYcdRuFwGHx4e5d2bPDzVceqOr7feustUV9fL9UbwzDgOI6cv5WOLl26oL6+XjqfhUIBhx12GE2YMAFDhw6F67qwbRvZbLao4IFbbO3sNfr9frlFJxFhxowZ+POf/4wPP/xQlNox/i7+l7eb3BWOuWVZcqcU0zTBO5E8/PDD4pFHHsGYMWNo4sSJ2HPPPWHbNpLJpNwFpaXrY7uqpqHwGPL7/chkMkilUqiurkY6nYZpmqiqqsJll12G888/H9OmTaOZM2di8+bNQrX5kUikaPtSDx46BLzw8dcqVHMEj0MG3A3f7/fj4YcfLro/5YRoOHxcGv5Qdz/hXQI410dtiM3tINRQs4pST1jNEeI8JPaE2AtqD4Umqpo7duxY2fdRvT4PnQvce48LEiZMmEBMCnmMtpciE1WF23///emuu+4qSlHJZrNFbVc0TZN2J5fL7ZLwsWVZNG/ePDrqqKNItXtN7brEEYpdlefbVJVvKBQq+l5WJKurq3HDDTfQhg0btomqtKQSNtcUW43YqKk83GaMlUPux1hqBz14SmFHUwpFfX091dTUSK+L9wj2+/3S42Yvi2HbNsLhMD744AMcfPDBwrZt6bGpewyrP1cq2Lix9xsKhWDbttznk71Y1aMFgIkTJ9L111/fonEQQsC2bZkPpXr2juNIz5iI5KLGm9yHQqGi9/M5qd6xZVlFvcHU5yiEgGVZiEaj8prUz2RVdHsKTSAQwKZNm9CnTx+RTqfh8/m22Uu6tRdMx3Fw5JFH0uuvvy73XuWB7IVyOodS2Nzr4XAYlmVh4MCBWL58ueDQZnva/7i2thaXXHIJXXLJJejevTtc14VlWUXtshzHgWVZUh23bXsb+/C/4PXXX8ctt9yCv//974IJGCuAgUBA2i62K4FAAK7rwnXdInu4M/aXoyRNzX2/3y/3t+bnuv/++9PYsWNx/vnnt1gBzJ+r2grVPqo2laMofE2sxFqWJb/nn//8J26++WY8/fTTwrZtb4K2A1K4atUqdOnSRc4p27YRDAbBz4/XNP6Zo22hUAivv/46jjnmGFFqh9oDt9lRUui6LsaNG0ed3t3hMC3DNM2iMK5lWdJrVX/+85//LIYMGYJNmzbJ/8uhBJ/PB9u2ZQiL/4+maZJoc/sMDukGAgEZrm6KQKoElotNAoEAotGozLdT/85GNBwOS/JX+pnlertq9V1bTwSlKhFEBNM0ZVGNWoDjHZ2n0ITnC4dbA4EABgwYIMdLWxJCdQ6p6mRThWulihgAXHzxxbRs2TK64YYbUFVVBU3TpNLJn81zNhgMStvEc5mJDL/HNE0YhiHnPxM6tkc8nz/99FNcdtllGDBggGBCyDZKdf75+3nRVAWAXXGftxcCdhynyXP45JNPxDXXXCMOPfRQPProozL1xzRNaXt9Pp9M8VGJLN8D1Q6q/SCJSNpP27Zh2zYikQgMw0A2m8Vhhx2GuXPnYu7cubIim+1Rc0qS+jf1Z09t9FCRBNG7BS1DNVrsvefzebz55puiX79+ePDBB+H3+xGPx2HbNkzTlESNvQ6/3y8JnGVZ0DStXakZHjx4aNo2MPmyLEuSAdUGsEqfSqXk/D/xxBPp9ddfp1tvvRUHHXQQdF2H67oyVGqaZlkquKreO46DaDSKWCwGwzBgmiby+bzMqwOALVu2YNKkSTjuuONw1113tVuZPZ1OY8OGDWLkyJHimGOOwQsvvIBoNArLsuS1RqNRGIYhIz6u68r7wRGhchEOhxEKhZDP52HbNn70ox9h3rx5mD17Nh188MHEgkEqlZIqEhNAJqmqsJBIJLwohwePFLZnNZFhGIac4JlMBl999ZUYPXq0OP/88/HRRx/J8I5hGNB1HeFwGLZty8ISVhHU/ZY9ePDwv2F3L6yqCgUU59yycsVpIZlMBocccgg9/fTT9Nxzz+GII46QKl8wGCwihOUq8pzjxvnOuq7DMAy5OxOrlMFgEA899BCOOeYY3HDDDWLz5s2iueb3leqQE1GRulYoFBAMBvHmm2+Kk08+WZx11llYvXo1fD4fDMOQKrKmaTIcyIRZVU6bG1dCCITDYam+hkIhxONx+f9CoRAuuOACvPDCC7j99tupV69elMlkpAigpgCo12GaJnK5XLsohPLgkUIP21EDgP+GHcLhsGy66vP58Je//EWceuqpmDVrlmyTwV4r71jAHj0bGU8p9OBh1xDD3UUOWW1iwsJqHdsL27ZhGAZ69+5Nd955Jy1fvhw//vGPsWnTJhkKZgLIjiQ35Obc2e0hm83CdV0UCgX4fD5pd7haORQK4dlnn8WgQYNw3nnniX//+9+irq6OOKLRnp4tk29OHRBCFN2jxx9/XBx11FHi8ssvR2Njo1RwmQhms9kiBZfv/fYIOOcastrKh67ryGaz0DQNoVAIv/nNb7Bs2TJcfvnlVFVVJcdBqajAiqPqQHjw4JHCdgYutGFljxPB1XBRMBjEJ598In75y1+KAQMG4IknnkAymZShI8dxZEgoHA4jFot5RsGDh11AGnYn1F09WBXi1lAcTrziiivolVdewSWXXCJzlrt16wYhhCxg4OI9zgFWw48tfb/jOIhEInBdF+l0GolEAslkEkuWLMHPfvYznH766WLp0qWCQ9dbtmwRQPvZ9aW0oMy2bZmWE4vF4LquVGMNw8Ddd98tvve972Hq1Kn45JNP5H3mg8m7qpRujxiqOd6WZck+islkEtFoFIlEAoVCAbW1tbjtttvw5ptv0ujRo8myLJlDzs+Zw/q8Znjw4JHCdgY29Jz0XFotx8nLrPqlUiksW7ZMDB8+XPzsZz/DBx98IL32cDgMTdOgaZqs6vPgwcPOk8LdRQ6z2SxSqRSAr8OCrAT5/X6MGDGCVq9eTVOnTsUee+yBbDYryUs+n4dlWcjn81Id5Fw0XdeL8tC2B8MwikLVVVVVWLNmDcaNG4eBAweK+fPnC65UZhLEDm4ul2sXDrnaO7aUxBUKhSLFMJlMIhwOY8uWLeLGG28Uxx13HGbMmIEtW7bAcRxJykzT3G6PQVWh5KgO7xTFz4hD1KZpIhaLQQiBdDqNPn364J577sHrr79OP/zhD4nfzw5EJBJBIpEoSwn24MEjhRVuoDhMxFV/wWCwqGVPJpORhmTu3LmiX79+4qKLLsLLL78sm1VzQvSuav7qwYMH7BZyWFVVhUwmIwmXYRgYNGgQLVy4kGbNmoWuXbtC0zS4rotkMilVqlgshnA4jHg8jkQiAcdxpLMYi8UQDAbLCu9ypWwkEkF9fT1uvvlmnHjiifjTn/4kOLcuEAjAsixJAtV9fduL3XUcZ5vOCnz+quKXzWZhGIbM/fvyyy/Fr3/9azF48GDMnTtX9l7kLRFVhbCpRulMztUOFJxXzhEfIQSy2SyEEODQseM46N+/P5555hk888wzdPzxxxOLA0SEXC6HeDzuTVgPHilsb2BFT933kic9EcGyLBkiVttIcGsDn8+HRx99VAwePFiccsopePjhh7FlyxZEo1Fv70wPHto5uPqXid5f//pXmj9/PgYPHiwrXyORiFSpuPkz5yKapilDjKwylvYpLMdRve+++zBgwABMnDhRbNy4UbDTygSKHVfOjTMMo8XdQCoBaoiV7S63p+EojWEYRbY0EonIKmEmeitXrhQjR44Uxx57LJ599lnZcqYl8MYGnBvq8/kQj8cRDAah67qMECWTSVnU4rouQqEQDMOAYRg45ZRT8PLLL2PatGnEjgOfowcPFUcK2SAxmVGleiZEPPC5qoqNIFfeqVJ7U95We4faL2t7UNshMKHkwhSfz4dXX31VDB8+XPTv3x+//e1vsWzZMtlTjHNW2NhxzqJ6L3nLKzZ2pcnS6r1nT7r0780dpQsN/8uecSQSoUAgIP/WVpWLalN0AEWtP8q9Nu9ov0c54OKB3WF31HYwF154IY0YMQLZbFYSPe4/yoSMbQLbV3WO8vxmm8p2QO03qDqkfr8fS5cuxaBBgzB69Gixdu1awSkpfE6cy6wqbu0JpcV4zdkqNerCYWG+p+ysu66LN954Q/z4xz8WP/zhD/H222/LPobcA5UVSVZZ2d6y7eGej7z+8drH7+PiQ7XpdyAQgGmaGDt2LM444wxJDD20PngOcs9K7u3Jc4TnCXMZ3gyC1x2em2peKD/XjtpSyMdkkL2gYDAowxjctDMajUojxUaL2x9sz4P1gCKyzVi/fr247bbbxIABA8Thhx+Oyy+/HEuWLIGmadKo8LZ67KFymwrOTVSbtPKhkkdeENR9jrd3lE4k/jcYDKJr165obGyUHfzZO2+LScHJ8Lquy1wedTyWe33e0T6PlkgjE0ImD2yb2gqu6yIWiwEAjj76aACQ4drSfcb/l4NtADuZnNv2r3/9Cz/96U9xyimniCVLlohoNCr3Ny9V2Do72FknIiSTSfj9fixYsECcdNJJYvjw4Vi5cqWs1Pb5fNB1Hel0WtqZnX1+XFUeDAZlk/WmthD0sOuhaZrgnH91BxNO+eANJFiZZ6XecRzouo5IJIJoNCptDYtEPM87IgKq8sO7RbBR5TYH7ImpapYQAmvXrt0hj74zQvU4uB8ZVwqapom1a9eK1atX4/bbb0e3bt3oBz/4AY477jj0798f++67L3r06FGk3PHnsPJQqiaWLpo7skCqW/eoidyrVq2S40Ct8guHw62+IXwmk0EwGMQXX3wBn8+HRCKBzZs3I5lMtjkB8ND2aMm2JBIJfPHFF3jjjTekgWej3VZbUfHcWL16NYYOHYpAIIB8Pl+0ldbORCkCgYBcoOrr6zFhwgTcddddgslnqVLmzYlisNNARMhms/L1bDaLxx57TDz11FO45JJLaPz48ejSpQuICFVVVcjlcjtNrjnaws2z33vvvSLy6aF1kc/nsXLlSgwYMADpdBrxeFyuXfl8XqZ48VrNPIfzPV988cWitlOqYNJhW8o9/fTTtHTp0qLN0flnIpIbRKu/ExG99dZbtMceexArVJ1h0+j/Feq2Vk0tKGrFovp6165d6ZRTTqHRo0fTrbfeSn//+9/pzTffpHXr1lE2my16Xq7r0q6G67r05Zdf0lFHHUUAdksOJG/lBwC33XabvG7e4NyDh+nTpxdtWs+FF20BVp4AoK6ujp5//nk5F9lW7gx0XSciovr6epoyZQp17dqV2KYEAgHE4/GihtmqeuGRw/9WEauRFN5ilBt+8/3r2bMnTZs2jbZs2SLt387Csiz589y5c4nHJUd8PLT+2rv33nvTypUriYi24TbNzVVd1+nFF1+k//u//5NbGaopTB3t2fEcGDduHIkLLriA5s6dK4444gjq2rWrlLl583WWuevr6wEANTU1+Oijj7B8+XLRlLLkYfsEh/MVmvMyOAeJiBAOh5vMPUkkEujWrRvV1tZi7733LsohVCsKd/SZNPU8Fy5cKNLpNKqqqpBOpyVJy2azUl1uSxx55JG0//77y7QGrwF4x1/Ut4d33nkH69evF5qmIRKJSPWFVbq2skuxWAyFQgEAMGjQIOrWrVvRXrs7c/2u6+Ldd9/F2rVrhc/nQzKZlIUU/B7OV+SQ9c4qlB1xHLG9Kh0T3HeQ96bv06cPHXzwwVJ53lmVUtM01NfX4+WXXxYAisaph9ZHTU0NcrkczjjjDAoGg9i0aRO6d+8u06A455DXZp/Ph4aGBixdulSwAl+6Fu+Ota+1SaHruhg3bhxh6tSpxC+yAeMy+1KywujatSupsquH7RPB5sBeKnv9nNOgQm26GgqFWiWPYXv5her5cChFLUxqbbBHxtt5qZ69Bw/c309Nb2jrXC2ek5z/yvuc72pizBXK6uusiqpzYnuRic5KCEvDwNwovLnnuSuVILX1DLcb4nHioe3AzzSZTG5jI/x+f9EY4Tldutao62NHWodUpTDw2WefycGqNvXkPXu5mIF7MmUyGWzevFl0tJvSWlCTW3mfU/VBqNXE6gDl6uKmPEo2JqV7gfJrO6K0NPUeVS00TROJRELm13DlbygUahNvl3My0+k0gsEggsEgCoWC3LrKS1Ho3OCmzTxO1KbMnAPd2saUW8zkcjlEo1FomgZd16VN3Rlw4Z/aSoaJYD6flzmU7FyqXQs6mpqxM4RajShwjiEruWp7GlaEbNtGVVXVTreN4ZxC/l5utq2OWQ+tB7YBPC8DgYCMcqVSKcl3uCo5Ho+DiKTq35TDwBXoHTY6OmHCBOLqOSaHqhrE7RBUpagpRctDeYSLjZD6eiAQKPIeS3ML+bXteS274jyb+jz2rpq6jrYkZKrnzj931OovD9uOs+1VzfM4UOdNW+UUquStqbG6Kxc3df7zz6VqE5NDT4XadgyV7orCz4ydTX7vrrQravRN/ZdJooe2W395zqhzleeJ+sxL5xbPqZbWxPaMIqWQN1PnC1QZcqknwx6Pl6+yY55i6e+l6oV6P0v/tj1vcld6Ks19FudRNNcfrK2g5nPwz9447HzzpynwOFDnTlvnbKlKVGv0oGvOLjT1uqdANT2GSscSPzP12bEKtKu/m9dVdX3t7CpuW9sPnhfq8+b5oz7z0rlVOqeaWxM7DEH0ho0HDx48ePDgwYMHjxR68ODBgwcPHjx48EihBw8ePHjw4MGDB48UevDgwYMHDx48ePBIoQcPHjx48ODBgwePFHrw4MGDBw8ePHjwSKEHDx48ePDgwYOHr/H/AdOGk/XE3Yi1AAAAAElFTkSuQmCC"
-_LOGO_BLACK_B64 = "iVBORw0KGgoAAAANSUhEUgAAAoUAAABQCAYAAABvRQ9hAAAw/0lEQVR42u1daW8jx7U9JHvnLlEzE9sJkDgIkORT/uH7j0EQBAmQBLbHljQSl17ZC/k+OKd8WWpSpERRXOoAg5mhKHazuurWqbuc2/jLX/6yBIDlcglC/vut0Ww20Wq1YFkWms0mlssliqJAnucoigLNZhO2bcOyLCwWCxRFgcVioX6H96vf82KxwHK5RLPZxCXDcRyMx2N0u101HmVZotlsoqqqZ8fH930AQJ7nqKoKrVYLi8UCi8UClmWhqqo3/w6NRgPNZlPdK69/yHlqcJxoNptot9uYTqcIggBRFMFxHDW/33qOLBYLeJ6n1lSe5wiCAEVRqLWh30Oj0VB/b3N/tm2r75PnORaLBWzbhm3bmM/n6hqWZcGyLMznc1RVBdd1D7I+3xPSHnFMOa4c21arhUajgcViocaD+0dRFOp93IsAoCxLZe82gTaV19Xt0nK5hOd5mE6n+PjxI6bTKQAgTVP0ej0URfGm48P743jYtg3HcVBVFdI0PZn9keMr106j0cBwOESapoiiCHmeo9FowLIs9dyWyyXKskSr1VJriL+/zf63zfwjDynLEovFQs0HOS+PeVwBKH71pz/9CQ0AR7OzclGSADQaDRRFsbJwGo3GE0NgsHlMG40Gut0uptOpMljbbkiWZannoP/etp9hYPCWsG1bGftD24RWq6Wu7XkesixbOZDleb434+04jjqIbbqOZVkoy/Ji58MmGyUJEseKTgeOK+eQfLavtcF0ZNi2jbIsD/p85BjQyUIHyzmsfd/31QEojmN1UNL3MY45x6DufS91WCyXy5PmI5yjf/7zn2GRKZMxvtfNcKGSabdaLbRaLbTbbZRliSzLlLeKJzjbtlfICk8G8lRhiCPw4cMHtNttRFGE5XKJVquljMRz48OTJok4f1f++61PunXzc93rBpdJAK6urjAej9WBsqoqdfp9a5CUSXJIrwG9CHVzl7bque9XliWWyyWqqoLjOHBdF67roixLxHGsPIf8XG5+fM85Q9of6UnifkJ7x3nCZ0Sb5jiOItuMTtG2bUPqpVdS33sksWSE5vr6GuPxGL7vI03TZz2R+xgfXmOxWKzcHwnNKT3fup9HUYQwDGHbNlzXhe/7qKpKPUuuTcdxlDNpGy/wNvA8D4vFQq1ROab78EQekodxjK33Jk36SYykjyy+3W6rgaaRp0v4kk/Du25aNEo0DiR72zx/+YzkmJvxNzgWUuh5HqqqWgnhyXDhW98DD03cqN4idF2WJcIwhGVZCIIAQRCg1WohiiJ1bcdx1JjswxNyDqibAyTXaZoq0iA9iAyvvobE0Nby2XieB8dxVPRLhjPfEiSD+qFh3dicog1oNBrI8xx5nsP3ffT7fXQ6HURRhLu7O/Uc5J99kSlyEXk4kHbglNZInuewJPuu+/dbk8Z1+TZEHMdq8D3Pw9XVFZbLJdI0RZqmT05m8pRoAHVa5Rgx1MaT0nPjxFwlTnCZ10e3+SFPi5vmisHlwnXdlROv7jl6y7nJXK1ut4swDFVoVw/jvuRe6OnhAa6qKpRliSiKkGUZgiDAp0+fkOc5xuPximfrUOvzWIhBne2X3r5Wq4VOp6OI2Xw+Vw4GGV7lWJNM7XoP8j4kWb+6ulr5/EPNT6YQ8X5O0W5umsf6z9I0RZZlmEwmuL6+xtXVFebzufKq83nI5/5S1K1xPWp5CuuGe7plWbDeq8BEP+nX3YN+w2maoixL5fJ3XRfT6fQJcZUPxQAqxE6jwPHa1pshn5Ec6/f2Mpvna6CfdOXJ/BCFJkxYr6pKJfGz4EX3pL/0Xvj5uveHnhEACIIAw+EQSZIgSZKLOxyv+56SEPq+r3L6kiSpDQ3rRSvbjt+6VKVms4nhcIiiKJCm6QoxOZQXSb+vc5oTJHcku8yBz/McWZbhxx9/VGuy3+8jDEOUZbm3XF/uqdI7+N6c6iXrRnIm6xi8WPrA6l4qLk4+TFb4tdttdDod5Hn+JFRiiOHTcQagqiS3TYyld/FQobhNJxlDDA3WzW1ZVcgN+hCFUPTkVVWFMAzheR76/T6azSam0+mTnOlNB+Lnvht/R1ZWNhoNTCYTTCYT9Ho9fPjwAUmS4OHh4ewrjzeBOYN0Iti2jUajoapUpe2T1aK6U+Kl84cFLJ7nqfzBOI5X5ukh7NepFwM+Z/9J7rjOZPGM67qYz+fIsgzL5RL9fh+9Xk/NgX3eI8f51AsxG43G+5PCOterNKD6aZuEhifir776CkmSqLCKQb2BlAnvzNHchhRKOSAZjjrUZDekz2AbUsjDjgyPHWruyJBUlmX47rvvYFkWBoOByver8/ZtA1kYQeKi2zmuz9lshiiK4Ps+ut0ubNvG/f39xc0HEudWq4V+v4/5fK6iTHV7jbSDcu68NBLCnE/P8zCZTJAkiXJaHLoyXCcm6wr2jt2TtQ7SUyjXCesSON7z+Rx3d3ewbRtXV1eoqgpfvnzZy9o/Jc/gVvYUwP9ty4R3YfF6ZRNdu9I1v+46m3It9EEPwxCu66LdbqtqI24UhlD8jF6vh1arhcfHx5WcwG3yHaqqwocPH7BYLJAkyYpO1KEIrckdNKizD9z8l8slhsMhJpPJwednHYHj+uJh1fd9BEGgKonr7o+eJWnjts2TlrlLjKiQiA6HQ7RarRU9PuYo1lXL7uKlOSSY16w7B+r2J+ae39zc4Pvvv3/iGdzHBs7cQHkflmWh1+shCALkeY7pdPrkMHBKahjH8vw33YeeIqKvk7rUMs4Hz/NQFMVKdbq+Pp6D67pPomjcYw/FP2gDJedhhK/VaqHX660oEbTbbWWPZJ0A37uVp7Duy9UVpdQ9HKkLpZ/IpLi0XrmzC6bTqfJo0WtgvIbngXV5OqaY6PJQ97xlxbHuGTmG+UExfsdx4Hme0vxkkjtDi7RZ9Oq/JB+yrupxNpuh3W7j48ePyLJM5VQ1m01VcKGTrToPyHuh3W4jjmOUZalkd0h6WTTHZ2/bNnq9HprNJiaTCX766ae9klJJQqRd4rNlmk0cxypkeSxrZl3xw6ZQ57HY103FqM/do/69+PxoNzzPUyRRSslwLWwj2bbNnvWWhJlC9fP5fEWA3XEc+L6PLMtU1KLRaGAwGGA2m61EMtI0/aUpyEtP61KXaRM5fG6wNg3gNjF5vqcoCjQaDbiuqxjzJefUnAukDNEpnrYN3sZbyH9LLUCe+I/pQMgOIzTYvV4P/X4fWZZhNpsp2ROZWy1JzksFhkmWaAdZnS1to8yr4kai5y++NzGI41h55DgWjuMAgOpgwVDtYrFAGIbqe+3j/vkMpPAxSftisUC321Xzjvlrx+aQkHu2vj9Lp8wuZOs9vYS73ps+D+Qac11X5ZvqZH/bIkxGRfV80UOM43K5VISQ2s1sVsG1U5alOvyRRLLjUpqmCIIAvu+rebtV+LjuIW3yHu7D7axP5HWQwso8BbTbbSVUaYgh0O/3Yds2Hh8fX1Qu3+/3VfXcoUMK6zwWUrfS4HI9hwyb2LatCNYxeZCZpkGvA0X46dXSlQAk6d11btetTdkeryxLJe7LcKwsyNEjOceSKM9743onIXMcB9fX12i1WsjzHEmSKOK4L/sgmylI/UvXdTEYDFRonp00pMf6GFKY9Bz9upzCOgFwKWPznuAY6kUcr+EUcgyY3uE4jpIokhJQ2xwa5Lx4bj2+xfMty1IV5C4WC3z99deYTCawbRthGKKqKkRRpNZFmqaqLqPT6WAwGMB1XUUmrZcs0E0/e67zhO6u1hW/ZRh5mwmgPwgKg7IKkMmkJtR42tC9QKbN4WWgLlVAX8tFUSCKotoq3WPw2jCfmmFPKihYlvWzEf6fNzHP8yd5ci8hhnVedb6epimKooDruuj1ekq5QXrXDtU3ehvQCyK/C/tdM08qSRKlDckNnd6RfRF7EgAWsDQaDWRZhizLVsZKPrdjdEhYlqUIT51O3zpplfeCHEOdvL5kfcsqYX5+XS/xbcE1WzdWh9LwpY2sqgrffPMNPn/+jI8fP+KHH354Mgd1cp0kyUoziyAIXl9osu50uuk1NpGWKvKvmYQ68aSR46Q5plOv8RTuTgosy4LneQiCYGXemAKUy/AG1s0Jem+YS7ypivS9SU1ZlmrOWpa1En5khWQQBE9y5HYVn5aRGt02S48RPYd6/1+Glo7JTjL3i/mEFIG2bRuTyUTJvMj7f+n4rbM/JPVBEKDT6aDVaqnmCZJ0H7rAYJc5wX+T/HAe1jlrjuk7yGeoey9fco91v8PQquu6aDabam1s42ne5Fk95P60WCxwfX2N29tb/OY3v8F///tfledaliWCIFApdtfX18iyDP1+Xx2meVhwXXd7T6E+WUjsaGSeOxVJ0keRV5I2en3q3NjPPRTp5pVx/aIoMJvNasMkBqcDOTfYj1RKj8xmMzNIFwIaX3pr+G/KT+iagMew1nlfupwM53KWZYjjGGmawnVdpXE4m8129lrUbewkmrIHLm1klmUqD5u52MyN023rez5zPsvRaITlconpdKryCev06eo8pq+xP0EQoNfroaoqTCYTNT7MN6wL9x+Lp1r3sJMA8VlLzUuZvnAshUa8H8uyVC7pfD5Xzp59kH6mdUiivO3nSkIlvY/7nIPb3L9t23h4eMDHjx/x73//W3VX8n1f2Rs5H8iJmH7hui5msxn++9//vo4UMp7OBbGt94YGkSrzRVEgyzLM53M1abcdTLkQ+TCk8dNbChlSeFqQid5hGKocHoPLgAwfywOoPKHXpRIcU4W69CbRBum9dWUFoOd58DwPlmWpNp/bjE8dEZBrpa6Ks9lsqjAou6I0Gg2Mx2MVkn1vUtDpdBAEAbIsw3Q6Va/rreLeQi+OXhX2z5WbPQnhuurtY1TAkOtHNiWQZOGY9klJsFzXVV5tksIwDF9FNuX3zLJMdUpjDu42pFuuMb27ySHWB9d5EAS4v7+HZVkIwxCO4yBNU7RarZUuR4+Pj1gulxiPx0/2WQBoAFhua5z1RTEcDlFVFWaz2ZOw5C4DwjY0PKUyEbKOjL7E4MvwTJqmaoD076R3+tC7CZwqfv3rX8PzPPzzn/9cGc91ngC9uvPbb7/F4+PjyiQyBNvAYH/El6FPaRNd11XeRBmqlOtWFkDIzU56f3bdIC3LUtcej8cbC19k1fRz+wbfr4ep62y84ziwLAs3NzcIw1Bp/r3E9tTZdlkIIsev2WwqUm7bNm5vb80EPTLQqcQ5wlC+7PO8i6dT5tHy2U8mk437/0tzfo8VXFP9fv/9O5pYlrWSeN1ut5V2UJqm6lQjvX91xnHTBCrLEnEc4+bmRmlzFUWxkucoE4N1N7DZtJpqrKTn1ZBCA4PXQ4btuKYYEmeor9PpoCiKJxWuMjqiE5xtD7U6eZStML/++mvc39+rkKn8zE2fT5vBz+KmK99fRygZgaK9Z7L8S20NvUp14sL657quq7QksyzDZDIxk/PISItcGywmGo1GGAwGuL29Vc95FzknuY6KooBt2yr8uu7Qci46uSyAYw7lcDjcXpJG7+kHAL7vY7lcYj6f1+oVbgNpEHSD5nnekxDGOlX7TQaPf1Oc0XVdLJdLlVCq3++5hZr7/T4sy1opNNl04paewuVyiZubG2RZhiRJVjohGBgY7G/T05PoWRBCLT5qDdKI61IpzCHUvYcvAUPyk8kEg8EAo9EIAJQ91iNDeleIdXI3Muwv7b9t2/B9X0ljsDXZaztF6JEg/bq8tpQxYzjdHHqPyzGh7+tSzol5dXLt7PLZnMfkCIPBAGEYPtkvz23f0/nXfD5/f08hHwo9evQaMqQsPYQyvLFLyT8NE3Ws2BeUBo5aVNLtLBvdm82qXn/SGE0Dg/0Z57rDKO1UlmWqb2u/38d0OlXdCEh29IKLbe1XXc95bqzNZhMPDw+IoggfPnxAv9/H3d2d8mLqBFCP3tTl3OnhY9kGkKFyGbXZR/GDlO2Qr/m+/0R8WoaSjezVcUBv5ci54fu+6i3d6/VwfX2NKIoQRdHWc0XPAeQ6Yrehdc6Sc9rj6VHfqfr4rcBTre7qJTnkCXKxWCgBxk35cDp0N3JVVRiPxyp3hLphNGqGCG5ePMfUQszA4BwMsp7kL19jMQNlbJjj1ul08OnTJ3z58kUpOOhelV0ITV27M9mqdD6f47vvvkOn08H19TWSJFkJr0rbICsdJWnVw8dShULXSwR+ziuU0jl1RPa578hxk9dlziSvH8fxSkHPc3mSBu+z9+jPvtFoqPqARqOh5FU8z0O73VZ8YZsDGfd98oqHhweMRqMVUniOETJ+X6bvbd37+K1PyPKBsyScIRKqx1OnirpU2z4cGlW9SpHVYcPhUMk/SCNouqHUL0gDA4O394jIHF62pZKkhd5DHphpr2R7u32sb3lIdhwHSZIgiiK0Wi18+vRJ9VKW5E1Wh9PWyjxwSQapOqFXeq5rV7hrb2bpkWy1Wit6kHoXFEk4jM07nkOTfujQCZrsiR3HsfL87kqOSAq5huq0B2XDjXOYI/LgU5Ylfvrpp/cnhXrVHA2BrAhKkkTl1BRFoQzQtt5CaprJBGleK89zFUKgurcxDE+fjxkLA4PDHLj0og9ufPy/PKyGYYjhcIh+v488z3F3d7cSlpWejpegqirl+aMXj/b07u5O5eIxIsOCFP2AzQN/p9NRxX4kthLsYy3zJl9zSOV7HcdRFcVVVSkyKvcIfl/Z59h4C9+fFK573kzxkqS+2WwijmM1157zFkqJKP0gEkWRmi/n7CCi7qsS7T7mkwD/H8cx8jxHt9tVD5oh3+fA6hpOGFlpZFkWptMpbm5u0Ov18OXLFyRJstI6xmD1BK3nF5oxMjDYrx2Uf9NTVyfOzPeNx2PMZjO0222MRiMsFgtMp9OtCOEmrwcrEqXgNokTbSgFctk/lqFmHq7pcfE8TxWRxHGs7Kx0ANDbI7/jOhsvnQbPfT/P8+A4DqqqwnQ6XdkP6C3RcxhN+Pj4PFnrirHkQYXrhL3FtyGFvA7TFYCf0zPCMEQQBOrn5xg+ll2AGo0GhsPh8XgKn7vxsiwRRZFqRVN3kuDJTpI/aWT0RU4BzPv7e/T7fXz77bf461//qt6r5+a8RAPpWB661I/cpDumb0y6UCsN8Xt4UiUxlQr8BpftaZPeIF1M9pQ9hiRgm97PnOyqqhCGIebzORzHQbvdRrfbVb3f9UPuugiAXnAi7WfdvTQaDaRpqiIu7XYbQRAgSRKkaYpOp7Nyf3VC4+uqRfX2Zrow8KaCFhYq9no9hGGI2WymrqFrFq6bTwbHu9briJ2ebhDHsYouMm9wkw6xzGeN41hV/VPsWe8IdC5jKtfPp0+fjqP6eNubZ/GJ7gWU4WBi24IRVj1Pp1P8+OOP6pTB5G1dy7DOgJ77QmT/YbnhHsp4ep6HsixVOGldA3eDy4QkO5RvuSRIG0cbSRLGvL+Hhwe1bmURSF13IL1SeFtvGTu08PDITVi2MX3pYbrO7vKPrnvIv4MgQBAE+Pz589H1czZ4e1DOyLZtxRl2qUWQa2BdjcE57f9cY0VRnAYp1A0VNQzpHo6iSImk8guymua5VjXys+Wp2nVd1RuUnys9bKxUvoSWa9Q/q/PKvjVkzpFlWfB9X4WDjqG3qMH7Yjqdqg1AHhrOrePALmu1KApFCsMwxGg0gud5eHx8VNWa8sAnvYO7bnLy/TKsTDvNDVn/7Nemn+jeHn6XwWAAy7IQRRF+/PHHJ/PBhIXPd97XrYPhcIjlcqlSKeS828ZpRC+jjnOpO9C7lwE4DVLIEyBPmuxIUlUVrq6uUBQFkiRRejskEttWp0njQqLHMMh4PF6bb3MpxoU6UPJ0dMjFINtuyep0Pene4PLA/q2sjJWHlUvyDukbFD1zlmXhy5cvcF0XV1dXKneannfdKyLJ4S72TSd5Uu913Sa+i9dmXe45bTb74tJW6QWLdb9rcD6EUFbt68+5rop4W6xrL3muc6nZbJ4GKZRJnvLhkgi2222VwEyX8a6EgXpWPN2WZYl2u41+v79SJXeJBRYPDw/IskyF03dVjH/tgcC2bSU7EEXRSqsvg8uG7/vqECfX5aWsT/2QptsnRlDm8zl+/PFH9Ho9fPPNN0jTFLe3t7Wbm+493HZj3rXv8q79i/WNnj3tGdpj+Jpg4cCm/rWGJJ4XOeRz5bN9fHzcWFewzf4jW7ue65jJw5x1ajdOzwDb2sRx/ES2QObPbFOdxnCzfkIAgNFopHJX+Lk8kazT0jo3yJCTXBiHCCHT2HOcdb02Y9QvG1ynlDIxG3291xD4OT83TVP85z//ged5+PrrrzGZTFTkRW4M24bHnvPM7qsLkt6WTqaQMIWANoF2X7fpvF/paDA4fc+W3lShTtLppeh2uwCgnCKH3Pvey2YcPSmUulXAaoUQDQFb2rDqjoKq9P7tQjzlJErTFI+Pj8jz/OAFFsdM0A+9IPS2WPI0aMLHBiQ8upfgUgrB9P/rr9GGMtrRbDZRliV++OEH1Red2oFSZ/Al19+VsO66F1iWpQ6DWZapTiSyQlmXl+F9Ghmt85//daRR1gLs+uwty6oNP5+L15CkWqqKHD0ppGyM9A5x0VNYknmAZVkiCAJ4nofb29sVcdJNJ1AWjbBSjhMhz3NldGzbViRTCqteCilh0Y50ox+KGK4Lj5kiEwMaNoo7X2orxrpcKl2qQxbfcO3OZjPldePPeADexr7VhezWdZ54DZg3SJsfx7GKFsliAP0+6mR4+L5Lst/nTgrXSZWtKxLZ1j4wlYz7npSmOQfIDm/K6XNqpwG5iGkM5Bcbj8dwHAcfPnxQD5/FCTR0hNxIJMFgpxP5/qIo4LouOp2O+h15L3XCzsf04F8ryyDH5z03W5MsbqAbeLaslGv7nAz3tmv8Oa9hXfEIPW5hGGK5XGI0GmEwGKz1wpNMSQ+M/Ox1RXnrqpvlc5JFIRLdbhdXV1ewLAthGCq9w0ajsZLSo3/nus+S92QI4XmRQ13HclOR0zb5riSA9EyTbLLK/lzlr6xz+SIMaaZpii9fvihF8+l0+sR7sK5LwHOfza4BNzc3SNMUs9lsrbCqgYHBYQ+M8v9mDdbbsbp8Q9rHOI5RFAU6nQ5Go5Eq3GPHA5307WOM9YO1ymuyLHiepw7sj4+PK2FhEj69z/K+78/A4OLsxDl4CvSOHXEcqwKUIAieGJ5dKokowsrfy/Mctm2j3W4rT2PdPZlOGwYGh7MB69rEGazaMv0P8DRi8vDwgPF4jD/84Q/KK7irp+Ulz1A+N8pQlWW5Eh5utVoqjadOTHjTgcHAwOBCSCENgDxBFkWhQiIUUqXHb9e8AJnXmOc5Hh4ekCTJihyCvB89tGJgYHAYUriOIFwqZOpMHVFiPrZs4dXv9zEajfC3v/1N5WofIn9YrxrN8xye56m+yry/oihq80hN20sDA0MKV4yVXoxQliXSNFUhX9d11c9ZkbeLsWIyd5qmiKJobZWbkTswMDj8oVD+35CDX8hVXX9jHpRpw6qqQqfTwe9//3ssl0v89NNPSnJL7zG8z7Fdp2tYliXiOFZt+6gsIQti9BZ/hhgaGBhSqE677M1bR8iyLENVVbi+vka321XJ1dsaD72RNo1SFEWwbRuO46g2cNJAbUp0NjAw2A+p0MOhBvXjJDt7SFLlOI7SY/3Xv/6FKIrguu4Tnb9DpMXIazBHnLmNQRBgMBgoofJNaUCGGBoYXDAprKuqo3GhZMHDwwMWiwV6vZ56z7qcwE2eCJJEabharRYcx4HnecYYGRgceO0Dq9XxZg3W2zFdksWyLNzc3MBxHHz58gVhGMLzPCwWC8znc+WVqxvvQxFDRnSSJMHDw4MS23ZdF57nKd1CAwOD/eDkq4/1riUyNwaAyj9ZLBb4/PkzhsMhhsMhZrNZreJ9HWSYWG5AvPZisYDv+4pksrWS8VwYGByGFHKNmvBhPaQtchwHnU4HQRCoVnckjfP5XKXJ6PZRhuhlZ5B9ElY9jCw/X3aeIimkjtwl9aI3MHhLnLynUK9Aq6tKkw2twzBEHMewLAu+79d6FjZJHNRpJmZZhsfHRzSbTXz11Vequ4LuiaRI9iFPtuv0wU7Jw0GPQafTQafTWWlpZnDZILmhPBTn/KVp0NXZFVmMQTL44cMHjEYjFEWB77//XhWSSFKmp+Cs0w9klGTdmuV96b8rIy26jZX2d1PnpPl8jslkAgAYDAb4+PHjSv/r5XK5kjfOHEoJFq8YGBj8AuuSvqw0eMxF8jxPtX+i8dj1xMnP+PLlCwDg6uoKy+VS9QyWBJObFY3UtlqJxtPxSw6U8QgYEFLAvo5cnHvBF3P/dA0/qS3IIo1ms4kkSTCfz1FV1U62bp3+H3UCST5lYYoUwG40GqqVHl/jvevPaRdZoSRJUJYlOp0ObNuG7/uq61RZlvB9H2markjasIBm20iRgYEhhWdMCvUqxa+++grj8RhhGD55v+M4WxkOmc8UxzGSJMFiscBgMMBkMqk1biYxfvtnxvHiOMuWPAaXjTzPN3YuOHewlWfdwROAIoP0CM7n8606fmway7o8Q91OsvguTVO4rouqqtS9kkBu04b02Q3MspDnOR4fH9FoNDAcDuH7PqIownQ6RZqm6rvqXVoO3cPdwMCQwhMgG1EUqZN0FEUreofbniRJVvRT+6dPn1STedl/1PTcfBnMmBlcIvHbBtLb1mw2VT/jVquFJEkUOQKeqinsSgjltWzbVuHnRqMBz/Pguq4K1d7c3OD+/h5pmqpwLqMj7Kde9x12sQny+4zHY8RxDMdx0O/3UVUVsixT15FdXQwhNDAwpPDJaffh4QGe56k/MtF6288hyePJl10AfvrpJ/T7fWWYaTwZugFMKHSXza6uwtyQAoNLBqMZsjuJ7/tKtPrh4UHlMnMNvfRwJRUXCBK8VqsF13WVFmyappjP50jTFN1uF+12G4+PjyjLciWEq5PPTbmG6whrVVXK+8jK6fl8Dtu2cXNzA9u2kSTJSmcUYz8MDAwpXAuGVWgoaDT1yuZtYdu2OqEuFgtlqHkdEzp+OTHUNygDg0sGoxmWZSl5lrIslTYriVNdwdlLSFFdRxTZLSqKopU86fl8jiRJ4DgOBoMBlsslJpOJIod1/ZS5trcJ7+p97GWudlEUuLu7g+d5SoqM6T2GFBoYGFJYa9xoVPRT6y75Jky2pkGWuTJ5niPPcyVZ02w2V8LJBrsTQ0MIDV5DbM7t+zNkS1F+aX8Y3q3rSvIaQsjexOwtT++cDNM2m031/6Io8Pj4CM/zMBgMkOc5wjCEbdtPCoV2kRVi1EUvrmk0GnBdF1mWIYoi5bHs9XqqWt0UmhgYXCApfM74MSeF/+50OhgMBpjP57i/v9/JUNYlMZN0pmmqyGGn01EnWWOYnh/fdRuEOeUbbJoDl0AYf/e73yGOY8xmsxUPGEO00oOmt+J8KVqtFoIgQKfTQZIkyLKsVsFhsVis9JunIsN8PkcQBPj06RMmk4m6L71t3baQ15LXY9cqhpjDMESSJEqqx/M8zGYzs4gMDOT6BvB/L/XU+L6vBE/lxn1Knhw9hyXPc2RZBtu2MRqNEMfxk97H/Pc2m5X+u0VRYLlcIggCDIdDdZIm+dHHkaGZOiNpWZY6FdfdDzcG6iYmSaKe4y55k+8JqT1nYFA3P+pCmqcyb15iK5vNJoIgQK/Xww8//PAkZCuJkrRHdSHkuvHTO4rIn/f7fYxGIyyXS9ze3q4UcdQRurrxp52NogjtdlvZKX2PIcmTUR2+Xkf41+mx8rOZTynH5ebmBsvlckWrkXZ307ise4/BeaHb7SLPc7W+TpXnbGuHbm5uTE5hnSEpyxJpmqKqKriuq4icNCb0AD5nFOqEsBlmieMYo9EIWZapxGy9Go+haRpIVuzpgrN190EvqCxqObUQrNQ8k89MGmeD816fmzzFcn7o3U1O7fvp+X66t48C7q1WC3Ec4+HhYW/rS1bwyvtg7l+73cZisUCWZapobh+YTqcIggD9fh8AVHMBevc4NrJQhmT2pZ5gksPlcom7uzu4rovRaISqqjCZTFYaIMi88uVyuTJORg3B4BxhCk3WGA2StG63i7IsV07iu0g6SBKmb1xVVeH777+HZVnodrsYDocqWTsMwyctnqRWH1/Tk7WlsaRhlbIN0kNwKkaNpFiO+S4CtwanTwyf85zJ+SHX3CnMjzoPlcxz9jwPnU4HwM8SWgzVvrQQToKfoYtfcxx931fEVLeD+1rbtLWO46iCFKbWyOvtsw8zPYay+4lt2wiCQAlsS6Ft+Vzk/Rj7Y2BI4YWRQ56KWd0ndQh3MfoM2cqwFl8ryxLj8Rjj8RgAlMaW7/u4vb1dqYhmyJhVzXpOop5QblmWMrbyd0+p+ll6DUh6+cec1s8fz3kK9SIFSW5OzWso5/lyuUS32wXwc3SBRWt1a/015EgWhfAefN9Ht9tFs9lcEYGWB0+KYu+DEPMgnqYpbNtGt9vF1dUV7u/vVyqp5QF7l2vUvZ9ksCxLTKdTJavD9qdpmioCrs8jE6EwMKTwjDecOrV+vkaj1+124fs+xuOxMpBsobTNhsYNTL+ePInyhE7jP5vN0O/3leYYfzeKIiRJsrJBWJalNkEpwF0Uharyk17GU9kw9fCNOZkbSEivVh3BOpXvQGLEOe55nsq3C8Nwxc5YlrVV6sou40eCyQNks9lUaS2yWGVfZFS/B3nAK4oCcRyjKAp4nqd+xj8v8QSv00CUNrGqKmVX2+02giBQNlTmlJFIGltkYEjhGaJuM9ETinmKdRwHnuepUIqsuNuWdOrXk5IMdZpd9B5algXP8+D7PoIggOu6sG0bYRii3W6r3p8MMdML6XkeLMtSBp75iKfSc1mGtYIgUMaa3RpM7+jzBg9S69bu7e2t2rRPLWwsvyMPQJzXTCOhmL708kvZl9cSNPkZvu+j3W6j0WggDMMn9k2/3j5It97VhAdgStzQe9fv91fu6yXXpk2ss8W2bauCk7IsEUURWq0WLMtCEAQAoOR+jM0xMKTwQokiG73P53NliFzXRbvdRp7nz3oJ152qZRhUNzDSaFGIVVbrRVH0hHBSIFbPe+Hny5P2utP5MXtRmO/TaDRUT9NdtMwMzgN1BRm2bav2abKytO69x/y9KHDvOA7KskQYhiu9vkmOpXzWPjx2ZVkqmayqqjCdTlcKW2S7T0lG9+W152dS8F8SRNd1VVcUx3Hguq7yHJZluZWcV92hXNoNEt2yLFdsL+1lURRKwkb30JpWeQaGFJ7xZlPXwomEi6d4eiTa7TZ830er1VohadsaJ0ncZHhUvwcaK2nEpMeAHgXg5/wXvZBEhtb4GTS0p2LMeJ/c+LkZ8DuZEM5lEUL94KZ7Ek9tPjSbTXS7XaVdOplMVrqUMMdQFo4R+yg0ubq6wnw+x3g8VraG11tXYbzPNA5eSw9R0/ayjd9kMlH2ixGDPM8xnU53JoXr/tbHlt+TNr7ZbGIwGMDzPIRhiDAMzcI0ODtcvE7hLoZO1xpkaFaeHnUtQykau2lz23ZTkyFmmYNU933qEvBPsTCjrmOCgQHXQFVV+PTp0wpBOLQOp77OJbmoNbytFnzfR6/XQ1EUGI/HiKKoti/6uu+hvy7tTZ09osRNq9XC1dUVfv3rX+PLly8rXkddLeG97bBO+mXO9WKxQK/Xe0Jgt5Wr2jRHZCGg7iTI8xy2baPT6TwZt7pnIO/rOX1bg+OC0Sk02Brz+RzL5RKdTgeu6yJJEiRJoqqCAdTmnhjPloHB+YCbvwxb62FIGfZlqNh1XTiOg9ls9qQN3UuMuR7KZEGEtEHs2OR5HvI8xz/+8Q8lTl1XrHOsh3cZSXl8fMTXX38N13Xx+fNnZFkGx3HQaDRUR5M6IriLpJhOUouiUB1URqMRkiRR4X6+XqcHawrlDE4BhhTuYIz0Bc5TY7vdRrfbRRAEmEwmKzk5dVWCJuxpYLB/ciYJ0qFO8evWsiQADE26rovBYADXdRGGIe7u7tbaml2uX9fXmOSFBJBaqI1GY6Xv7yl63mWo17Zt/PDDD2g2m7i5uUG321XtSZkqQ4JMYkxyKHszb7qWDpmf/fDwANd1MRwOURQFoihSn6lH14zdNzCk8AyJYV1oJ4oixHGM4XCI6+trJEmyYhzWbVwGBgavJ2XvCd3bVOcNarfbaLfbqKpK9SmuK5KQuYMvub4MYUupmV/96ldotVq4vb3FfD6HZVmKMO1Cht7L5m5CURRwHAeLxQK3t7fwPA+//e1vMZ/P8fnzZ/UZetTmpUUiuv1m3+dmswnf9zEYDAAAcRyvFCJy73jJMzYwMKTwiEkhDa4s8uDJ/PHxEa7rotfrwXEcRQxl7p8xBgYG50dM6/L7Wq2WqipeLpeI41jJvMjOIa89KNYJdctiuPF4rIgLvWNlWcK27dqOIcdqo+ruj4UowC99mr/77jtYloXBYKCUG/at8ygJOHMy4zhWvebb7TZc10Ucx+rncr8wXkMDQwpP3BNRJ0MgE7hZnTyfz3F/f69kHigLQ40rAwOD/R/U3gt1xQr0xFFmJQzDlbXvuu6K/Mq677CNDiHJBXMXmatIrb8wDOE4DoBfQsW+72OxWDwpEDw1mwwAeZ6r/5Psyn/3ej2V2kNSTvkZPfS+7hnwGekpARx76hkyfBxFkSoiYhhfdsI6VT1NA0MKDbDq9q+rBpQnVZnczRZJo9FICbDyNK9rBhoYGLx+nW4SiX9rUsq1b9v2irZokiSKXFAXlATxOVKwbXiThSye58FxHOWVpF3i3/wZvWaO4yhP4Sn1iJbEULYEJFGjx7AsSzw+PsL3fVX8t2v4dtP7uDfovaPZzzlNU/i+j2azqQ4CLFIxMDCk8MShl6KTJOZ5rqQe2ClE/vz+/l51KrBtG47joKqqJ31MDQwMTpOMAr90HPI8b6UbCTt2MEysCz/rnrqXkBbqHJZluVLoxhQXfpZubza1ajuWUPK6+6hrFaprHhIkaK7r4sOHD/B9H2EY4uHhYSfSr4d9656T/hqvGwSBqoimpqzxEhqcFCmUSbHMh5DCybIfr/SWHVof7BB4Lplc9/rpRn+xWKjwMUMNsvE6Nfjq8pLq+iXrP3vL5OVN3ox9iOe+ZGOgvMepyGgYvB1opyThovfmEOE5ufa++uor/OMf/1BrU69u3cabWfdaHTFiysr19bUSn6YXSua67WLXnruP9yTd+3hvnud4fHxU/Z1vbm4wmUxWyLGMCm0Svd72muwIwzDyp0+ftuqEZbA/+yDVCOScr9u/6iSMNj3/sySFuriqJIFyUDigMoTKyS4H1pyA1m8asisB2yddX1/Dtm14nqfGOM9z1XVEbnR6LorsWMLXpSdiH8+BOTPc4OQCO1QIXJcY0TvAGFwuaI9oi7Y90LzFHNV7Be/r2nU5i+x/TlJj+vE+f6ilF5GRGop4p2m6UhDyFvNT6lVK77IR439b9Ho95HmOLMuePFs+k02kT9cQvYQ8UOu50vw6li2r2LjIju2EeSyo8w7IMb+7u1OeV/Y+tSwLlmWpdm4MSeukUJK1us/e1WjK1/iH+ZAAkCTJSseFQ5FCCv7SiMocTjPfzKZPUrjJs3YIchpFEWzb3iuxkBXCjuOg0+mg1WopaZu68eDB0OSuoXYs6NxgYWC73cZwOERZlpjNZuq9nuc9Ifqvmacs+NG9UAZv+/wpWSSf5aa9g2uo0WisFAg9d1g7G1L4zTffqJNSHZvWvTSc3PRSmYKJ3U75Ojh+JNcM0VMy4Y9//CMeHh7g+/5K8vhsNlOVhlTTl8SdC2KbjWETMex2u6pSkfcqieEhNn0mj7NqUicBBpcL27Zr88jew2iTFHJu7uP6FKDu9/toNptI01R1QdHXrmmjtt7+rosqUGeWRSFXV1dKT3IfhJCkVFaE67bf4O0wmUzQbrdVrm/dviHXKaWk6HC5xNaqFsOPm/Kz6kiDVJV/67y2c/Fo6B1RgNVk8LpJ+/e//33FqDF05DgOut2uIpKymb3Uw9qHByRJkidyOutyHd/KCyN11uTrBmbTf89Dgpz/9Dq9BfI8R1mWiKJIXdN13ZXqYWmTDbazEfTEVlWlek/LEO9eNtn/5d/rKQ7mWR3m+c/ncxXtesm6u7R9pgFguY7E0NjoFXPMQ5Qtg/QFaEJ7WEvMNumSSWkFyigw/0WON0PODDMz/5CyF7vc36bwsWVZihDyFMWNaFtP5GugJwPLYicDg7p5eKgCqDpQXWBf19c7jzClg2vguTCYscHbzR/OGTmPZAHla21Yq9Va+axD2E6Dp/uq7oipSzWR4eNL8RLSVvzxj39cX2iyqUquzuDpLthN5OfSvRp1D6Mu4VUKs0oDwvdIsdZtTsXb3pNcQPJZy0quQ/WXrUv8NR0BDDYdIA49L+R6yPN8ryFcEkJ5GNIrmvUIhNTwu/Q1silsLO0mbSe9ehSc3gfeooDFYDvUFfM8F9Gs87jra+mc29VausaT7i2SBFFn3LL6tc7bZLCeCOqGnH/0KuPFYvHE88Eik+ee3b7C+VKH8bnvtm9IfTc5Fw0hNJCGX/emvxcprcv1e62XQxJBXSpMroXnKimN/X0e0sbt4xnKg4okKIYkHgZyPVKqSh4A9D1N5y2X2H1mbfjYwMDAwMDAwMDgzImgCB+bUjUDAwMDAwMDAwNDCg0MDAwMDAwMDAwpNDAwMDAwMDAwMKTQwMDAwMDAwMDAkEIDAwMDAwMDAwNDCg0MDAwMDAwMDAwpNDAwMDAwMDAw+B/+H3vlkHhXC9FVAAAAAElFTkSuQmCC"
-_LOCAL_WHITE = None
-_LOCAL_BLACK = None
-LOGO_URL_WHITE = 'https://pnxhthrheqeucoisifjw.supabase.co/storage/v1/object/public/preventivi/logos/next_logo_white.png'
-LOGO_URL_BLACK = 'https://pnxhthrheqeucoisifjw.supabase.co/storage/v1/object/public/preventivi/logos/next_logo_black.png'
-
-def _ensure_logo():
-    """Estrae i loghi dal base64 hardcoded nel codice — sempre disponibile."""
-    global _LOCAL_WHITE, _LOCAL_BLACK
-    for b64, dst, attr in [
-        (_LOGO_WHITE_B64, '/tmp/next_logo_white_embed.png', '_LOCAL_WHITE'),
-        (_LOGO_BLACK_B64, '/tmp/next_logo_black_embed.png', '_LOCAL_BLACK'),
-    ]:
-        if not os.path.exists(dst):
-            with open(dst,'wb') as f:
-                f.write(_b64.b64decode(b64))
-        globals()[attr] = dst
+# Loghi NEXT (645x80 px) in dati/: bianco su sfondo scuro, nero su sfondo chiaro
+_CARTELLA_DATI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dati")
+LOGO_FILE = {True: "next_logo_white.png", False: "next_logo_black.png"}
+
+@functools.lru_cache(maxsize=None)
+def _logo(on_dark=True):
+    """
+    ImageReader del logo, letto dal disco alla prima richiesta e poi
+    condiviso: i pixel restano decodificati nell'oggetto e reportlab lo
+    incorpora una sola volta per documento. None se il file manca.
+    """
+    try:
+        with open(os.path.join(_CARTELLA_DATI, LOGO_FILE[on_dark]), "rb") as f:
+            return ImageReader(io.BytesIO(f.read()))
+    except OSError:
+        return None
 
 
 def draw_logo(c, x, y, h=8*mm, on_dark=True):
-    _ensure_logo()
     # Usa il logo PNG reale (white su sfondo scuro, black su sfondo chiaro)
-    logo = _LOCAL_WHITE if on_dark else _LOCAL_BLACK
-    if logo and os.path.exists(logo):
-        # Logo NEXT 645Ã80px â larghezza proporzionale all'altezza h
+    logo = _logo(on_dark)
+    if logo is not None:
+        # Logo NEXT 645x80px: larghezza proporzionale all'altezza h
         logo_w = h * (645/80) * 0.90
         c.drawImage(logo, x, y, width=logo_w, height=h,
                     mask='auto', preserveAspectRatio=True)
@@ -109,41 +113,77 @@ def draw_logo(c, x, y, h=8*mm, on_dark=True):
 
 # âââ HEADER/FOOTER ââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââ
 
-def _gradient_rect(c, x, y, w, h, top_hex="#2D6A4F", bot_hex="#1B4332", steps=40):
-    """Rettangolo con gradiente verticale da top_hex (alto) a bot_hex (basso)."""
-    from reportlab.lib.colors import HexColor
-    c1 = HexColor(top_hex); c2 = HexColor(bot_hex)
-    sh = h / steps
-    for i in range(steps):
-        t = i / steps          # 0=top â 1=bottom
-        r = c1.red   + t*(c2.red   - c1.red)
-        g = c1.green + t*(c2.green - c1.green)
-        b = c1.blue  + t*(c2.blue  - c1.blue)
-        from reportlab.lib.colors import Color
-        c.setFillColor(Color(r, g, b))
-        yy = y + h - (i+1)*sh
-        c.rect(x, yy, w, sh+0.5, fill=1, stroke=0)
+@functools.lru_cache(maxsize=None)
+def _rl(colore):
+    """Colore reportlab da "#RRGGBB" o nome (convertito una volta sola)."""
+    return colors.toColor(colore)
 
 
-def page_deco(c, doc, num_off, oggi, cliente, pn, tp):
+def _gradient_rect(c, x, y, w, h, top_hex="#2D6A4F", bot_hex="#1B4332"):
+    """Rettangolo con gradiente verticale nativo (shading assiale) da top_hex (alto) a bot_hex (basso)."""
     c.saveState()
+    p = c.beginPath(); p.rect(x, y, w, h)
+    c.clipPath(p, stroke=0, fill=0)
+    c.linearGradient(x, y + h, x, y, (_rl(top_hex), _rl(bot_hex)), extend=False)
+    c.restoreState()
+
+
+def _risorse_modulo(c):
+    """
+    Risorse del Form XObject in costruzione. reportlab mette nel form solo
+    font e XObject: senza ExtGState e Shading trasparenze e gradienti
+    disegnati dentro il form resterebbero senza riferimento.
+    """
+    r = pdfdoc.PDFResourceDictionary()
+    r.basicFonts(); r.allProcs()
+    if c._formsinuse:
+        r.XObject = c._doc.xobjDict(c._formsinuse)
+    stato = c._extgstate.getState()
+    if stato:
+        r.ExtGState = stato
+    r.setShading(c._shadingUsed)
+    return r
+
+
+def _modulo(c, nome, disegna):
+    """
+    Grafica statica come Form XObject: disegna(c) viene eseguita alla prima
+    pagina che la usa, le pagine successive del documento la richiamano
+    soltanto (un riferimento nel content stream invece dei tracciati).
+    """
+    if not c.hasForm(nome):
+        c.beginForm(nome)
+        disegna(c)
+        c.endForm(Resources=_risorse_modulo(c))
+    c.doForm(nome)
+
+
+def _deco_statica(c):
     _gradient_rect(c, 0, PH-HDR_H, PW, HDR_H, top_hex='#256040', bot_hex='#1B4332')
     draw_logo(c, ML, PH-HDR_H+4.5*mm, h=7*mm, on_dark=True)
+    c.setFillColor(G3); c.rect(0, PH-HDR_H-HDR_LINE, PW, HDR_LINE, fill=1, stroke=0)
+    c.setFillColor(GRB); c.rect(0, 0, PW, FTR_H, fill=1, stroke=0)
+    c.setFillColor(GRM); c.setFont("Helvetica",7)
+    c.drawString(ML, 2*mm, "Next S.r.l.  \u00b7  www.next-srl.eu  \u00b7  commerciale@next-srl.eu")
+
+
+def page_deco(c, doc, num_off, oggi, cliente, pn, tp):
+    c.saveState()
+    _modulo(c, "nxt_deco", _deco_statica)
     c.setFillColor(W); c.setFont("Helvetica-Bold",8)
     c.drawRightString(PW-MR, PH-HDR_H+6.5*mm, num_off)
     c.setFont("Helvetica",7); c.setFillColor(G4)
     c.drawRightString(PW-MR, PH-HDR_H+2.5*mm, f"{oggi}  \u00b7  {cliente}")
-    c.setFillColor(G3); c.rect(0, PH-HDR_H-HDR_LINE, PW, HDR_LINE, fill=1, stroke=0)
-    c.setFillColor(GRB); c.rect(0, 0, PW, FTR_H, fill=1, stroke=0)
     c.setFillColor(GRM); c.setFont("Helvetica",7)
-    c.drawString(ML, 2*mm, "Next S.r.l.  \u00b7  www.next-srl.eu  \u00b7  commerciale@next-srl.eu")
     c.drawRightString(PW-MR, 2*mm, f"Pag. {pn} / {tp}")
     c.restoreState()
 
 # âââ COPERTINA ââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââ
-def draw_cover(c, doc, cliente, oggi, num_off, kwp, kwh, costo):
-    c.saveState()
-    cov_h = PH * 0.56
+COV_H = PH * 0.56
+_COV_CT = PH-COV_H-3.5*mm-4*mm; _COV_CH = 33*mm; _COV_HALF = (PW-ML-MR-5*mm)/2
+
+def _copertina_statica(c):
+    cov_h = COV_H
     _gradient_rect(c, 0, PH-cov_h, PW, cov_h, top_hex='#256040', bot_hex='#152E24')
     c.setStrokeColor(G3); c.setLineWidth(0.3); c.setStrokeAlpha(0.09)
     for i in range(28): c.line(0,PH-cov_h+i*(cov_h/27),PW,PH-cov_h+i*(cov_h/27))
@@ -162,30 +202,37 @@ def draw_cover(c, doc, cliente, oggi, num_off, kwp, kwh, costo):
     c.drawCentredString(PW/2, yc+10*mm, "SISTEMA DI RENDITA ENERGETICA ATTIVA")
     c.setStrokeColor(AU); c.setLineWidth(2)
     c.line(PW/2-35*mm,yc+6*mm,PW/2+35*mm,yc+6*mm)
-    parts=[]
-    if kwp: parts.append(f"{round(kwp,2):.2f} kWp")
-    if kwh and kwh>10: parts.append(f"{fmt(kwh)} kWh/anno")
-    if costo: parts.append(f"Inv. \u20ac {fmt(costo)}")
-    c.setFont("Helvetica-Bold",10); c.setFillColor(G4)
-    c.drawCentredString(PW/2, yc-1.5*mm, "  \u00b7  ".join(parts))
     c.setFillColor(G3); c.rect(0, PH-cov_h-3.5*mm, PW, 3.5*mm, fill=1, stroke=0)
-    ct=PH-cov_h-3.5*mm-4*mm; ch=33*mm; half=(PW-ML-MR-5*mm)/2
+    ct=_COV_CT; ch=_COV_CH; half=_COV_HALF
     c.setFillColor(G5); c.setStrokeColor(GB2); c.setLineWidth(0.8)
     c.roundRect(ML,ct-ch,half,ch,4,fill=1,stroke=1)
     c.setFillColor(G1); c.setFont("Helvetica-Bold",7)
     c.drawString(ML+4*mm,ct-8*mm,"CLIENTE")
-    c.setFillColor(GRD); c.setFont("Helvetica-Bold",10)
-    c.drawString(ML+4*mm,ct-17*mm,cliente[:26]+("..." if len(cliente)>26 else ""))
     x2=ML+half+5*mm
     c.setFillColor(G1); c.roundRect(x2,ct-ch,half,ch,4,fill=1,stroke=0)
     c.setFillColor(AU); c.setFont("Helvetica-Bold",7)
     c.drawString(x2+4*mm,ct-8*mm,"SIMULAZIONE N.")
+    c.setFillColor(GRM); c.setFont("Helvetica",6.5)
+    c.drawString(ML,9*mm,"Simulazione indicativa. Non costituisce contratto commerciale.")
+
+
+def draw_cover(c, doc, cliente, oggi, num_off, kwp, kwh, costo):
+    c.saveState()
+    _modulo(c, "nxt_copertina", _copertina_statica)
+    yc = PH-COV_H+COV_H*0.52
+    parts=[]
+    if kwp: parts.append(f"{round(kwp,2):.2f} kWp")
+    if kwh and kwh>10: parts.append(f"{fmt(kwh)} kWh/anno")
+    if costo: parts.append(f"Inv. \u20ac {fmt(costo)}")
+    c.setFont("Helvetica-Bold",10); c.setFillColor(G4)
+    c.drawCentredString(PW/2, yc-1.5*mm, "  \u00b7  ".join(parts))
+    ct=_COV_CT; x2=ML+_COV_HALF+5*mm
+    c.setFillColor(GRD); c.setFont("Helvetica-Bold",10)
+    c.drawString(ML+4*mm,ct-17*mm,cliente[:26]+("..." if len(cliente)>26 else ""))
     c.setFillColor(W); c.setFont("Helvetica-Bold",9)
     c.drawString(x2+4*mm,ct-17*mm,num_off)
     c.setFillColor(G4); c.setFont("Helvetica",7.5)
     c.drawString(x2+4*mm,ct-24*mm,f"Data: {oggi}")
-    c.setFillColor(GRM); c.setFont("Helvetica",6.5)
-    c.drawString(ML,9*mm,"Simulazione indicativa. Non costituisce contratto commerciale.")
     c.restoreState()
 
 # âââ TABELLA HELPER âââââââââââââââââââââââââââââââââââââââââââââââââââââââââââ
@@ -217,767 +264,431 @@ def tbl(data, cw, hdr="dk", total=False, hcol=None, ralign=None, fs=8.5):
         for c in ralign: ts.append(("ALIGN",(c,0),(c,-1),"RIGHT"))
     t=Table(data,colWidths=cw); t.setStyle(TableStyle(ts)); return t
 
-def savefig(fig, name):
-    p=f"/tmp/{name}_{int(datetime.datetime.now().timestamp())}.png"
-    fig.savefig(p,dpi=165,bbox_inches="tight",facecolor="white",edgecolor="none")
-    plt.close(fig); return p
-
-
-# âââ SCHEDE IMPIANTI â PNG via wkhtmltoimage âââââââââââââââââââââââââââââââââ
-import math, subprocess, os, datetime
-
-def _fascia_html(fascia_n, fmin, fmax, prezzo, bKwp, mKwp, resa=1200, wp=410):
-    wpKw  = wp / 1000
-    nBase = round(bKwp / wpKw)
-    nUpg  = round(mKwp / wpKw)
-    perRow= math.ceil(nUpg / 2)
-    maxP  = round(mKwp * resa)
-    pBase = round(bKwp * resa)
-    pUpg  = round(mKwp * resa)
-
-    def _f(n): return f"{round(n):,}".replace(",",".")
-    def _k(v): return f"{v:.2f}"
-
-    # LED strip: returns HTML for 2-row LED grid
-    def leds(is_base_card, n_lit):
-        rows_h = ""
-        for ri, lbl in enumerate(["A","B"]):
-            cells = ""
-            for ci in range(perRow):
-                idx = ri * perRow + ci
-                if idx >= nUpg: break
-                if is_base_card:
-                    bg = "#1B4332" if idx < n_lit else "#ECEFF1"
-                    bd = "1px solid #B7E4C7" if idx >= n_lit else "none"
-                else:
-                    bg = "#1B4332" if idx < nBase else ("#52B788" if idx < n_lit else "#ECEFF1")
-                    bd = "1px solid #B7E4C7" if idx >= n_lit else "none"
-                cells += f'<span style="display:inline-block;width:13px;height:8px;border-radius:2px;background:{bg};border:{bd};margin-right:2px;vertical-align:middle"></span>'
-            n_show = nBase if is_base_card else nUpg
-            kk = _k(n_show * wpKw)
-            info = f'<span style="font-size:10px;font-weight:600;color:#2D6A4F;margin-left:6px;vertical-align:middle">{n_show}&nbsp;mod &middot; {kk}&nbsp;kWp</span>' if ri==0 else ""
-            rows_h += f'''<div style="margin-bottom:7px;line-height:1">
-              <span style="display:inline-block;font-size:10px;color:#78909C;width:40px;vertical-align:middle">Fila {lbl}</span>
-              {cells}{info}
-            </div>'''
-        return rows_h
-
-    # Mini LED strip for table rows (tiny, single row)
-    def mini_leds(nm_row):
-        cells = ""
-        for i in range(nUpg):
-            if i < nBase:
-                bg = "#1B4332"
-            elif i < nm_row:
-                bg = "#52B788"
-            else:
-                bg = "#ECEFF1"
-                bd = "1px solid #B7E4C7"
-            bd = "1px solid #B7E4C7" if i >= nm_row else "none"
-            cells += f'<span style="display:inline-block;width:9px;height:6px;border-radius:1px;background:{bg};border:{bd};margin-right:1px;vertical-align:middle"></span>'
-        return f'<div style="line-height:1;padding:2px 0">{cells}</div>'
-
-    # Table rows
-    rows_html = ""
-    for nm in range(nBase, nUpg+1):
-        kwp  = round(nm * wpKw, 2)
-        prod = round(kwp * resa)
-        pct  = round(prod / maxP * 110)
-        isb  = nm == nBase
-        bg   = "#D8F3DC" if isb else ("white" if nm % 2 == 0 else "#F5F5F5")
-        fw   = "700" if isb else "400"
-        pill = '<span style="background:#52B788;color:#1B4332;font-size:9px;font-weight:700;padding:1px 6px;border-radius:20px;margin-left:6px;vertical-align:middle">base</span>' if isb else ""
-        bar_bg = "#1B4332" if isb else "#52B788"
-        rows_html += f'''<tr style="background:{bg}">
-          <td style="padding:7px 10px;font-weight:{fw};color:#1B4332;white-space:nowrap">{nm}{pill}</td>
-          <td style="padding:7px 10px;font-weight:{fw};color:#1B4332">{_k(kwp)}</td>
-          <td style="padding:7px 10px">{mini_leds(nm)}</td>
-          <td style="padding:8px 20px;color:#1B4332;white-space:nowrap">
-            <div style="display:inline-block;height:7px;border-radius:3px;background:{bar_bg};width:{pct}px;vertical-align:middle;margin-right:8px"></div>
-            <span style="font-size:12px;color:#1B4332">{_f(prod)}&nbsp;kWh</span>
-          </td>
-          <td style="padding:8px 12px;text-align:right;font-weight:{fw};color:#1B4332">EUR&nbsp;{_f(prezzo)}</td>
-        </tr>'''
-
-    km    = "monofase fino a 6&nbsp;kW" if fascia_n==1 else "monofase 6&ndash;10&nbsp;kW"
-    n_conf= nUpg - nBase + 1
-    leg_base = leds(True, nBase)
-    leg_upg  = leds(False, nUpg)
-
-    return f'''<!DOCTYPE html><html><head><meta charset="utf-8">
-<style>
-  *{{box-sizing:border-box;margin:0;padding:0}}
-  body{{font-family:Helvetica,Arial,sans-serif;font-size:12px;color:#263238;background:white;width:794px;line-height:1.5}}
-  table{{border-collapse:collapse;width:100%}}
-  th{{background:#2D6A4F;color:white;padding:8px 12px;font-size:10px;font-weight:700;text-align:left;letter-spacing:.05em;text-transform:uppercase}}
-  th.r{{text-align:right}}
-  td{{border-bottom:1px solid #E8F5E9}}
-  tr:last-child td{{border-bottom:none}}
-</style></head><body>
-<div style="border:1px solid #B7E4C7;border-radius:10px;overflow:hidden">
-
-<!-- HEADER -->
-<div style="background:#1B4332;padding:14px 22px">
-  <div style="display:inline-block;vertical-align:middle;width:60%">
-    <span style="color:white;font-size:16px;font-weight:700">Fascia {fascia_n} &mdash; {km}</span>
-  </div>
-  <div style="display:inline-block;vertical-align:middle;width:39%;text-align:right">
-    <span style="color:#95D5B2;font-size:12px">da {_k(fmin)} a {_k(fmax)} kWp &middot; accumulo 16&nbsp;kWh sempre incluso</span>
-  </div>
-</div>
-
-<!-- BANNER -->
-<div style="background:#FFF8E7;border-bottom:2px solid #FAD27A;padding:14px 18px;min-height:76px">
-  <table style="border-collapse:collapse;width:100%"><tr>
-    <td style="width:1%;white-space:nowrap;padding-right:16px;vertical-align:middle">
-      <span style="display:inline-block;background:#E9C46A;color:#1B4332;font-size:11px;font-weight:800;padding:6px 14px;border-radius:20px;letter-spacing:.04em;white-space:nowrap">Come funziona</span>
-    </td>
-    <td style="vertical-align:middle;padding:0">
-      <div style="font-size:12px;color:#412402;line-height:1.65;font-weight:400">
-        Next fissa il prezzo sull&apos;impianto base. Il cliente paga <strong>EUR {_f(prezzo)}</strong> e ottiene
-      </div>
-      <div style="font-size:12px;color:#412402;line-height:1.65;font-weight:400;margin-top:5px">
-        <strong>tutta la potenza installabile sul tetto</strong> nella stessa fascia &mdash; nessuna maggiorazione di prezzo.
-      </div>
-    </td>
-  </tr></table>
-</div>
-
-<!-- DUE CARD -->
-<table style="border-collapse:collapse;width:100%"><tr>
-
-  <!-- CARD BASE -->
-  <td style="width:50%;padding:18px 22px;vertical-align:top;border-right:1px solid #B7E4C7;background:#F9FFFA">
-    <div style="font-size:10px;font-weight:700;color:#2D6A4F;letter-spacing:.07em;text-transform:uppercase;margin-bottom:10px">
-      <span style="display:inline-block;width:8px;height:8px;border-radius:50%;background:#52B788;vertical-align:middle;margin-right:5px"></span>
-      Impianto base &middot; prezzo di riferimento
-    </div>
-    <div style="font-size:32px;font-weight:700;color:#1B4332;line-height:1">{_k(bKwp)}<span style="font-size:15px;font-weight:400;color:#52B788;margin-left:6px">kWp</span></div>
-    <div style="font-size:18px;font-weight:700;color:#1B4332;margin:8px 0 4px">EUR {_f(prezzo)} <span style="font-size:12px;font-weight:400;color:#78909C">IVA incl.</span></div>
-    <div style="font-size:12px;color:#78909C;line-height:1.7;margin-bottom:14px">{nBase} moduli LONGi {wp}&nbsp;Wp &middot; inverter ibrido &middot; accumulo WeCo 16&nbsp;kWh &middot; installazione &middot; pratiche</div>
-    <!-- LEGENDA -->
-    <div style="margin-bottom:10px">
-      <div style="margin-bottom:5px">
-        <span style="display:inline-block;width:12px;height:8px;border-radius:2px;background:#1B4332;vertical-align:middle;margin-right:8px"></span>
-        <span style="font-size:11px;color:#263238;font-weight:500">Moduli installati ({nBase})</span>
-      </div>
-      <div>
-        <span style="display:inline-block;width:12px;height:8px;border-radius:2px;background:#ECEFF1;border:1px solid #B7E4C7;vertical-align:middle;margin-right:8px"></span>
-        <span style="font-size:11px;color:#263238;font-weight:500">Slot liberi sul tetto</span>
-      </div>
-    </div>
-    <!-- LED -->
-    <div style="margin-bottom:14px">{leg_base}</div>
-    <!-- NOTA -->
-    <div style="font-size:11px;color:#78909C;line-height:1.7;padding-top:12px;border-top:1px solid #B7E4C7">
-      Con la promozione Next, il tetto che ospita fino a <strong style="color:#1B4332">{_k(mKwp)}&nbsp;kWp</strong> viene installato completamente allo stesso prezzo di <strong style="color:#1B4332">EUR {_f(prezzo)}</strong>.
-    </div>
-  </td>
-
-  <!-- CARD UPGRADE -->
-  <td style="width:50%;padding:18px 22px;vertical-align:top;background:white">
-    <div style="font-size:10px;font-weight:700;color:#2D6A4F;letter-spacing:.07em;text-transform:uppercase;margin-bottom:10px">
-      <span style="display:inline-block;width:8px;height:8px;border-radius:50%;background:#2D6A4F;vertical-align:middle;margin-right:5px"></span>
-      Upgrade massimo fascia {fascia_n} &middot; stesso prezzo
-    </div>
-    <div style="font-size:32px;font-weight:700;color:#2D6A4F;line-height:1">{_k(mKwp)}<span style="font-size:15px;font-weight:400;color:#52B788;margin-left:6px">kWp</span></div>
-    <div style="font-size:18px;font-weight:700;color:#2D6A4F;margin:8px 0 4px">EUR {_f(prezzo)} <span style="font-size:12px;font-weight:400;color:#78909C">IVA incl.</span></div>
-    <div style="font-size:12px;color:#78909C;line-height:1.7;margin-bottom:14px">{nUpg} moduli LONGi {wp}&nbsp;Wp &middot; stessa configurazione &middot; stesso accumulo &middot; massima produzione disponibile</div>
-    <!-- LEGENDA -->
-    <div style="margin-bottom:10px">
-      <div style="margin-bottom:5px">
-        <span style="display:inline-block;width:12px;height:8px;border-radius:2px;background:#1B4332;vertical-align:middle;margin-right:8px"></span>
-        <span style="font-size:11px;color:#263238;font-weight:500">Moduli base ({nBase})</span>
-      </div>
-      <div>
-        <span style="display:inline-block;width:12px;height:8px;border-radius:2px;background:#52B788;vertical-align:middle;margin-right:8px"></span>
-        <span style="font-size:11px;color:#263238;font-weight:500">Moduli extra inclusi ({nUpg-nBase})</span>
-      </div>
-    </div>
-    <!-- LED -->
-    <div style="margin-bottom:14px">{leg_upg}</div>
-    <!-- NOTA -->
-    <div style="font-size:11px;line-height:1.7;padding-top:12px;border-top:1px solid #B7E4C7">
-      <strong style="color:#2D6A4F">Produzione ~{_f(pUpg)}&nbsp;kWh/anno</strong>
-      <span style="color:#78909C"> vs ~{_f(pBase)}&nbsp;kWh/anno (impianto base). </span>
-      <strong style="color:#1B4332">Nessun costo aggiuntivo.</strong>
-    </div>
-  </td>
-
-</tr></table>
-
-<!-- TABELLA CONFIGURAZIONI -->
-<div style="padding:12px 20px;border-top:1px solid #B7E4C7">
-  <div style="font-size:10px;font-weight:700;color:#2D6A4F;letter-spacing:.07em;text-transform:uppercase;margin-bottom:10px">
-    Tutte le configurazioni fascia {fascia_n} &mdash; da {nBase} a {nUpg} moduli
-  </div>
-  <table>
-    <thead><tr>
-      <th>Moduli</th>
-      <th>kWp</th>
-      <th>Configurazione</th>
-      <th style="padding-left:20px">Produzione stimata</th>
-      <th class="r">Prezzo</th>
-    </tr></thead>
-    <tbody>{rows_html}</tbody>
-  </table>
-</div>
-
-<!-- FOOTER -->
-<div style="background:#D8F3DC;border-top:2px solid #B7E4C7;padding:12px 20px">
-  <span style="display:inline-block;margin-right:40px;vertical-align:middle">
-    <span style="font-size:16px;font-weight:700;color:#1B4332">EUR {_f(prezzo)}</span>
-    <span style="display:block;font-size:10px;color:#2D6A4F;margin-top:1px">unico prezzo di fascia</span>
-  </span>
-  <span style="display:inline-block;margin-right:40px;vertical-align:middle">
-    <span style="font-size:16px;font-weight:700;color:#1B4332">{n_conf}</span>
-    <span style="display:block;font-size:10px;color:#2D6A4F;margin-top:1px">configurazioni</span>
-  </span>
-  <span style="display:inline-block;margin-right:40px;vertical-align:middle">
-    <span style="font-size:16px;font-weight:700;color:#1B4332">16 kWh</span>
-    <span style="display:block;font-size:10px;color:#2D6A4F;margin-top:1px">accumulo incluso</span>
-  </span>
-  <span style="display:inline-block;vertical-align:middle">
-    <span style="font-size:16px;font-weight:700;color:#1B4332">EUR 0</span>
-    <span style="display:block;font-size:10px;color:#2D6A4F;margin-top:1px">maggiorazione upgrade</span>
-  </span>
-</div>
-
-</div></body></html>'''
-
-
-def render_fascia_png(fascia_n, fmin, fmax, prezzo, bKwp, mKwp, resa=1200, wp=410):
-    wp_kw  = wp / 1000
-    n_base = round(bKwp / wp_kw)
-    n_max  = round(mKwp / wp_kw)
-    rows   = []
-    for nm in range(n_base, n_max + 1):
-        kwp_r = round(nm * wp_kw, 2)
-        rows.append((nm, kwp_r, nm == n_base))
-    return chart_fascia(fascia_n, fmin, fmax, rows, prezzo, bKwp, mKwp)
-
-    rows = ""
-    for nm in range(nBase, nUpg+1):
-        kwp  = round(nm*wpKw, 2)
-        prod = round(kwp*resa)
-        pct  = round(prod/maxProd*90)
-        isb  = nm == nBase
-        bg   = "#D8F3DC" if isb else ("white" if nm%2==0 else "#ECEFF1")
-        fw   = "600" if isb else "400"
-        pill = '<span style="background:#52B788;color:#1B4332;font-size:9px;font-weight:600;padding:1px 6px;border-radius:20px;margin-left:4px">base</span>' if isb else ""
-        bb   = "#1B4332" if isb else "#52B788"
-        rows += f'''<tr style="background:{bg}">
-          <td style="padding:6px 10px;font-weight:{fw};color:#1B4332">{nm}{pill}</td>
-          <td style="padding:6px 10px;font-weight:{fw};color:#1B4332">{_fk(kwp)}</td>
-          <td style="padding:6px 10px;text-align:right;color:#1B4332">
-            <div style="display:flex;align-items:center;gap:7px;justify-content:flex-end">
-              <div style="height:6px;border-radius:3px;background:{bb};width:{pct}px"></div>
-              {_fmt(prod)} kWh</div></td>
-          <td style="padding:6px 10px;text-align:right;font-weight:{fw};color:#1B4332">EUR {_fmt(prezzo)}</td>
-        </tr>'''
-
-    km = "fino a 6 kW" if fascia_n==1 else "6â10 kW"
-    n_conf = nUpg - nBase + 1
-    return f'''<!DOCTYPE html><html><head><meta charset="utf-8">
-<style>*{{box-sizing:border-box;margin:0;padding:0}}
-body{{font-family:Helvetica,Arial,sans-serif;font-size:12px;color:#263238;background:white;width:794px;line-height:1.5}}
-table{{border-collapse:collapse;width:100%}}
-th{{background:#2D6A4F;color:white;padding:7px 10px;font-size:10px;font-weight:600;text-align:left}}
-th.r{{text-align:right}}td{{border-bottom:0.5px solid #B7E4C7}}tr:last-child td{{border-bottom:none}}
-</style></head><body>
-<div style="border:1px solid #B7E4C7;border-radius:8px;overflow:hidden">
-<div style="background:#1B4332;padding:13px 20px;display:flex;align-items:center;justify-content:space-between">
-  <span style="color:white;font-size:15px;font-weight:600">Fascia {fascia_n} &mdash; monofase {km}</span>
-  <span style="color:#95D5B2;font-size:12px">da {_fk(fmin)} a {_fk(fmax)} kWp &middot; accumulo 16 kWh sempre incluso</span>
-</div>
-<div style="background:#FFF8E7;border-bottom:1px solid #FAD27A;padding:9px 20px;display:flex;align-items:center;gap:10px">
-  <span style="background:#E9C46A;color:#1B4332;font-size:10px;font-weight:600;padding:3px 10px;border-radius:20px;white-space:nowrap">Come funziona</span>
-  <span style="font-size:11px;color:#412402">Next fissa il prezzo sull'impianto base. Il cliente paga <strong>EUR {_fmt(prezzo)}</strong> e ottiene <strong>tutta la potenza installabile sul tetto</strong> nella fascia &mdash; nessuna maggiorazione.</span>
-</div>
-<div style="display:flex;border-bottom:1px solid #B7E4C7">
-  <div style="flex:1;padding:16px 20px;border-right:1px solid #B7E4C7;display:flex;flex-direction:column;background:#F9FFFA">
-    <div style="font-size:10px;font-weight:600;color:#2D6A4F;letter-spacing:.05em;text-transform:uppercase;margin-bottom:9px;display:flex;align-items:center;gap:5px">
-      <div style="width:7px;height:7px;border-radius:50%;background:#52B788"></div>Impianto base &middot; prezzo di riferimento</div>
-    <div style="font-size:30px;font-weight:600;color:#1B4332;line-height:1">{_fk(bKwp)} <span style="font-size:14px;font-weight:400;color:#52B788">kWp</span></div>
-    <div style="font-size:17px;font-weight:600;color:#1B4332;margin:7px 0 3px">EUR {_fmt(prezzo)} <span style="font-size:11px;font-weight:400;color:#78909C">IVA incl.</span></div>
-    <div style="font-size:11px;color:#78909C;line-height:1.5;margin-bottom:12px">{nBase} moduli LONGi {wp} Wp &middot; inverter ibrido &middot; accumulo WeCo 16 kWh &middot; installazione &middot; pratiche</div>
-    <div style="display:flex;gap:14px;font-size:10px;color:#78909C;margin-bottom:9px">
-      <div style="display:flex;align-items:center;gap:4px"><div style="width:11px;height:7px;border-radius:1px;background:#1B4332"></div>Moduli installati ({nBase})</div>
-      <div style="display:flex;align-items:center;gap:4px"><div style="width:11px;height:7px;border-radius:1px;background:#ECEFF1;border:0.5px solid #B7E4C7"></div>Slot liberi sul tetto</div>
-    </div>
-    <div style="flex:1">{leds(True)}</div>
-    <div style="font-size:11px;color:#78909C;line-height:1.6;padding-top:10px;border-top:0.5px solid #B7E4C7;margin-top:10px">
-      Con la promozione Next, il tetto che ospita fino a <strong style="color:#1B4332">{_fk(mKwp)} kWp</strong> viene installato allo stesso prezzo di <strong style="color:#1B4332">EUR {_fmt(prezzo)}</strong>.</div>
-  </div>
-  <div style="flex:1;padding:16px 20px;display:flex;flex-direction:column;background:white">
-    <div style="font-size:10px;font-weight:600;color:#2D6A4F;letter-spacing:.05em;text-transform:uppercase;margin-bottom:9px;display:flex;align-items:center;gap:5px">
-      <div style="width:7px;height:7px;border-radius:50%;background:#2D6A4F"></div>Upgrade massimo fascia {fascia_n} &middot; stesso prezzo</div>
-    <div style="font-size:30px;font-weight:600;color:#2D6A4F;line-height:1">{_fk(mKwp)} <span style="font-size:14px;font-weight:400;color:#52B788">kWp</span></div>
-    <div style="font-size:17px;font-weight:600;color:#2D6A4F;margin:7px 0 3px">EUR {_fmt(prezzo)} <span style="font-size:11px;font-weight:400;color:#78909C">IVA incl.</span></div>
-    <div style="font-size:11px;color:#78909C;line-height:1.5;margin-bottom:12px">{nUpg} moduli LONGi {wp} Wp &middot; stessa configurazione &middot; stesso accumulo &middot; massima produzione disponibile</div>
-    <div style="display:flex;gap:14px;font-size:10px;color:#78909C;margin-bottom:9px">
-      <div style="display:flex;align-items:center;gap:4px"><div style="width:11px;height:7px;border-radius:1px;background:#1B4332"></div>Moduli base ({nBase})</div>
-      <div style="display:flex;align-items:center;gap:4px"><div style="width:11px;height:7px;border-radius:1px;background:#52B788"></div>Moduli extra inclusi ({nUpg-nBase})</div>
-    </div>
-    <div style="flex:1">{leds(False)}</div>
-    <div style="font-size:11px;line-height:1.6;padding-top:10px;border-top:0.5px solid #B7E4C7;margin-top:10px">
-      <span style="color:#2D6A4F;font-weight:600">Produzione ~{_fmt(pUpg)} kWh/anno</span>
-      <span style="color:#78909C"> vs ~{_fmt(pBase)} kWh/anno (impianto base). </span>
-      <strong style="color:#1B4332">Nessun costo aggiuntivo.</strong></div>
-  </div>
-</div>
-<div style="padding:14px 20px">
-  <div style="font-size:10px;font-weight:600;color:#2D6A4F;letter-spacing:.05em;text-transform:uppercase;margin-bottom:9px">
-    Tutte le configurazioni fascia {fascia_n} &mdash; da {nBase} a {nUpg} moduli</div>
-  <table><thead><tr><th>Moduli</th><th>kWp</th><th class="r">Produzione stimata</th><th class="r">Prezzo</th></tr></thead>
-  <tbody>{rows}</tbody></table>
-</div>
-<div style="background:#D8F3DC;border-top:1px solid #B7E4C7;padding:10px 20px;display:grid;grid-template-columns:repeat(4,1fr);text-align:center">
-  <div><div style="font-size:16px;font-weight:600;color:#1B4332">EUR {_fmt(prezzo)}</div><div style="font-size:10px;color:#2D6A4F;margin-top:2px">unico prezzo di fascia</div></div>
-  <div><div style="font-size:16px;font-weight:600;color:#1B4332">{n_conf}</div><div style="font-size:10px;color:#2D6A4F;margin-top:2px">configurazioni</div></div>
-  <div><div style="font-size:16px;font-weight:600;color:#1B4332">16 kWh</div><div style="font-size:10px;color:#2D6A4F;margin-top:2px">accumulo incluso</div></div>
-  <div><div style="font-size:16px;font-weight:600;color:#1B4332">EUR 0</div><div style="font-size:10px;color:#2D6A4F;margin-top:2px">maggiorazione upgrade</div></div>
-</div></div></body></html>'''
-
-
-def chart_fascia(fascia_n, f_min, f_max, rows, prezzo, base_kwp, bonus_kwp):
-    """
-    Scheda fascia con LED, tabella, barre.
-    YLIM = fig_h/fig_w*10 garantisce 1 x-unit = 1 y-unit => nessuna distorsione.
+# âââ SCHEDE IMPIANTI â Flowable reportlab âââââââââââââââââââââââââââââââââ
+def _args_fascia(fascia_n, fmin, fmax, prezzo, bKwp, mKwp, wp=410):
+    rows = configurazioni_moduli(bKwp, mKwp, wp / 1000)
+    return (fascia_n, fmin, fmax, rows, prezzo, bKwp, mKwp)
+
+
+def render_fascia_png(fascia_n, fmin, fmax, prezzo, bKwp, mKwp, resa=1200, wp=410, **kw):
+    """Scheda fascia pronta per la story (Flowable, vedi chart_fascia)."""
+    return chart_fascia(*_args_fascia(fascia_n, fmin, fmax, prezzo, bKwp, mKwp, wp), **kw)
+
+
+class _Scheda(Flowable):
     """
-    import math as _math
-    RESA   = 1200
-    n_rows = len(rows)
-    FIG_W  = 7.4
-    # altezza totale: cards(3.2in) + table(n_rows*0.5+0.9in) + footer(0.6in) + header(0.8in)
-    fig_h  = 3.2 + n_rows * 0.5 + 0.9 + 0.8 + 0.6
-    YLIM   = fig_h / FIG_W * 10   # 1 x-unit = 1 y-unit = 0.74 inch
-
-    fig, ax = plt.subplots(figsize=(FIG_W, fig_h), facecolor="white")
-    ax.set_facecolor("white"); ax.axis("off")
-    ax.set_xlim(0, 10); ax.set_ylim(0, YLIM)
-    TOP = YLIM - 0.08
-
-    # helpers
-    def rbox(x, y, w, h, fc, ec, lw=1.2, r=0.06):
-        ax.add_patch(FancyBboxPatch((x, y), w, h,
-            boxstyle=f"round,pad={r}", facecolor=fc, edgecolor=ec, linewidth=lw))
-
-    def txt(x, y, s, **kw):
-        ax.text(x, y, s, **kw)
-
-    # ââ HEADER ââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââ
-    hh = 0.58
-    rbox(0, TOP - hh, 10, hh, H["g1"], H["g1"], r=0.04)
-    nm_fascia = "monofase fino a 6 kW" if fascia_n == 1 else "monofase 6\u201310 kW"
-    txt(0.20, TOP - hh/2, f"Fascia {fascia_n} \u2014 {nm_fascia}",
-        ha="left", va="center", fontsize=10, fontweight="bold", color="white")
-    txt(9.80, TOP - hh/2,
-        f"da {f_min:.2f} a {f_max:.2f} kWp  \u00b7  accumulo 16 kWh incluso",
-        ha="right", va="center", fontsize=8, color=H["g4"])
-
-    # ââ BANNER ââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââ
-    bh = 0.52
-    y_ban = TOP - hh
-    rbox(0, y_ban - bh, 10, bh, H["abg"], H["au"], lw=1.0, r=0.04)
-    txt(0.25, y_ban - bh/2, "\u25ba Come funziona", ha="left", va="center",
-        fontsize=8, fontweight="bold", color=H["am"],
-        bbox=dict(boxstyle="round,pad=0.12", fc=H["au"], ec="none"))
-    txt(2.10, y_ban - bh/2,
-        f"Next fissa il prezzo sull\u2019impianto base. "
-        f"Il cliente paga EUR {prezzo:,} ".replace(",", ".") +
-        f"e ottiene  tutta la potenza installabile  nella fascia \u2014 nessuna maggiorazione.",
-        ha="left", va="center", fontsize=8, color=H["grd"])
-
-    # ââ CARDS âââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââ
-    n_base_m = round(base_kwp / 0.41)
-    n_upg_m  = round(bonus_kwp / 0.41)
-    per_row  = _math.ceil(n_upg_m / 2)   # moduli per riga LED
-
-    # LED geometry: deve stare in 3.20 units (card width 4.85, meno label 0.72, meno trailing 0.93)
-    LED_AVAIL = 3.20           # unitÃ  disponibili per i LED
-    LED_PW    = min(0.22, (LED_AVAIL - (per_row - 1) * 0.04) / per_row)
-    LED_GX    = 0.04
-    LED_PH    = 0.18
-    LED_GY    = 0.10
-
-    CARD_W = 4.85
-    y_card_top = y_ban - bh - 0.08
-    CARD_H     = 3.10
-
-    def draw_card(cx, kwp_val, col_border, col_text, n_lit, is_base_card):
-        """Disegna una card (base o upgrade)."""
-        fc = H["g5"] if is_base_card else "white"
-        rbox(cx, y_card_top - CARD_H, CARD_W, CARD_H, fc, col_border, lw=1.8)
-
-        tag = "\u25cf IMPIANTO BASE \u00b7 PREZZO DI RIFERIMENTO" if is_base_card \
-              else f"\u25cf UPGRADE MASSIMO FASCIA {fascia_n} \u00b7 STESSO PREZZO"
-        txt(cx + 0.20, y_card_top - 0.30, tag,
-            ha="left", va="center", fontsize=7.5, fontweight="bold", color=col_text)
-
-        # kWp grande
-        txt(cx + 0.20, y_card_top - 0.72, f"{kwp_val:.2f}",
-            ha="left", va="center", fontsize=22, fontweight="bold", color=col_text)
-        txt(cx + 1.50, y_card_top - 0.65, "kWp",
-            ha="left", va="center", fontsize=10, color=H["g3"])
-
-        # prezzo
-        txt(cx + 0.20, y_card_top - 1.03,
-            f"EUR {prezzo:,} IVA incl.".replace(",", "."),
-            ha="left", va="center", fontsize=10, fontweight="bold", color=col_text)
-
-        # descrizione
-        if is_base_card:
-            desc = f"{n_base_m} moduli LONGi 410 Wp \u00b7 inverter ibrido \u00b7 accumulo WeCo 16 kWh"
-        else:
-            desc = f"{n_upg_m} moduli LONGi 410 Wp \u00b7 stessa conf. \u00b7 stesso accumulo"
-        txt(cx + 0.20, y_card_top - 1.26, desc,
-            ha="left", va="center", fontsize=7, color=H["grm"])
+    Scheda disegnata direttamente sul canvas del PDF.
 
-        # legenda LED
-        if is_base_card:
-            leg_items = [(H["g1"], "Moduli base"), (H["g3"], "Upgrade incl."), ("#ECEFF1", "Non incl.")]
-        else:
-            leg_items = [(H["g1"], "Moduli base"), (H["g3"], "Extra inclusi")]
+    Il layout usa le coordinate della vecchia figura matplotlib (UNITA punti
+    per unita'), font e spessori restano in punti; la scheda viene scalata
+    per stare in larghezza (e in altezza_max) mantenendo le proporzioni.
+    Le sottoclassi fissano i limiti x0, x1, y0, y1 e implementano disegna().
+    """
+    UNITA = 72
+
+    def __init__(self, larghezza, altezza_max=None):
+        Flowable.__init__(self)
+        self.larghezza = larghezza
+        self.altezza_max = altezza_max
+        self.hAlign = "CENTER"
+
+    def _scala(self):
+        w = (self.x1 - self.x0) * self.UNITA
+        h = (self.y1 - self.y0) * self.UNITA
+        k = self.larghezza / w
+        if self.altezza_max:
+            k = min(k, self.altezza_max / h)
+        return k, w * k, h * k
+
+    def wrap(self, aw, ah):
+        _, self.width, self.height = self._scala()
+        return self.width, self.height
+
+    def draw(self):
+        c = self.canv
+        c.saveState()
+        c.scale(self._scala()[0], self._scala()[0])
+        self.disegna(c)
+        c.restoreState()
+
+    def P(self, x, y):
+        return (x - self.x0) * self.UNITA, (y - self.y0) * self.UNITA
+
+    def box(self, x, y, w, h, fc, ec=None, lw=1.2, r=0.06):
+        """Come FancyBboxPatch round,pad=r: il bordo sporge di r, raggio r."""
+        X, Y = self.P(x - r, y - r)
+        c = self.canv
+        c.setFillColor(_rl(fc))
+        if ec:
+            c.setStrokeColor(_rl(ec)); c.setLineWidth(lw)
+        c.roundRect(X, Y, (w + 2*r) * self.UNITA, (h + 2*r) * self.UNITA,
+                    r * self.UNITA, stroke=1 if ec else 0, fill=1)
+
+    def testo(self, x, y, s, fs=8, colore="#263238", bold=False, italic=False,
+              ha="left", va="center", interlinea=1.45):
+        c = self.canv
+        font = "Helvetica" + ("-BoldOblique" if bold and italic else "-Bold" if bold
+                              else "-Oblique" if italic else "")
+        c.setFont(font, fs)
+        c.setFillColor(_rl(colore))
+        X, Y = self.P(x, y)
+        righe = s.split("\n")
+        passo = fs * interlinea * 0.76
+        # allineamento verticale come matplotlib (blocco di righe)
+        if va == "center":
+            Y += (len(righe) - 1) * passo / 2 - fs * 0.35
+        elif va == "top":
+            Y -= fs * 0.76
+        disegna = {"left": c.drawString, "center": c.drawCentredString,
+                   "right": c.drawRightString}[ha]
+        for i, riga in enumerate(righe):
+            disegna(X, Y - i * passo, riga)
+        return stringWidth(max(righe, key=len), font, fs) / self.UNITA
+
+
+class SchedaFascia(_Scheda):
+    """Scheda fascia: due card con LED dei moduli, tabella configurazioni e barre."""
+    UNITA = 0.74 * 72
+    RESA = 1200
+
+    def __init__(self, fascia_n, f_min, f_max, rows, prezzo, base_kwp, bonus_kwp,
+                 larghezza=7.4 * 72, altezza_max=None):
+        _Scheda.__init__(self, larghezza, altezza_max)
+        self.fascia_n, self.f_min, self.f_max = fascia_n, f_min, f_max
+        self.rows, self.prezzo = rows, prezzo
+        self.base_kwp, self.bonus_kwp = base_kwp, bonus_kwp
+
+        # altezza della vecchia figura: cards + tabella + footer + header
+        fig_h = 3.2 + len(rows) * 0.5 + 0.9 + 0.8 + 0.6
+        self.TOP = fig_h / 7.4 * 10 - 0.08
+        self.y_card_top = self.TOP - 0.58 - 0.52 - 0.08
+        self.y_tbl = self.y_card_top - 3.10 - 0.22 - 0.38
+        self.y_foot = self.y_tbl - 0.38 - len(rows) * 0.52 - 0.12
+        self.x0, self.x1 = -0.06, 10.06
+        self.y0, self.y1 = self.y_foot - 0.62 - 0.04, self.TOP + 0.04
+
+    def disegna(self, c):
+        fascia_n, prezzo = self.fascia_n, self.prezzo
+        rows, TOP = self.rows, self.TOP
+        eur = f"EUR {prezzo:,}".replace(",", ".")
+
+        # -- HEADER
+        hh = 0.58
+        self.box(0, TOP - hh, 10, hh, H["g1"], H["g1"], r=0.04)
+        nm_fascia = "monofase fino a 6 kW" if fascia_n == 1 else "monofase 6\u201310 kW"
+        self.testo(0.20, TOP - hh/2, f"Fascia {fascia_n} \u2014 {nm_fascia}",
+                   fs=10, bold=True, colore="#FFFFFF")
+        self.testo(9.80, TOP - hh/2,
+                   f"da {self.f_min:.2f} a {self.f_max:.2f} kWp  \u00b7  accumulo 16 kWh incluso",
+                   fs=8, colore=H["g4"], ha="right")
+
+        # -- BANNER
+        bh = 0.52
+        y_ban = TOP - hh
+        self.box(0, y_ban - bh, 10, bh, H["abg"], H["au"], lw=1.0, r=0.04)
+        etichetta = "\u25ba Come funziona"
+        w_et = stringWidth(etichetta, "Helvetica-Bold", 8) / self.UNITA
+        pad = 0.12 * 8 / self.UNITA   # bbox matplotlib: pad in frazioni di fontsize
+        self.box(0.25, y_ban - bh/2 - 4.5 / self.UNITA, w_et, 9 / self.UNITA, H["au"], r=pad)
+        self.testo(0.25, y_ban - bh/2, etichetta, fs=8, bold=True, colore=H["am"])
+        spiegazione = (f"Next fissa il prezzo sull\u2019impianto base. Il cliente paga {eur} "
+                       f"e ottiene tutta la potenza installabile nella fascia \u2014 nessuna maggiorazione.")
+        x_sp = 0.25 + w_et + 0.20
+        fs_sp = min(8, 8 * (9.85 - x_sp) * self.UNITA / stringWidth(spiegazione, "Helvetica", 8))
+        self.testo(x_sp, y_ban - bh/2, spiegazione, fs=fs_sp, colore=H["grd"])
+
+        # -- CARDS
+        self.n_base_m = round(self.base_kwp / 0.41)
+        self.n_upg_m = round(self.bonus_kwp / 0.41)
+        self._card(0.05, self.base_kwp, H["g1"], self.n_base_m, True)
+        self._card(5.10, self.bonus_kwp, H["g2"], self.n_upg_m, False)
+
+        # -- TABELLA + BARRE
+        y_sec = self.y_card_top - 3.10 - 0.22
+        RIGA_H = BAR_H_R = 0.52
+        HDR_H_T = 0.38
+        self.testo(0.15, y_sec - 0.10, f"TUTTE LE CONFIGURAZIONI FASCIA {fascia_n}",
+                   fs=7.5, bold=True, colore=H["g1"], va="top")
+        self.testo(5.10, y_sec - 0.10, "POTENZA INSTALLABILE IN BASE AL TETTO",
+                   fs=7.5, bold=True, colore=H["g1"], va="top")
+
+        y_tbl = self.y_tbl
+        self.box(0.0, y_tbl - HDR_H_T, 4.95, HDR_H_T, H["g2"], H["g2"], r=0.03)
+        for tx, lbl in [(0.20, "Moduli"), (1.15, "kWp"), (2.05, "Produzione"), (3.65, "Prezzo")]:
+            self.testo(tx, y_tbl - HDR_H_T/2, lbl, fs=8, bold=True, colore="#FFFFFF")
+
+        max_prod = round(rows[-1][1] * self.RESA)
+        for ri, (n_m, kwp_r, is_base) in enumerate(rows):
+            prod = round(kwp_r * self.RESA)
+            ry = y_tbl - HDR_H_T - ri * RIGA_H
+            bg = H["g5"] if is_base else ("white" if ri % 2 == 0 else H["grb"])
+            self.box(0.0, ry - RIGA_H, 4.95, RIGA_H, bg, H["gb2"], lw=0.4, r=0.02)
+
+            self.testo(0.20, ry - RIGA_H/2, str(n_m), fs=8.5, bold=is_base, colore=H["g1"])
+            if is_base:
+                self.box(0.48, ry - RIGA_H/2 - 0.09, 0.52, 0.18, H["g3"], r=0.02)
+                self.testo(0.74, ry - RIGA_H/2, "base", fs=6.5, bold=True, colore=H["g1"], ha="center")
+            self.testo(1.15, ry - RIGA_H/2, f"{kwp_r:.2f}", fs=8.5, bold=is_base, colore=H["g1"])
+
+            bw2 = (prod / max_prod) * 1.40
+            self.box(2.05, ry - RIGA_H/2 - 0.08, bw2, 0.16, H["g1"] if is_base else H["g3"], r=0.01)
+            self.testo(2.05 + bw2 + 0.08, ry - RIGA_H/2, f"{prod:,}".replace(",", "."),
+                       fs=7, colore=H["g1"])
+            self.testo(4.92, ry - RIGA_H/2, eur, fs=7.5, bold=is_base, colore=H["g1"], ha="right")
+
+            rby = y_tbl - HDR_H_T - ri * BAR_H_R
+            self.box(5.10, rby - BAR_H_R, 4.75, BAR_H_R, bg, H["gb2"], lw=0.4, r=0.02)
+            bar_w2 = kwp_r / rows[-1][1] * 3.20
+            self.testo(5.22, rby - BAR_H_R * 0.28, f"{kwp_r:.2f} kWp \u00b7 {n_m} mod",
+                       fs=7.5, bold=is_base, colore=H["g1"])
+            self.box(5.22, rby - BAR_H_R * 0.80, bar_w2, 0.17, H["g1"] if is_base else H["g3"], r=0.01)
+            self.testo(5.22 + bar_w2 + 0.10, rby - BAR_H_R * 0.58, f"{prod:,} kWh".replace(",", "."),
+                       fs=7, colore=H["g1"])
+
+        # -- FOOTER
+        y_foot = self.y_foot
+        self.box(0, y_foot - 0.62, 10, 0.62, H["g5"], H["gb2"], lw=0.5, r=0.04)
+        stats = [(eur, "unico prezzo di fascia"), (str(len(rows)), "configurazioni disponibili"),
+                 ("16 kWh", "accumulo sempre incluso"), ("EUR 0", "maggiorazione upgrade")]
+        for si, (val, lbl) in enumerate(stats):
+            cx = 1.25 + si * 2.50
+            self.testo(cx, y_foot - 0.22, val, fs=11, bold=True, colore=H["g1"], ha="center")
+            self.testo(cx, y_foot - 0.44, lbl, fs=7.5, colore=H["grm"], ha="center")
+
+    def _card(self, cx, kwp_val, col, n_lit, is_base_card):
+        yt, CARD_W, CARD_H = self.y_card_top, 4.85, 3.10
+        n_base_m, n_upg_m = self.n_base_m, self.n_upg_m
+        per_row = math.ceil(n_upg_m / 2)
+        LED_PW = min(0.22, (3.20 - (per_row - 1) * 0.04) / per_row)
+        LED_GX, LED_PH, LED_GY = 0.04, 0.18, 0.10
+
+        self.box(cx, yt - CARD_H, CARD_W, CARD_H, H["g5"] if is_base_card else "#FFFFFF", col, lw=1.8)
+        tag = ("\u25cf IMPIANTO BASE \u00b7 PREZZO DI RIFERIMENTO" if is_base_card
+               else f"\u25cf UPGRADE MASSIMO FASCIA {self.fascia_n} \u00b7 STESSO PREZZO")
+        self.testo(cx + 0.20, yt - 0.30, tag, fs=7.5, bold=True, colore=col)
+        self.testo(cx + 0.20, yt - 0.72, f"{kwp_val:.2f}", fs=22, bold=True, colore=col)
+        self.testo(cx + 1.50, yt - 0.65, "kWp", fs=10, colore=H["g3"])
+        self.testo(cx + 0.20, yt - 1.03, f"EUR {self.prezzo:,} IVA incl.".replace(",", "."),
+                   fs=10, bold=True, colore=col)
+        desc = (f"{n_base_m} moduli LONGi 410 Wp \u00b7 inverter ibrido \u00b7 accumulo WeCo 16 kWh"
+                if is_base_card else
+                f"{n_upg_m} moduli LONGi 410 Wp \u00b7 stessa conf. \u00b7 stesso accumulo")
+        self.testo(cx + 0.20, yt - 1.26, desc, fs=7, colore=H["grm"])
+
+        leg_items = ([(H["g1"], "Moduli base"), (H["g3"], "Upgrade incl."), ("#ECEFF1", "Non incl.")]
+                     if is_base_card else [(H["g1"], "Moduli base"), (H["g3"], "Extra inclusi")])
         for li, (fc2, lb2) in enumerate(leg_items):
             lx = cx + 0.20 + li * 1.50
-            ax.add_patch(FancyBboxPatch((lx, y_card_top - 1.52), 0.18, 0.13,
-                boxstyle="round,pad=0.01", facecolor=fc2, edgecolor=H["gb2"], lw=0.4))
-            txt(lx + 0.23, y_card_top - 1.46, lb2,
-                ha="left", va="center", fontsize=6.5, color=H["grm"])
-
-        # LED 2 righe
-        led_x0 = cx + 0.70  # dopo "Fila A" label
-        led_y0 = y_card_top - 1.75
-        n_base_show = n_base_m if is_base_card else n_base_m
+            self.box(lx, yt - 1.52, 0.18, 0.13, fc2, H["gb2"], lw=0.4, r=0.01)
+            self.testo(lx + 0.23, yt - 1.46, lb2, fs=6.5, colore=H["grm"])
+
+        led_x0, led_y0 = cx + 0.70, yt - 1.75
         for ri in range(2):
-            row_label = "Fila A" if ri == 0 else "Fila B"
-            txt(cx + 0.20, led_y0 - ri * (LED_PH + LED_GY + 0.08) + LED_PH/2,
-                row_label, ha="left", va="center", fontsize=7, color=H["grm"])
+            ly2 = led_y0 - ri * (LED_PH + LED_GY + 0.08)
+            self.testo(cx + 0.20, ly2 + LED_PH/2, "Fila A" if ri == 0 else "Fila B", fs=7, colore=H["grm"])
             for ci in range(per_row):
                 idx = ri * per_row + ci
                 if idx >= n_upg_m: break
-                clr = H["g1"] if idx < n_base_show else \
-                      (H["g3"] if idx < n_lit else H["grb"])
-                lx2 = led_x0 + ci * (LED_PW + LED_GX)
-                ly2 = led_y0 - ri * (LED_PH + LED_GY + 0.08)
-                ax.add_patch(FancyBboxPatch(
-                    (lx2, ly2), LED_PW, LED_PH,
-                    boxstyle="round,pad=0.005",
-                    facecolor=clr, edgecolor="white", linewidth=0.4))
-            # label dopo LEDs (solo fila A)
+                clr = H["g1"] if idx < n_base_m else (H["g3"] if idx < n_lit else H["grb"])
+                self.box(led_x0 + ci * (LED_PW + LED_GX), ly2, LED_PW, LED_PH, clr, "#FFFFFF", lw=0.4, r=0.005)
             if ri == 0:
                 lbl_x = led_x0 + per_row * (LED_PW + LED_GX) + 0.08
-                if lbl_x + 0.80 < cx + CARD_W:  # solo se c'e' spazio
-                    txt(lbl_x, led_y0 + LED_PH/2,
-                        f"{n_lit} mod \u00b7 {n_lit*0.41:.2f} kWp",
-                        ha="left", va="center", fontsize=6.5,
-                        fontweight="bold", color=col_text)
-
-        # nota sotto LED
-        prod_upg = round(bonus_kwp * RESA)
-        prod_base_v = round(base_kwp * RESA)
+                if lbl_x + 0.80 < cx + CARD_W:
+                    self.testo(lbl_x, led_y0 + LED_PH/2, f"{n_lit} mod \u00b7 {n_lit*0.41:.2f} kWp",
+                               fs=6.5, bold=True, colore=col)
+
         if is_base_card:
             nota = (f"Con la promozione, il tetto che ospita\n"
-                    f"fino a {bonus_kwp:.2f} kWp viene installato\n"
-                    f"allo stesso prezzo di EUR {prezzo:,}.".replace(",", "."))
+                    f"fino a {self.bonus_kwp:.2f} kWp viene installato\n"
+                    f"allo stesso prezzo di EUR {self.prezzo:,}.".replace(",", "."))
             nota_col = H["grm"]
         else:
-            nota = (f"Produzione: ~{prod_upg:,} kWh/anno\n"
-                    f"vs ~{prod_base_v:,} kWh/anno (base)\n"
+            nota = (f"Produzione: ~{round(self.bonus_kwp * self.RESA):,} kWh/anno\n"
+                    f"vs ~{round(self.base_kwp * self.RESA):,} kWh/anno (base)\n"
                     f"Nessun costo aggiuntivo.".replace(",", "."))
-            nota_col = col_text
-        txt(cx + 0.20, y_card_top - 2.48, nota,
-            ha="left", va="top", fontsize=7.5, color=nota_col,
-            linespacing=1.45, fontweight="normal")
-
-    # disegna le due card
-    draw_card(0.05, base_kwp, H["g1"], H["g1"], n_base_m, True)
-    draw_card(5.10, bonus_kwp, H["g2"], H["g2"], n_upg_m, False)
-
-    # ââ SEZIONE TABELLA + BARRE ââââââââââââââââââââââââââââââââââââââââââââââ
-    y_sec = y_card_top - CARD_H - 0.22
-    RIGA_H   = 0.42   # altezza riga tabella
-    HDR_H_T  = 0.38   # altezza header tabella
-    BAR_H_R  = 0.52   # altezza riga barre (destra)
-
-    # titoli sezione
-    txt(0.15, y_sec - 0.10,
-        f"TUTTE LE CONFIGURAZIONI FASCIA {fascia_n}",
-        ha="left", va="top", fontsize=7.5, fontweight="bold", color=H["g1"])
-    txt(5.10, y_sec - 0.10,
-        "POTENZA INSTALLABILE IN BASE AL TETTO",
-        ha="left", va="top", fontsize=7.5, fontweight="bold", color=H["g1"])
-
-    y_tbl = y_sec - 0.38  # top del blocco tabella/barre
-
-    # header tabella sinistra (0..4.95)
-    rbox(0.0, y_tbl - HDR_H_T, 4.95, HDR_H_T, H["g2"], H["g2"], r=0.03)
-    for tx, lbl in [(0.20, "Moduli"), (1.15, "kWp"),
-                    (2.05, "Produzione"), (3.65, "Prezzo")]:
-        txt(tx, y_tbl - HDR_H_T/2, lbl,
-            ha="left", va="center", fontsize=8, fontweight="bold", color="white")
-
-    max_prod = round(rows[-1][1] * RESA)
-    for ri, (n_m, kwp_r, is_base) in enumerate(rows):
-        prod = round(kwp_r * RESA)
-        ry   = y_tbl - HDR_H_T - ri * RIGA_H
-
-        # riga tabella sinistra
-        bg = H["g5"] if is_base else ("white" if ri % 2 == 0 else H["grb"])
-        rbox(0.0, ry - RIGA_H, 4.95, RIGA_H, bg, H["gb2"], lw=0.4, r=0.02)
-
-        txt(0.20, ry - RIGA_H/2, str(n_m),
-            ha="left", va="center", fontsize=8.5,
-            fontweight="bold" if is_base else "normal", color=H["g1"])
-        if is_base:
-            ax.add_patch(FancyBboxPatch((0.65, ry - RIGA_H/2 - 0.10), 0.65, 0.20,
-                boxstyle="round,pad=0.02", facecolor=H["g3"], edgecolor="none"))
-            txt(0.975, ry - RIGA_H/2, "base",
-                ha="center", va="center", fontsize=6.5, fontweight="bold", color=H["g1"])
-
-        txt(1.15, ry - RIGA_H/2, f"{kwp_r:.2f}",
-            ha="left", va="center", fontsize=8.5,
-            fontweight="bold" if is_base else "normal", color=H["g1"])
-
-        # barra produzione
-        bw2 = (prod / max_prod) * 1.40
-        ax.add_patch(FancyBboxPatch((2.05, ry - RIGA_H/2 - 0.08), bw2, 0.16,
-            boxstyle="round,pad=0.01",
-            facecolor=H["g1"] if is_base else H["g3"], edgecolor="none"))
-        txt(2.05 + bw2 + 0.08, ry - RIGA_H/2,
-            f"{prod:,}".replace(",", "."),
-            ha="left", va="center", fontsize=7, color=H["g1"])
-
-        txt(4.92, ry - RIGA_H/2, f"EUR {prezzo:,}".replace(",", "."),
-            ha="right", va="center", fontsize=7.5,
-            fontweight="bold" if is_base else "normal", color=H["g1"])
-
-        # riga barre destra (5.10..9.85)
-        rby = y_tbl - HDR_H_T - ri * BAR_H_R
-        bg2 = H["g5"] if is_base else ("white" if ri % 2 == 0 else H["grb"])
-        rbox(5.10, rby - BAR_H_R, 4.75, BAR_H_R, bg2, H["gb2"], lw=0.4, r=0.02)
-
-        pct = kwp_r / rows[-1][1]
-        bar_w2 = pct * 3.20   # max 3.20 units â ends at 5.10+3.20=8.30, leaving 1.55 for text
-        txt(5.22, rby - BAR_H_R * 0.28,
-            f"{kwp_r:.2f} kWp \u00b7 {n_m} mod",
-            ha="left", va="center", fontsize=7.5,
-            fontweight="bold" if is_base else "normal", color=H["g1"])
-        ax.add_patch(FancyBboxPatch((5.22, rby - BAR_H_R * 0.80), bar_w2, 0.17,
-            boxstyle="round,pad=0.01",
-            facecolor=H["g1"] if is_base else H["g3"], edgecolor="none"))
-        txt(5.22 + bar_w2 + 0.10, rby - BAR_H_R * 0.58,
-            f"{prod:,} kWh".replace(",", "."),
-            ha="left", va="center", fontsize=7, color=H["g1"])
-
-    # ââ FOOTER STATS ââââââââââââââââââââââââââââââââââââââââââââââââââââââââ
-    y_foot = y_tbl - HDR_H_T - n_rows * max(RIGA_H, BAR_H_R) - 0.12
-    rbox(0, y_foot - 0.62, 10, 0.62, H["g5"], H["gb2"], lw=0.5, r=0.04)
-    stats = [
-        (f"EUR {prezzo:,}".replace(",", "."), "unico prezzo di fascia"),
-        (str(n_rows), "configurazioni disponibili"),
-        ("16 kWh", "accumulo sempre incluso"),
-        ("EUR 0", "maggiorazione upgrade"),
-    ]
-    for si, (val, lbl) in enumerate(stats):
-        cx = 1.25 + si * 2.50
-        txt(cx, y_foot - 0.22, val, ha="center", va="center",
-            fontsize=11, fontweight="bold", color=H["g1"])
-        txt(cx, y_foot - 0.44, lbl, ha="center", va="center",
-            fontsize=7.5, color=H["grm"])
+            nota_col = col
+        self.testo(cx + 0.20, yt - 2.48, nota, fs=7.5, colore=nota_col, va="top")
 
-    fig.tight_layout(pad=0.2)
-    return savefig(fig, f"fascia{fascia_n}")
+
+def chart_fascia(fascia_n, f_min, f_max, rows, prezzo, base_kwp, bonus_kwp,
+                 larghezza=7.4 * 72, altezza_max=None):
+    """Scheda fascia come Flowable reportlab (niente matplotlib)."""
+    return SchedaFascia(fascia_n, f_min, f_max, rows, prezzo, base_kwp, bonus_kwp,
+                        larghezza, altezza_max)
 
 # âââââââââââââââââââââââââââââââ
-# IRR formula image (original style, green/gold palette)
+# Grafici matplotlib (confronto, benefici, payback) e scheda IRR
 # âââââââââââââââââââââââââââââââ
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch
-import numpy as np
-import numpy_financial as npf
-import datetime
-
-H = {"g1":"#1B4332","g2":"#2D6A4F","g3":"#52B788","g4":"#95D5B2",
-     "g5":"#D8F3DC","gb2":"#B7E4C7","au":"#E9C46A","am":"#F4A261",
-     "ab":"#E76F51","abg":"#FFF8E7","grd":"#263238","grm":"#78909C","grb":"#ECEFF1"}
-
-def savefig(fig, name):
-    p=f"/tmp/{name}_{int(datetime.datetime.now().timestamp())}.png"
-    fig.savefig(p,dpi=160,bbox_inches='tight',facecolor='white',edgecolor='none')
-    plt.close(fig); return p
-
-# ââ IRR formula image (full page: formula + IRR result) âââââââââââââââââââââ
-import matplotlib, math, subprocess, os, datetime
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch
-import numpy as np
-import numpy_financial as npf
-
-H = {"g1":"#1B4332","g2":"#2D6A4F","g3":"#52B788","g4":"#95D5B2",
-     "g5":"#D8F3DC","gb2":"#B7E4C7","au":"#E9C46A","am":"#F4A261",
-     "ab":"#E76F51","abg":"#FFF8E7","grd":"#263238","grm":"#78909C","grb":"#ECEFF1"}
+@functools.lru_cache(maxsize=None)
+def _plt():
+    """
+    matplotlib.pyplot, importato dal primo grafico da disegnare: l'import
+    del modulo e i report con i grafici gia' in cache non lo caricano.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    # SVG con testo come testo (non tracciati): file piu' piccoli e svglib piu' veloce
+    matplotlib.rcParams["svg.fonttype"] = "none"
+    import matplotlib.pyplot as plt
+    return plt
 
-def _ts(): return int(datetime.datetime.now().timestamp())
-def _save(fig, name):
-    p = f"/tmp/{name}_{_ts()}.png"
-    fig.savefig(p, dpi=160, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close(fig); return p
 
-# ââ 1. IRR: formula generica + formula applicata + scomposizione ââââââââââââ
-import matplotlib, math
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-from matplotlib.patches import FancyBboxPatch
-import numpy_financial as npf, datetime, os
+def _save(fig, name, formato="png"):
+    buf = io.BytesIO()
+    fig.savefig(buf, format=formato, dpi=160, bbox_inches="tight", facecolor="white", edgecolor="none")
+    _plt().close(fig); return buf.getvalue()
 
-H = {"g1":"#1B4332","g2":"#2D6A4F","g3":"#52B788","g4":"#95D5B2",
-     "g5":"#D8F3DC","gb2":"#B7E4C7","au":"#E9C46A","am":"#F4A261",
-     "ab":"#E76F51","abg":"#FFF8E7","grd":"#263238","grm":"#78909C",
-     "grb":"#ECEFF1"}
-
-def _save(fig, name):
-    p = f"/tmp/{name}_{int(datetime.datetime.now().timestamp())}.png"
-    fig.savefig(p, dpi=160, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close(fig); return p
-
-def make_irr_image(costo, flusso_ann, incremento):
-    """IRR: layout con coordinate assolute in pollici — nessuna sovrapposizione."""
-    import numpy_financial as _npf
-    flussi = [-costo] + [round(flusso_ann*((1+incremento)**(t-1))) for t in range(1,11)]
-    irr    = _npf.irr(flussi)
-    irr_pct= round(irr*100, 2)
-    fs     = flussi[1:]
-    def _f(n): return f"{round(n):,}".replace(",",".")
-
-    FW, FH = 7.4, 5.4   # larghezza Ã altezza in pollici
-    PAD    = 0.12        # margine orizzontale
-
-    fig = plt.figure(figsize=(FW, FH), facecolor='white')
-    ax  = fig.add_axes([0,0,1,1])
-    ax.set_facecolor('white'); ax.axis('off')
-    ax.set_xlim(0, FW); ax.set_ylim(0, FH)   # coordinate in pollici
-
-    def box(x, ytop, w, h, fc, ec, lw=1.2, r=0.07):
-        """ytop = bordo superiore, h = altezza. Patch va da (x, ytop-h) a (x+w, ytop)."""
-        ax.add_patch(FancyBboxPatch((x, ytop-h), w, h,
-            boxstyle=f'round,pad={r}', facecolor=fc, edgecolor=ec, linewidth=lw, zorder=1))
-
-    def t(x, y, s, **kw):
-        ax.text(x, y, s, **kw)
-
-    # ââ TITOLO âââââââââââââââââââââââââââââââââââââââââ
-    t(FW/2, FH-0.20, "Tasso Interno di Rendimento (IRR)",
-      ha='center', va='top', fontsize=10.5, fontweight='bold', color=H['g1'])
-
-    # ââ DESCRIZIONE (2 righe esplicite, fontsize piccolo per sicurezza) ââ
-    t(FW/2, FH-0.52,
-      "L\u2019IRR \u00e8 il rendimento annuo composto che azzera il Valore Attuale Netto"
-      " dell\u2019investimento.",
-      ha='center', va='center', fontsize=7.5, color=H['grm'])
-    t(FW/2, FH-0.73,
-      "Pi\u00f9 \u00e8 alto, pi\u00f9 l\u2019investimento \u00e8 conveniente rispetto"
-      " ad alternative finanziarie di pari rischio.",
-      ha='center', va='center', fontsize=7.5, color=H['grm'])
-
-    # ââ BOX FORMULA GENERICA (verde) — top a 4.85 ââââ
-    B1_TOP = FH - 0.94    # 5.06
-    B1_H   = 1.10
-    box(PAD, B1_TOP, FW-PAD*2, B1_H, H['g5'], H['g2'], lw=1.4)
-    t(FW/2, B1_TOP-0.32,
-      r"$0 = -I + \sum_{t=1}^{n} \frac{CF_t}{(1+r)^t}$",
-      ha='center', va='center', fontsize=13.5, color=H['g1'])
-    # Variabili 3 col Ã 2 righe
-    vars_ = [("$I$","Investimento iniziale"),("$CF_1\\!\\ldots\\!CF_n$","Benefici annui"),
-              ("$r$","IRR — tasso cercato"), ("$t$","Anno (1\u2026n)"),
-              ("$n$","Durata 10 anni"),("$NPV$","Val. att. netto\u00a0=\u00a00")]
-    for vi,(sym,desc) in enumerate(vars_):
-        col,row = vi%3, vi//3
-        vx = 0.28+col*2.30; vy = B1_TOP-0.68-row*0.23
-        t(vx, vy, sym+" = "+desc, ha='left', va='center', fontsize=7, color=H['grm'])
-
-    # ââ "Applicata al caso in esame" âââââââââââââââââââ
-    t(FW/2, B1_TOP-B1_H-0.16,
-      "Applicata al caso in esame:",
-      ha='center', va='center', fontsize=7.5, color=H['grm'], style='italic')
-
-    # ââ BOX FORMULA CON VALORI (oro) — top a 3.58 ââââ
-    B2_TOP = B1_TOP-B1_H-0.32    # â 3.62
-    B2_H   = 0.78
-    box(PAD, B2_TOP, FW-PAD*2, B2_H, H['abg'], H['au'], lw=1.4)
-    l1 = ("$0 = -{} + ".format(_f(costo)) +
-          " + ".join([f"\\dfrac{{{_f(v)}}}{{(1+r)^{{{i+1}}}}}" for i,v in enumerate(fs[:5])])+"$")
-    l2 = ("$+ "+" + ".join([f"\\dfrac{{{_f(v)}}}{{(1+r)^{{{i+6}}}}}" for i,v in enumerate(fs[5:])])+"$")
-    t(FW/2, B2_TOP-0.22, l1, ha='center', va='center', fontsize=8, color=H['g1'])
-    t(FW/2, B2_TOP-0.55, l2, ha='center', va='center', fontsize=8, color=H['g1'])
-
-    # ââ Raccordo ââââââââââââââââââââââââââââââââââââââââ
-    t(FW/2, B2_TOP-B2_H-0.15,
-      f"Incremento tariffe {incremento*100:.1f}%/anno \u2014 risolvendo numericamente per r:",
-      ha='center', va='center', fontsize=7, color=H['grm'], style='italic')
-
-    # ââ BOX RISULTATO (verde scuro) — occupa lo spazio restante â
-    B3_TOP = B2_TOP-B2_H-0.30    # â 2.52
-    B3_BOT = 0.08
-    B3_H   = B3_TOP - B3_BOT
-
-    # Gradient verde scuro: #256040 (alto) â #152E24 (basso)
-    _STEPS = 60
-    _TOP_C = (0x25/255, 0x60/255, 0x40/255)   # #256040
-    _BOT_C = (0x15/255, 0x2E/255, 0x24/255)   # #152E24
-    for _i in range(_STEPS):
-        _t = _i / _STEPS
-        _cr = _TOP_C[0] + _t*(_BOT_C[0]-_TOP_C[0])
-        _cg = _TOP_C[1] + _t*(_BOT_C[1]-_TOP_C[1])
-        _cb = _TOP_C[2] + _t*(_BOT_C[2]-_TOP_C[2])
-        _sh = B3_H / _STEPS
-        _sy = B3_TOP - (_i+1)*_sh
-        ax.add_patch(plt.Rectangle(
-            (PAD, _sy), FW-PAD*2, _sh+0.02,
-            facecolor=(_cr,_cg,_cb), edgecolor='none', zorder=1))
-    # Bordo arrotondato sopra
-    ax.add_patch(FancyBboxPatch(
-        (PAD, B3_BOT), FW-PAD*2, B3_H,
-        boxstyle='round,pad=0.07', facecolor='none',
-        edgecolor='none', linewidth=0, zorder=2))
-
-    mid = B3_BOT + B3_H/2     # centro verticale del box3
-
-    t(FW/2, B3_TOP-0.18,
-      "RISULTATO \u2014 Tasso Interno di Rendimento a 10 anni",
-      ha='center', va='center', fontsize=8.5, fontweight='bold', color=H['g4'])
-
-    # IRR grande
-    t(FW/2, mid+0.38,
-      f"{irr_pct}%",
-      ha='center', va='center', fontsize=34, fontweight='bold', color=H['au'])
-    t(FW/2, mid+0.06,
-      "rendimento annuo composto",
-      ha='center', va='center', fontsize=9, color=H['g4'])
-
-    # 3 KPI
-    chiavi=[(_f(costo),"investimento"),(_f(round(sum(fs))),"benefici 10 anni"),
-            (_f(round(sum(fs)-costo)),"valore netto generato")]
-    for i,(val,lbl) in enumerate(chiavi):
-        cx = FW*0.17+i*FW*0.33
-        t(cx, mid-0.38, f"\u20ac {val}", ha='center', va='center',
-          fontsize=9.5, fontweight='bold', color=H['au'])
-        t(cx, mid-0.60, lbl, ha='center', va='center',
-          fontsize=7.5, color=H['g4'])
-    t(FW/2, B3_BOT+0.12,
-      "Rendimento superiore a qualsiasi strumento finanziario tradizionale a rischio equivalente.",
-      ha='center', va='center', fontsize=7.5, color=H['g4'], style='italic')
-
-    return _save(fig,'irr'), irr_pct
-
-
-def make_confronto_html(irr_pct):
+class SchedaIRR(_Scheda):
+    """
+    Scheda IRR: formula generica, formula con i flussi del cliente e box
+    risultato con gradiente. Coordinate in pollici come la vecchia figura.
+    """
+    FW, FH, PAD = 7.4, 5.4, 0.12
+
+    def __init__(self, costo, piano, irr_10, incremento, larghezza=7.4 * 72, altezza_max=None):
+        _Scheda.__init__(self, larghezza, altezza_max)
+        self.costo = costo
+        self.fs = piano.totale[:10].tolist()
+        self.irr_pct = round(irr_10, 2)
+        self.incremento = incremento
+        self.x0, self.x1, self.y0, self.y1 = 0, self.FW, 0, self.FH
+
+    # -- formule: sequenze di testo, frazioni e sommatoria centrate su un asse
+
+    def _misura(self, voce, fs):
+        tipo = voce[0]
+        if tipo == "t":
+            return stringWidth(voce[1], voce[2], fs)
+        if tipo == "frac":
+            return max(self._misura(voce[1], fs), self._misura(voce[2], fs)) + fs * 0.3
+        if tipo in ("pot", "ped"):   # base con esponente / pedice
+            return stringWidth(voce[1], "Helvetica", fs) + stringWidth(voce[2], "Helvetica-Oblique", fs * 0.7)
+        if tipo == "sum":
+            return max(stringWidth("\u2211", "Symbol", fs * 1.6),
+                       stringWidth(voce[1], "Helvetica-Oblique", fs * 0.7),
+                       stringWidth(voce[2], "Helvetica-Oblique", fs * 0.7)) + fs * 0.2
+
+    def _voce(self, c, voce, x, asse, fs, colore):
+        tipo = voce[0]
+        w = self._misura(voce, fs)
+        if tipo == "t":
+            c.setFont(voce[2], fs); c.drawString(x, asse - fs * 0.3, voce[1])
+        elif tipo in ("pot", "ped"):
+            c.setFont("Helvetica", fs); c.drawString(x, asse - fs * 0.3, voce[1])
+            c.setFont("Helvetica-Oblique", fs * 0.7)
+            c.drawString(x + stringWidth(voce[1], "Helvetica", fs),
+                         asse + (fs * 0.15 if tipo == "pot" else -fs * 0.5), voce[2])
+        elif tipo == "frac":
+            num, den = voce[1], voce[2]
+            self._voce(c, num, x + (w - self._misura(num, fs)) / 2, asse + fs * 0.6, fs, colore)
+            self._voce(c, den, x + (w - self._misura(den, fs)) / 2, asse - fs * 0.75, fs, colore)
+            c.setStrokeColor(_rl(colore)); c.setLineWidth(fs * 0.05)
+            c.line(x + fs * 0.1, asse, x + w - fs * 0.1, asse)
+        elif tipo == "sum":
+            c.setFont("Symbol", fs * 1.6)
+            c.drawCentredString(x + w / 2, asse - fs * 0.55, "\u2211")
+            c.setFont("Helvetica-Oblique", fs * 0.7)
+            c.drawCentredString(x + w / 2, asse + fs * 0.95, voce[2])
+            c.drawCentredString(x + w / 2, asse - fs * 1.25, voce[1])
+        return w
+
+    def formula(self, cx, cy, voci, fs, colore):
+        c = self.canv
+        c.setFillColor(_rl(colore))
+        X, Y = self.P(cx, cy)
+        x = X - sum(self._misura(v, fs) for v in voci) / 2
+        for v in voci:
+            x += self._voce(c, v, x, Y, fs, colore)
+
+    # -- layout
+
+    def disegna(self, c):
+        FW, FH, PAD = self.FW, self.FH, self.PAD
+        fs, costo, irr_pct = self.fs, self.costo, self.irr_pct
+        def _f(n): return f"{round(n):,}".replace(",", ".")
+        R, I = "Helvetica", "Helvetica-Oblique"
+
+        def box(x, ytop, w, h, fc, ec, lw=1.2, r=0.07):
+            self.box(x, ytop - h, w, h, fc, ec, lw=lw, r=r)
+
+        self.testo(FW/2, FH-0.20, "Tasso Interno di Rendimento (IRR)",
+                   fs=10.5, bold=True, colore=H["g1"], ha="center", va="top")
+        self.testo(FW/2, FH-0.52,
+                   "L\u2019IRR \u00e8 il rendimento annuo composto che azzera il Valore Attuale Netto"
+                   " dell\u2019investimento.", fs=7.5, colore=H["grm"], ha="center")
+        self.testo(FW/2, FH-0.73,
+                   "Pi\u00f9 \u00e8 alto, pi\u00f9 l\u2019investimento \u00e8 conveniente rispetto"
+                   " ad alternative finanziarie di pari rischio.", fs=7.5, colore=H["grm"], ha="center")
+
+        # -- formula generica
+        B1_TOP, B1_H = FH - 0.94, 1.10
+        box(PAD, B1_TOP, FW-PAD*2, B1_H, H["g5"], H["g2"], lw=1.4)
+        self.formula(FW/2, B1_TOP-0.32, [
+            ("t", "0 = \u2212", R), ("t", "I", I), ("t", " + ", R), ("sum", "t=1", "n"),
+            ("frac", ("ped", "CF", "t"), ("pot", "(1+r)", "t")),
+        ], 13.5, H["g1"])
+        vars_ = [("I", "Investimento iniziale"), ("CF1\u2026CFn", "Benefici annui"),
+                 ("r", "IRR \u2014 tasso cercato"), ("t", "Anno (1\u2026n)"),
+                 ("n", "Durata 10 anni"), ("NPV", "Val. att. netto\u00a0=\u00a00")]
+        for vi, (sym, desc) in enumerate(vars_):
+            col, row = vi % 3, vi // 3
+            vx, vy = 0.28 + col*2.30, B1_TOP - 0.68 - row*0.23
+            w = self.testo(vx, vy, sym, fs=7, italic=True, colore=H["grm"])
+            self.testo(vx + w, vy, " = " + desc, fs=7, colore=H["grm"])
+
+        self.testo(FW/2, B1_TOP-B1_H-0.16, "Applicata al caso in esame:",
+                   fs=7.5, italic=True, colore=H["grm"], ha="center")
+
+        # -- formula con i valori del cliente
+        B2_TOP, B2_H = B1_TOP - B1_H - 0.32, 0.78
+        box(PAD, B2_TOP, FW-PAD*2, B2_H, H["abg"], H["au"], lw=1.4)
+        def termini(valori, primo_anno):
+            voci = []
+            for i, v in enumerate(valori):
+                if i: voci.append(("t", " + ", R))
+                voci.append(("frac", ("t", _f(v), R), ("pot", "(1+r)", str(primo_anno + i))))
+            return voci
+        self.formula(FW/2, B2_TOP-0.22,
+                     [("t", f"0 = \u2212{_f(costo)} + ", R)] + termini(fs[:5], 1), 8, H["g1"])
+        self.formula(FW/2, B2_TOP-0.55, [("t", "+ ", R)] + termini(fs[5:], 6), 8, H["g1"])
+
+        self.testo(FW/2, B2_TOP-B2_H-0.15,
+                   f"Incremento tariffe {self.incremento*100:.1f}%/anno \u2014 risolvendo numericamente per r:",
+                   fs=7, italic=True, colore=H["grm"], ha="center")
+
+        # -- risultato: gradiente nativo #256040 -> #152E24
+        B3_TOP, B3_BOT = B2_TOP - B2_H - 0.30, 0.08
+        B3_H = B3_TOP - B3_BOT
+        x0, y0 = self.P(PAD, B3_BOT)
+        x1, y1 = self.P(FW - PAD, B3_TOP)
+        _gradient_rect(c, x0, y0, x1 - x0, y1 - y0, top_hex="#256040", bot_hex="#152E24")
+
+        mid = B3_BOT + B3_H/2
+        self.testo(FW/2, B3_TOP-0.18, "RISULTATO \u2014 Tasso Interno di Rendimento a 10 anni",
+                   fs=8.5, bold=True, colore=H["g4"], ha="center")
+        self.testo(FW/2, mid+0.38, f"{irr_pct}%" if irr_pct == irr_pct else "n.d.",
+                   fs=34, bold=True, colore=H["au"], ha="center")
+        self.testo(FW/2, mid+0.06, "rendimento annuo composto", fs=9, colore=H["g4"], ha="center")
+
+        chiavi = [(_f(costo), "investimento"), (_f(round(sum(fs))), "benefici 10 anni"),
+                  (_f(round(sum(fs)-costo)), "valore netto generato")]
+        for i, (val, lbl) in enumerate(chiavi):
+            cx = FW*0.17 + i*FW*0.33
+            self.testo(cx, mid-0.38, f"\u20ac {val}", fs=9.5, bold=True, colore=H["au"], ha="center")
+            self.testo(cx, mid-0.60, lbl, fs=7.5, colore=H["g4"], ha="center")
+        self.testo(FW/2, B3_BOT+0.12,
+                   "Rendimento superiore a qualsiasi strumento finanziario tradizionale a rischio equivalente.",
+                   fs=7.5, italic=True, colore=H["g4"], ha="center")
+
+
+def make_irr_image(costo, piano, irr_10, incremento, larghezza=7.4 * 72, altezza_max=None):
+    """IRR come Flowable reportlab (niente matplotlib).
+    Flussi e IRR (in %) arrivano dal calcolatore: nessun ricalcolo qui."""
+    return SchedaIRR(costo, piano, irr_10, incremento, larghezza, altezza_max)
+
+
+@in_cache("confronto", STILE_GRAFICI)
+def make_confronto_html(irr_pct, formato="png"):
     strumenti = [
         ("Rendita Attiva Next (questa simulazione)", irr_pct,  H['g1'], True,  "No"),
         ("BTP decennale",                            3.8,       H['g3'], False, "SÃ¬"),
@@ -994,6 +705,8 @@ def make_confronto_html(irr_pct):
     TOP  = 0.50    # titolo sezione
     FIG_H = TOP + HDR + n * RH + 0.20
 
+    plt = _plt()
+    from matplotlib.patches import FancyBboxPatch
     fig = plt.figure(figsize=(FW, FIG_H), facecolor='white')
     ax  = fig.add_axes([0, 0, 1, 1])
     ax.set_facecolor('white'); ax.axis('off')
@@ -1051,42 +764,34 @@ def make_confronto_html(irr_pct):
         t(6.95, ry + RH/2, liq, ha='left', va='center',
           fontsize=8.5, color=liq_col, fontweight=fw_txt)
 
-    return _save(fig, 'confronto')
+    return _save(fig, 'confronto', formato)
 
 
 # ââ 3. BENEFICIO CUMULATO 10/20 anni con composizione voci âââââââââââââââââ
-def make_benefici_cumulato(ra, rr, rc, det, rsp, inc=0.03,
-                            b10=None, b20=None):
-    """Due barre: totale cumulato 10a e 20a, suddivise per voce."""
+@in_cache("benefici_cumulato", STILE_GRAFICI)
+def make_benefici_cumulato(piano, formato="png"):
+    """Due barre: totale cumulato 10a e 20a, suddivise per voce (dal PianoFlussi)."""
+    plt = _plt()
+    import matplotlib.patches as mpatches
     plt.rcParams.update({'font.family':'DejaVu Sans'})
     fig, ax = plt.subplots(figsize=(7.4,3.2), facecolor='white')
     ax.set_facecolor('#F9FFFA')
 
-    # Calcola cumulati per voce su 10 e 20 anni
-    def cumul_voce(key, anni):
-        tot = 0
-        for y in range(1, anni+1):
-            mlt = (1+inc)**(y-1)
-            if key=='auto': tot += round(ra*mlt)
-            elif key=='rid': tot += round(rr*mlt)
-            elif key=='cer': tot += round(rc*mlt)
-            elif key=='det': tot += (det if y<=10 else 0)
-            elif key=='boll': tot += round(rsp*mlt)
-        return tot
-
-    voci   = ['auto','rid','cer','det','boll']
+    # Cumulati per voce: somme delle colonne del piano
+    colonne = [piano.autoconsumo, piano.rid, piano.cer, piano.detrazione, piano.bolletta]
+
     labels_v = ['Autoconsumo','RID','CER','Detrazione','Bolletta']
     colors = ['#1B4332','#2D6A4F','#52B788','#E9C46A','#F4A261']
     bar_labels = ['10 anni','20 anni']
 
-    data_10 = [cumul_voce(k,10) for k in voci]
-    data_20 = [cumul_voce(k,20) for k in voci]
+    data_10 = [float(col[:10].sum()) for col in colonne]
+    data_20 = [float(col[:20].sum()) for col in colonne]
 
     x = [0, 1]
     width = 0.55
     bot_10, bot_20 = 0, 0
     bars_list = []
-    for (key,col,lbl), v10, v20 in zip(zip(voci,colors,labels_v), data_10, data_20):
+    for col, lbl, v10, v20 in zip(colors, labels_v, data_10, data_20):
         b1 = ax.bar(0, v10, width, bottom=bot_10, color=col,
                     edgecolor='white', linewidth=0.8, label=lbl, zorder=3)
         b2 = ax.bar(1, v20, width, bottom=bot_20, color=col,
@@ -1126,18 +831,18 @@ def make_benefici_cumulato(ra, rr, rc, det, rsp, inc=0.03,
               bbox_to_anchor=(0.5, -0.14))
     fig.tight_layout(pad=0.6)
     plt.subplots_adjust(bottom=0.22)
-    return _save(fig,'benefici_cumulato')
+    return _save(fig,'benefici_cumulato', formato)
 
 
 # ââ 4. PAYBACK elegante âââââââââââââââââââââââââââââââââââââââââââââââââââââââ
-def make_payback_elegant(costo, b10, b11):
+@in_cache("payback", STILE_GRAFICI)
+def make_payback_elegant(costo, piano, formato="png"):
+    plt = _plt()
     plt.rcParams.update({'font.family':'DejaVu Sans'})
     fig, ax = plt.subplots(figsize=(7.4, 3.2), facecolor='white')
     ax.set_facecolor('#F9FFFA')
 
-    anni = list(range(0,21)); vals=[0]; cum=0
-    for a in range(1,21):
-        cum += (b10 if a<=10 else b11); vals.append(cum)
+    anni = list(range(0,21)); vals=[0.0] + piano.cumulato[:20].tolist()
 
     # area gradiente simulata con fill_between
     ax.fill_between(anni, vals, alpha=0.12, color=H['g2'], zorder=1)
@@ -1202,7 +907,422 @@ def make_payback_elegant(costo, b10, b11):
     ax.spines['left'].set_color(H['gb2']); ax.spines['bottom'].set_color(H['gb2'])
 
     fig.tight_layout(pad=0.5)
-    return _save(fig,'payback')
+    return _save(fig,'payback', formato)
+
+
+# -- RENDERING GRAFICI IN PARALLELO -------------------------------------------
+_POOL_GRAFICI = None
+_POOL_LOCK = threading.Lock()
+
+
+def _disegna(nome, args):
+    """Nei worker: disegna il grafico `nome` senza cache e ne ritorna il PNG."""
+    return globals()[nome].senza_cache(*args)
+
+
+def _pool_grafici():
+    """
+    Pool unico del processo, creato al primo uso con CFG.PROCESSI_GRAFICI
+    worker (o uno per core) e chiuso solo all'uscita: i report
+    contemporanei lo condividono e limitano i propri lavori in volo.
+    """
+    global _POOL_GRAFICI
+    with _POOL_LOCK:
+        if _POOL_GRAFICI is None:
+            # creato dai thread dei lavori PDF o del server: fork copierebbe
+            # lock tenuti da altri thread (logging, cache di matplotlib e
+            # reportlab) e il worker potrebbe bloccarsi
+            _POOL_GRAFICI = ProcessPoolExecutor(
+                max_workers=CFG.PROCESSI_GRAFICI or os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+        return _POOL_GRAFICI
+
+
+def _scarta_pool_grafici(pool):
+    """Dimentica un pool rotto (un worker e' morto): il prossimo uso ne crea uno nuovo."""
+    global _POOL_GRAFICI
+    with _POOL_LOCK:
+        if _POOL_GRAFICI is pool:
+            _POOL_GRAFICI = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _chiudi_pool_grafici():
+    global _POOL_GRAFICI
+    with _POOL_LOCK:
+        if _POOL_GRAFICI is not None:
+            _POOL_GRAFICI.shutdown(wait=False, cancel_futures=True)
+            _POOL_GRAFICI = None
+
+
+def render_grafici(lavori, processi=None):
+    """
+    lavori: {etichetta: (funzione con @in_cache, args)} -> {etichetta: PNG in byte}.
+
+    I grafici gia' in cache non vengono ridisegnati; gli altri girano in
+    parallelo sul pool di processi condiviso, al massimo `processi` per
+    volta. processi: None = CFG.PROCESSI_GRAFICI o un processo per grafico
+    (al massimo i core); 0 o 1 = in serie nel processo corrente (debug).
+    """
+    mancanti = {}
+    for etichetta, (funzione, args) in lavori.items():
+        chiave = funzione.chiave(*args)
+        if funzione.cache().cerca(chiave) is None:
+            mancanti[etichetta] = chiave
+
+    if processi is None:
+        processi = CFG.PROCESSI_GRAFICI
+    if processi is None:
+        processi = min(len(mancanti), os.cpu_count() or 1)
+
+    if processi > 1 and len(mancanti) > 1:
+        pool = _pool_grafici()
+        coda, in_volo = list(mancanti), {}
+        try:
+            while coda or in_volo:
+                while coda and len(in_volo) < processi:
+                    etichetta = coda.pop()
+                    funzione, args = lavori[etichetta]
+                    in_volo[pool.submit(_disegna, funzione.__name__, args)] = etichetta
+                pronti, _ = wait(in_volo, return_when=FIRST_COMPLETED)
+                for futuro in pronti:
+                    etichetta = in_volo.pop(futuro)
+                    lavori[etichetta][0].cache().salva(mancanti[etichetta], futuro.result())
+        except (BrokenProcessPool, OSError):
+            # pool non disponibile: i grafici mancanti si fanno qui sotto in serie
+            _scarta_pool_grafici(pool)
+        except RuntimeError:
+            # pool gia' chiuso (uscita dell'interprete): in serie
+            pass
+
+    # in serie (o hit di cache): la funzione decorata ritorna i byte in cache
+    return {etichetta: funzione(*args) for etichetta, (funzione, args) in lavori.items()}
+
+
+atexit.register(_chiudi_pool_grafici)
+
+
+FORMATI_GRAFICI = ("png", "svg")
+
+
+def _formato_grafici(formato):
+    """Formato effettivo: "svg" richiede svglib, altrimenti si torna al PNG."""
+    formato = formato or CFG.FORMATO_GRAFICI
+    if formato not in FORMATI_GRAFICI:
+        raise ValueError(f"formato grafici non valido: {formato!r}")
+    if formato == "svg":
+        try:
+            import svglib.svglib  # noqa: F401
+        except ImportError:
+            return "png"
+    return formato
+
+
+@functools.lru_cache(maxsize=None)
+def _registra_font_svg():
+    """DejaVu Sans (il font dei grafici, incluso in matplotlib) per svglib."""
+    import matplotlib
+    from svglib.fonts import register_font
+    cartella = os.path.join(matplotlib.get_data_path(), "fonts", "ttf")
+    file = {("normal", "normal"): "DejaVuSans.ttf",
+            ("bold", "normal"): "DejaVuSans-Bold.ttf",
+            ("normal", "italic"): "DejaVuSans-Oblique.ttf",
+            ("bold", "italic"): "DejaVuSans-BoldOblique.ttf"}
+    # matplotlib scrive il grassetto come 700 e il corsivo anche come oblique
+    for peso in ("normal", "bold", "700"):
+        for stile in ("normal", "italic", "oblique"):
+            f = file["bold" if peso != "normal" else "normal", "normal" if stile == "normal" else "italic"]
+            register_font("DejaVu Sans", os.path.join(cartella, f), weight=peso, style=stile)
+    register_font("DejaVu Sans Display", os.path.join(cartella, "DejaVuSansDisplay.ttf"))
+
+
+@functools.lru_cache(maxsize=32)
+def _svg_drawing(dati):
+    """SVG -> Drawing reportlab, analizzato una volta sola per contenuto."""
+    from svglib.svglib import svg2rlg
+    _registra_font_svg()
+    return svg2rlg(io.BytesIO(dati))
+
+
+def _img(dati, width, height=None):
+    """
+    Flowable reportlab da un grafico in memoria: PNG -> Image,
+    SVG -> Drawing vettoriale (svglib). Senza height mantiene le proporzioni.
+    """
+    if dati.lstrip()[:5] in (b"<?xml", b"<svg "):
+        d = _svg_drawing(dati)
+        if height is None:
+            height = width * d.height / d.width
+        # nuovo Drawing scalato: quello in cache resta intatto
+        gruppo = Group(*d.contents, transform=(width / d.width, 0, 0, height / d.height, 0, 0))
+        return Drawing(width, height, gruppo)
+
+    if height is None:
+        iw, ih = ImageReader(io.BytesIO(dati)).getSize()
+        height = width * ih / iw
+    return Image(io.BytesIO(dati), width=width, height=height)
+
+
+# âââ PAGINE MODELLO ââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââ
+# Le pagine di solo testo (presentazione e valutazione finale) vengono
+# impaginate una volta per versione del modello; per ogni cliente si
+# impaginano soltanto i paragrafi con i suoi dati, nei posti lasciati liberi.
+# Incrementare VERSIONE_MODELLO quando cambiano i testi o gli stili qui sotto.
+VERSIONE_MODELLO = 1
+
+TESTO_PRESENTAZIONE = [
+    "Questa iniziativa nasce da un\u2019idea molto semplice. Quando si realizza un impianto fotovoltaico residenziale, normalmente si sceglie una potenza \u00absufficiente\u00bb.",
+    "Noi abbiamo scelto un approccio diverso.",
+    "Attraverso questa promozione abbiamo deciso di proporre un sistema completo \u2013 comprensivo di accumulo da 16 kWh \u2013 e di sfruttare al massimo la superficie disponibile del tetto, senza aumentare il prezzo rispetto alla configurazione base.",
+    "<b>Vediamo come funziona.</b>",
+    "Abbiamo suddiviso gli impianti monofase fino a 10 kW in due categorie:",
+    "\u2022 la prima va da 3,28 kW fino a 5,74 kW",
+    "\u2022 la seconda va da 6,56 kW fino a 9,84 kW",
+    "All\u2019interno di ciascuna categoria esiste una potenza base, che \u00e8 la pi\u00f9 bassa della fascia (3,28 e 6,56 kWp). Il prezzo viene determinato su quella potenza minima, ma installiamo tutta la potenza che il tetto pu\u00f2 ospitare rimanendo all\u2019interno della stessa categoria, <b>senza aumentare il prezzo rispetto alla configurazione iniziale</b>.",
+    "In altre parole, paghi l\u2019impianto base della fascia, ma ottieni tutta la potenza tecnicamente installabile nella stessa categoria. Ogni sistema \u00e8 completo di accumulo da 16 kWh, incluso nel progetto.",
+    "Ad esempio, nella prima fascia, il sistema completo (impianto + accumulo da 16 kWh) da 3,28 kWp ha un prezzo di 11.900 euro. Se il tetto consente una potenza superiore rispetto ai 3,28 kW iniziali, questa viene installata senza maggiorazioni di prezzo fino a 5,74 kWp.",
+    "<b>Cosa significa, concretamente?</b>",
+    "Significa produrre pi\u00f9 energia durante l\u2019anno.",
+    "Significa aumentare l\u2019autoconsumo reale grazie alla batteria da 16 kWh, che consente di utilizzare anche la sera l\u2019energia prodotta di giorno.",
+    "Significa avere una quantit\u00e0 maggiore di energia che pu\u00f2 essere immessa in rete.",
+    "Ed \u00e8 qui che l\u2019impianto cambia natura. Fino a quel punto stiamo parlando di risparmio. Dal momento in cui l\u2019energia prodotta supera quella consumata e viene immessa in rete, entriamo in una logica diversa.",
+    "<b>1) L\u2019energia non autoconsumata viene valorizzata attraverso il Ritiro Dedicato.</b>",
+    "<b>2) Se condivisa tramite la Comunit\u00e0 Energetica, riceve un incentivo aggiuntivo sull\u2019energia immessa.</b>",
+    "In termini pratici, l\u2019energia prodotta in eccesso genera un ritorno economico. E pi\u00f9 l\u2019impianto produce, maggiore diventa questa componente. A questo si aggiunge la detrazione fiscale del 50% in dieci anni. Il risultato \u00e8 un sistema che agisce su pi\u00f9 livelli contemporaneamente: riduce la spesa energetica annua, aumenta l\u2019autonomia dalla rete, valorizza l\u2019energia immessa, beneficia della Comunit\u00e0 Energetica, recupera parte dell\u2019investimento tramite detrazione. Non si tratta semplicemente di installare un impianto pi\u00f9 grande. Si tratta di utilizzare in modo pi\u00f9 intelligente la stessa struttura tecnica per trasformare il tetto in una piattaforma di produzione energetica evoluta. Questa \u00e8 la logica del Sistema di Rendita Energetica Attiva Next: non limitarsi a compensare la bolletta, ma creare una dinamica economica pi\u00f9 ampia, capace di generare valore nel tempo, una rendita energetica appunto.",
+]
+
+# Valutazione finale: le stringhe sono testo fisso, gli interi indicano
+# il paragrafo con i dati del cliente (vedi _campi_chiusura)
+TESTO_CHIUSURA = [
+    "Il grafico e i dati che precedono mostrano chiaramente che, nel corso di 10 anni, "
+    "il Risparmio Complessivo Totale generato dal Sistema di Rendita Energetica Attiva "
+    "supera ampiamente il capitale iniziale investito.",
+    0,
+    1,
+    "",
+    "In un contesto di mercati energetici volatili e strutturalmente in crescita, "
+    "proteggersi dal rischio di aumento dei costi dell\u2019energia elettrica non \u00e8 "
+    "un\u2019opzione secondaria, ma rappresenta una leva di stabilit\u00e0 economica nel "
+    "medio-lungo periodo.",
+    2,
+    "Qualora tali dinamiche dovessero ripetersi nelle stesse proporzioni, il beneficio "
+    "economico cumulato risulterebbe ulteriormente maggiore.",
+    "In altre parole, ogni anno che passa senza realizzare l\u2019intervento equivale a:",
+    "\u2022 perdere una opportunit\u00e0 di ridurre la spesa energetica;",
+    "\u2022 rinunciare a una rendita energetica positiva;",
+    "\u2022 esporsi ulteriormente all\u2019aumento dei costi dell\u2019energia.",
+    "",
+    "Questa dinamica si traduce in un costo opportunit\u00e0 concreto, che cresce con "
+    "l\u2019aumento dei prezzi e con l\u2019allungamento dell\u2019orizzonte temporale. "
+    "In pi\u00f9, \u00e8 possibile strutturare l\u2019investimento con soluzioni di "
+    "finanziamento dedicate, che consentono di distribuire la spesa nel tempo, spesso in "
+    "modo sostenibile rispetto al flusso economico annuo generato dalla Rendita Energetica "
+    "Attiva.",
+    "",
+    "Scegliere di attivare il Sistema di Rendita Energetica Attiva Next significa "
+    "trasformare una spesa energetica futura incerta in un flusso di valore definito "
+    "e progressivamente crescente nel tempo.",
+    "",
+    "NEXT SRL \u2014 Report simulazione",
+    "Valori indicativi",
+    3,
+]
+
+
+def _sezione_presentazione(campo):
+    """Pag. 2: testo commerciale. campo(i) -> flowable del paragrafo dinamico i."""
+    story = [
+        Paragraph("Sistema di Rendita Energetica Attiva Next", ST),
+        Spacer(1,4*mm),
+        Paragraph(
+            "<b>Iniziativa valida fino al 30 marzo 2026 e limitata ai primi 20 impianti.</b>",
+            SBB),
+        Spacer(1,4*mm),
+        campo(0),
+        campo(1),
+        Spacer(1,6*mm),
+    ]
+    for p in TESTO_PRESENTAZIONE:
+        st_p = SBU if p.startswith("\u2022") else SB
+        story.append(Paragraph(p, st_p))
+        story.append(Spacer(1,2*mm))
+    return story
+
+
+def _campi_presentazione(cliente, oggi):
+    return [
+        Paragraph(f"<b>Cliente:</b> {cliente}", SB),
+        Paragraph(f"<b>Data simulazione:</b> {oggi}", SB),
+    ]
+
+
+def _sezione_chiusura(campo):
+    """Valutazione economico/strategica complessiva (ultima pagina)."""
+    story = [Paragraph("Valutazione Economico/Strategica Complessiva", ST), Spacer(1,3*mm)]
+    for p in TESTO_CHIUSURA:
+        if isinstance(p, int):
+            story.append(campo(p))
+        else:
+            story.append(Paragraph(p, SBU if p.startswith("\u2022") else SB))
+        story.append(Spacer(1,2*mm))
+    return story
+
+
+def _campi_chiusura(van10, costo_impianto, differenza_netto, incremento, oggi):
+    return [
+        Paragraph(
+            f"In questo caso, \u00e8 stato stimato un beneficio cumulato di \u20ac {fmt(van10)} "
+            f"a fronte di un investimento di \u20ac {fmt(costo_impianto)}.", SB),
+        Paragraph(
+            f"<b>Non realizzare l\u2019intervento significa rinunciare a un valore economico "
+            f"potenziale netto di oltre \u20ac {fmt(differenza_netto)} in 10 anni \u2014 risorse "
+            f"che rimangono nella bolletta energetica o nei costi di acquisto dalla rete.</b>", SB),
+        Paragraph(
+            f"Secondo i dati storici, il prezzo medio dell\u2019energia elettrica per la clientela "
+            f"domestica in Italia \u00e8 cresciuto mediamente tra il 3% e il 5% all\u2019anno negli "
+            f"ultimi 20 anni. Negli ultimi cicli di mercato questa dinamica si \u00e8 ancor pi\u00f9 "
+            f"accentuata, con impatti significativi sulle famiglie e sui budget familiari. La presente "
+            f"simulazione considera un incremento futuro dei prezzi dell\u2019energia pari a "
+            f"{incremento*100:.1f}%.", SB),
+        Paragraph(f"Data {oggi}", SB),
+    ]
+
+
+def _frame():
+    return Frame(ML,MB+FTR_H,BW,
+                 PH-HDR_H-HDR_LINE-MT-MB-FTR_H,
+                 leftPadding=0,rightPadding=0,topPadding=0,bottomPadding=0)
+
+
+def _documento(uscita):
+    return BaseDocTemplate(uscita,pagesize=A4,
+        leftMargin=ML,rightMargin=MR,
+        topMargin=HDR_H+HDR_LINE+MT,bottomMargin=MB+FTR_H)
+
+
+class _CanvasModello(Canvas):
+    """Canvas che conserva il content stream di ogni pagina, senza preambolo."""
+
+    def __init__(self, *args, **kwargs):
+        Canvas.__init__(self, *args, **kwargs)
+        self.pagine = []
+
+    def showPage(self):
+        self.pagine.append("\n".join(self._code))
+        Canvas.showPage(self)
+
+
+class _Segnaposto(Flowable):
+    """
+    Posto di un paragrafo dinamico nella pagina modello: stesse misure e
+    spaziature del paragrafo, non disegna nulla e registra dove e' caduto.
+    """
+
+    def __init__(self, paragrafo, posizioni, i):
+        Flowable.__init__(self)
+        self.paragrafo, self.posizioni, self.i = paragrafo, posizioni, i
+
+    def wrap(self, aw, ah):
+        return self.paragrafo.wrap(aw, ah)
+
+    def getSpaceBefore(self):
+        return self.paragrafo.getSpaceBefore()
+
+    def getSpaceAfter(self):
+        return self.paragrafo.getSpaceAfter()
+
+    def drawOn(self, canvas, x, y, _sW=0):
+        self.posizioni[self.i] = (canvas.getPageNumber() - 1, x, y)
+
+
+_RE_FONT = re.compile(r"(/F\d+)( [-\d.]+ Tf)")
+# operatori che richiedono risorse della pagina (trasparenze, immagini, gradienti)
+_RE_RISORSE = re.compile(r"\s(gs|Do|sh)\s")
+
+
+class _PaginaModello(Flowable):
+    """
+    Pagina modello gia' impaginata: il suo content stream viene copiato
+    nella pagina corrente (nomi dei font rimappati sul documento) e sopra
+    vengono disegnati i paragrafi dinamici nelle posizioni registrate.
+    """
+
+    def __init__(self, codice, font, campi):
+        Flowable.__init__(self)
+        self.codice, self.font, self.campi = codice, font, campi
+
+    def wrap(self, aw, ah):
+        return (aw, 0)
+
+    def drawOn(self, canvas, x, y, _sW=0):
+        nomi = {interno: canvas._doc.getInternalFontName(ps) for interno, ps in self.font.items()}
+        codice = _RE_FONT.sub(lambda m: nomi[m.group(1)] + m.group(2), self.codice)
+        # q/Q e preambolo: la pagina modello parte dallo stato grafico di inizio pagina
+        canvas.addLiteral(f"q {canvas._preamble}\n{codice}\nQ")
+        for paragrafo, px, py in self.campi:
+            paragrafo.drawOn(canvas, px, py)
+
+
+_MODELLI = OrderedDict()
+_MODELLI_LOCK = threading.Lock()
+
+
+def _impagina_modello(sezione, campi):
+    """
+    Impagina la sezione con i segnaposto al posto dei campi dinamici.
+    Ritorna (content stream per pagina, font {nome interno: nome}, posizioni
+    {campo: (pagina, x, y)}) o None se le pagine non sono solo testo.
+    """
+    posizioni = {}
+    canvas = []
+    def crea_canvas(*args, **kwargs):
+        canvas.append(_CanvasModello(*args, **kwargs))
+        return canvas[0]
+
+    doc = _documento(io.BytesIO())
+    doc.addPageTemplates([PageTemplate(id="modello", frames=[_frame()])])
+    doc.build(sezione(lambda i: _Segnaposto(campi[i], posizioni, i)), canvasmaker=crea_canvas)
+
+    pagine = canvas[0].pagine
+    if len(posizioni) != len(campi) or any(_RE_RISORSE.search(p) for p in pagine):
+        return None
+    font = {interno: ps for ps, interno in canvas[0]._doc.fontMapping.items()}
+
+    return pagine, font, posizioni
+
+
+def _pagine_sezione(nome, sezione, campi, modello=True):
+    """
+    Flowable di una sezione di testo. Con modello=True le parti fisse
+    vengono dalle pagine modello in memoria, impaginate alla prima
+    richiesta per ogni combinazione di altezze dei campi dinamici;
+    altrimenti (o se il modello non e' utilizzabile) la sezione completa.
+    """
+    if not modello:
+        return sezione(lambda i: campi[i])
+
+    altezze = tuple(round(p.wrap(BW, PH)[1], 2) for p in campi)
+    chiave = (nome, VERSIONE_MODELLO, altezze)
+    with _MODELLI_LOCK:
+        m = _MODELLI.get(chiave, False)
+    if m is False:
+        m = _impagina_modello(sezione, campi)
+        with _MODELLI_LOCK:
+            _MODELLI[chiave] = m
+            while len(_MODELLI) > 32:
+                _MODELLI.popitem(last=False)
+    if m is None:
+        return sezione(lambda i: campi[i])
+
+    pagine, font, posizioni = m
+    story = []
+    for n, codice in enumerate(pagine):
+        if n: story.append(PageBreak())
+        story.append(_PaginaModello(codice, font, [
+            (campi[i], x, y) for i, (pagina, x, y) in posizioni.items() if pagina == n
+        ]))
+    return story
 
 
 def build_pdf(
@@ -1211,12 +1331,28 @@ def build_pdf(
     prezzo_energia, rid_eur_kwh, cer_eur_kwh,
     quota_condivisa, autoc_base_perc, autoc_bonus_perc,
     incremento,
-    logo_path=None,
+    processi_grafici=None,
+    destinazione=None,
+    formato_grafici=None,
+    pagine_modello=None,
+    avanzamento=None,
 ):
-    global LOGO_PATH
-    if logo_path: LOGO_PATH = logo_path
+    """
+    Report PDF del cliente.
+
+    destinazione: None -> ritorna il PDF in byte (nessun file scritto);
+                  percorso -> scrive il file e ritorna il percorso;
+                  oggetto file-like -> ci scrive il PDF e lo ritorna.
+    formato_grafici: "png" (raster) o "svg" (vettoriale, richiede svglib);
+                  default CFG.FORMATO_GRAFICI.
+    pagine_modello: True -> pagine di solo testo dal modello impaginato
+                  (vedi _pagine_sezione); default CFG.PAGINE_MODELLO.
+    avanzamento:  funzione chiamata con il nome della fase all'inizio di
+                  ciascuna ("grafici", "impaginazione"), per esempio per
+                  una barra di avanzamento.
+    """
+    if pagine_modello is None: pagine_modello = CFG.PAGINE_MODELLO
 
-    filename=f"Report_{cliente}.pdf"
     oggi=datetime.date.today().strftime("%d/%m/%Y")
     anno=datetime.date.today().year
     num_off=f"PREV-{anno}-{abs(hash(cliente))%999999:06d}"
@@ -1236,85 +1372,57 @@ def build_pdf(
     roi10 = int(((van10-costo_impianto)/costo_impianto)*100)
     pct_ben = int((b10/costo_impianto)*100)
 
-    b_p10 = risp_comp
-    b_p11 = (vt - det_ann) + rsp_boll
-
-    cum=0; payback=0
-    for a in range(1,31):
-        bf=b_p10 if a<=10 else b_p11
-        if cum+bf>=costo_impianto:
-            payback=(a-1)+(costo_impianto-cum)/bf; break
-        cum+=bf
+    piano = res["piano_flussi"]
+    payback = res["payback_anni"]
+    if payback != payback: payback = 0   # NaN: rientro oltre l'orizzonte del piano
 
     differenza_netto = van10 - costo_impianto
     tot_pag=10
 
     # ââ GRAFICI ââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââ
-    F1=[(8,3.28,True),(10,4.10,False),(12,4.92,False),(14,5.74,False)]
-    F2=[(16,6.56,True),(18,7.38,False),(20,8.20,False),(22,9.02,False),(24,9.84,False)]
-    rows1=F1; rows2=F2
-    prezzo1=11900; prezzo2=19900
-
-    # Fascia pages rendered via wkhtmltoimage (full quality)
-    g_f1 = render_fascia_png(1, 3.28, 5.74, 11900, 3.28,
-                             bonus_kwp if base_kwp<=5.74 else 5.74)
-    g_f2 = render_fascia_png(2, 6.56, 9.84, 13690, 6.56,
-                             bonus_kwp if base_kwp>5.74 else 9.84)
-    g_irr, irr_pct = make_irr_image(costo_impianto, risp_comp, incremento)
-    g_cmp   = make_confronto_html(irr_pct)
-    g_bvoci = make_benefici_cumulato(ra, rr, rc, det_ann, rsp_boll, incremento)
-    g_pay   = make_payback_elegant(costo_impianto, b_p10, b_p11)
+    (fa1, base1, max1, prezzo1), (fa2, base2, max2, prezzo2) = CFG.FASCE
+
+    irr_pct = round(res["irr_10"], 2)
+    if irr_pct != irr_pct: irr_pct = 0.0   # NaN: IRR non definito
+
+    if avanzamento: avanzamento("grafici")
+    fmt_g = _formato_grafici(formato_grafici)
+    grafici = render_grafici({
+        "cmp":   (make_confronto_html, (irr_pct, fmt_g)),
+        "bvoci": (make_benefici_cumulato, (piano, fmt_g)),
+        "pay":   (make_payback_elegant, (costo_impianto, piano, fmt_g)),
+    }, processi=processi_grafici)
+    g_cmp, g_bvoci, g_pay = (grafici[k] for k in ("cmp", "bvoci", "pay"))
+
+    # schede disegnate direttamente sul canvas
+    g_f1 = render_fascia_png(fa1, base1, max1, prezzo1, base1,
+                             bonus_kwp if base_kwp<=max1 else max1,
+                             larghezza=BW, altezza_max=BW*7.2/7.4)
+    g_f2 = render_fascia_png(fa2, base2, max2, prezzo2, base2,
+                             bonus_kwp if base_kwp>max1 else max2,
+                             larghezza=BW, altezza_max=BW*7.5/7.4)
+    g_irr = make_irr_image(costo_impianto, piano, res["irr_10"], incremento, larghezza=BW)
+
+    if avanzamento: avanzamento("impaginazione")
 
     # ââ STORY âââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââ
     story=[]
 
     # ââââ PAG 2: TESTO COMMERCIALE INTEGRALE ORIGINALE ââââââââââââââââââââââââ
-    story.append(Paragraph("Sistema di Rendita Energetica Attiva Next", ST))
-    story.append(Spacer(1,4*mm))
-    story.append(Paragraph(
-        "<b>Iniziativa valida fino al 30 marzo 2026 e limitata ai primi 20 impianti.</b>",
-        SBB))
-    story.append(Spacer(1,4*mm))
-    story.append(Paragraph(f"<b>Cliente:</b> {cliente}", SB))
-    story.append(Paragraph(f"<b>Data simulazione:</b> {oggi}", SB))
-    story.append(Spacer(1,6*mm))
-
-    testo_pagina1 = [
-        "Questa iniziativa nasce da un\u2019idea molto semplice. Quando si realizza un impianto fotovoltaico residenziale, normalmente si sceglie una potenza \u00absufficiente\u00bb.",
-        "Noi abbiamo scelto un approccio diverso.",
-        "Attraverso questa promozione abbiamo deciso di proporre un sistema completo \u2013 comprensivo di accumulo da 16 kWh \u2013 e di sfruttare al massimo la superficie disponibile del tetto, senza aumentare il prezzo rispetto alla configurazione base.",
-        "<b>Vediamo come funziona.</b>",
-        "Abbiamo suddiviso gli impianti monofase fino a 10 kW in due categorie:",
-        "\u2022 la prima va da 3,28 kW fino a 5,74 kW",
-        "\u2022 la seconda va da 6,56 kW fino a 9,84 kW",
-        "All\u2019interno di ciascuna categoria esiste una potenza base, che \u00e8 la pi\u00f9 bassa della fascia (3,28 e 6,56 kWp). Il prezzo viene determinato su quella potenza minima, ma installiamo tutta la potenza che il tetto pu\u00f2 ospitare rimanendo all\u2019interno della stessa categoria, <b>senza aumentare il prezzo rispetto alla configurazione iniziale</b>.",
-        "In altre parole, paghi l\u2019impianto base della fascia, ma ottieni tutta la potenza tecnicamente installabile nella stessa categoria. Ogni sistema \u00e8 completo di accumulo da 16 kWh, incluso nel progetto.",
-        "Ad esempio, nella prima fascia, il sistema completo (impianto + accumulo da 16 kWh) da 3,28 kWp ha un prezzo di 11.900 euro. Se il tetto consente una potenza superiore rispetto ai 3,28 kW iniziali, questa viene installata senza maggiorazioni di prezzo fino a 5,74 kWp.",
-        "<b>Cosa significa, concretamente?</b>",
-        "Significa produrre pi\u00f9 energia durante l\u2019anno.",
-        "Significa aumentare l\u2019autoconsumo reale grazie alla batteria da 16 kWh, che consente di utilizzare anche la sera l\u2019energia prodotta di giorno.",
-        "Significa avere una quantit\u00e0 maggiore di energia che pu\u00f2 essere immessa in rete.",
-        "Ed \u00e8 qui che l\u2019impianto cambia natura. Fino a quel punto stiamo parlando di risparmio. Dal momento in cui l\u2019energia prodotta supera quella consumata e viene immessa in rete, entriamo in una logica diversa.",
-        "<b>1) L\u2019energia non autoconsumata viene valorizzata attraverso il Ritiro Dedicato.</b>",
-        "<b>2) Se condivisa tramite la Comunit\u00e0 Energetica, riceve un incentivo aggiuntivo sull\u2019energia immessa.</b>",
-        "In termini pratici, l\u2019energia prodotta in eccesso genera un ritorno economico. E pi\u00f9 l\u2019impianto produce, maggiore diventa questa componente. A questo si aggiunge la detrazione fiscale del 50% in dieci anni. Il risultato \u00e8 un sistema che agisce su pi\u00f9 livelli contemporaneamente: riduce la spesa energetica annua, aumenta l\u2019autonomia dalla rete, valorizza l\u2019energia immessa, beneficia della Comunit\u00e0 Energetica, recupera parte dell\u2019investimento tramite detrazione. Non si tratta semplicemente di installare un impianto pi\u00f9 grande. Si tratta di utilizzare in modo pi\u00f9 intelligente la stessa struttura tecnica per trasformare il tetto in una piattaforma di produzione energetica evoluta. Questa \u00e8 la logica del Sistema di Rendita Energetica Attiva Next: non limitarsi a compensare la bolletta, ma creare una dinamica economica pi\u00f9 ampia, capace di generare valore nel tempo, una rendita energetica appunto.",
-    ]
-    for p in testo_pagina1:
-        st_p = SBU if p.startswith("\u2022") else SB
-        story.append(Paragraph(p, st_p))
-        story.append(Spacer(1,2*mm))
+    story += _pagine_sezione("presentazione", _sezione_presentazione,
+                             _campi_presentazione(cliente, oggi), pagine_modello)
     story.append(PageBreak())
 
     # ââââ PAG 3: SCHEDE IMPIANTI FASCIA 1 âââââââââââââââââââââââââââââââââââââ
     story.append(Paragraph("Schede Impianti — Promozione Next", ST))
     story.append(hr())
-    story.append(Image(g_f1, width=BW, height=BW*7.2/7.4))
+    story.append(g_f1)
     story.append(PageBreak())
 
     # ââââ PAG 4: SCHEDE IMPIANTI FASCIA 2 âââââââââââââââââââââââââââââââââââââ
     story.append(Paragraph("Schede Impianti — Fascia 2", ST))
     story.append(hr())
-    story.append(Image(g_f2, width=BW, height=BW*7.5/7.4))
+    story.append(g_f2)
     story.append(PageBreak())
 
     # ââââ PAG 5: SCHEDA TECNICA SIMULAZIONE ââââââââââââââââââââââââââââââââââââ
@@ -1425,13 +1533,9 @@ def build_pdf(
 
 
     # ââââ PAG 7: IRR + CONFRONTO (stessa pagina) ââââââââââââââââââââââââââââ
-    from PIL import Image as _PIL
-    def _ih(p, w):
-        try: im=_PIL.open(p); return w*im.size[1]/im.size[0]
-        except: return w*0.76
-    story.append(Image(g_irr, width=BW, height=_ih(g_irr, BW)))
+    story.append(g_irr)
     story.append(Spacer(1,4*mm))
-    story.append(Image(g_cmp, width=BW, height=_ih(g_cmp, BW)))
+    story.append(_img(g_cmp, width=BW))
     story.append(PageBreak())
 
     # ââââ PAG 8: PAYBACK PRIMA, POI BENEFICIO CUMULATO âââââââââââââââââââââââ
@@ -1447,71 +1551,23 @@ def build_pdf(
     story.append(Paragraph(
         f"<b>L\u2019investimento si ripaga in circa {payback:.1f} anni.</b>", SBB))
     story.append(Spacer(1,3*mm))
-    story.append(Image(g_pay, width=BW, height=BW*3.0/7.4))
+    story.append(_img(g_pay, width=BW, height=BW*3.0/7.4))
     story.append(Spacer(1,6*mm))
     story.append(Paragraph("Beneficio economico cumulato per voce", SH))
     story.append(Paragraph(
         "Composizione del beneficio economico totale cumulato a 10 e 20 anni per voce di ricavo.", SS))
     story.append(Spacer(1,3*mm))
-    story.append(Image(g_bvoci, width=BW, height=BW*3.2/7.4))
+    story.append(_img(g_bvoci, width=BW, height=BW*3.2/7.4))
     story.append(Spacer(1,6*mm))
 
     # ââ VALUTAZIONE ECONOMICO/STRATEGICA COMPLESSIVA ââ
     story.append(PageBreak())
-    story.append(Paragraph("Valutazione Economico/Strategica Complessiva", ST))
-    story.append(Spacer(1,3*mm))
-
-    testo_chiusura=[
-        f"Il grafico e i dati che precedono mostrano chiaramente che, nel corso di 10 anni, "
-        f"il Risparmio Complessivo Totale generato dal Sistema di Rendita Energetica Attiva "
-        f"supera ampiamente il capitale iniziale investito.",
-        f"In questo caso, \u00e8 stato stimato un beneficio cumulato di \u20ac {fmt(van10)} "
-        f"a fronte di un investimento di \u20ac {fmt(costo_impianto)}.",
-        f"<b>Non realizzare l\u2019intervento significa rinunciare a un valore economico "
-        f"potenziale netto di oltre \u20ac {fmt(differenza_netto)} in 10 anni \u2014 risorse "
-        f"che rimangono nella bolletta energetica o nei costi di acquisto dalla rete.</b>",
-        "",
-        "In un contesto di mercati energetici volatili e strutturalmente in crescita, "
-        "proteggersi dal rischio di aumento dei costi dell\u2019energia elettrica non \u00e8 "
-        "un\u2019opzione secondaria, ma rappresenta una leva di stabilit\u00e0 economica nel "
-        "medio-lungo periodo.",
-        f"Secondo i dati storici, il prezzo medio dell\u2019energia elettrica per la clientela "
-        f"domestica in Italia \u00e8 cresciuto mediamente tra il 3% e il 5% all\u2019anno negli "
-        f"ultimi 20 anni. Negli ultimi cicli di mercato questa dinamica si \u00e8 ancor pi\u00f9 "
-        f"accentuata, con impatti significativi sulle famiglie e sui budget familiari. La presente "
-        f"simulazione considera un incremento futuro dei prezzi dell\u2019energia pari a "
-        f"{incremento*100:.1f}%.",
-        "Qualora tali dinamiche dovessero ripetersi nelle stesse proporzioni, il beneficio "
-        "economico cumulato risulterebbe ulteriormente maggiore.",
-        "In altre parole, ogni anno che passa senza realizzare l\u2019intervento equivale a:",
-        "\u2022 perdere una opportunit\u00e0 di ridurre la spesa energetica;",
-        "\u2022 rinunciare a una rendita energetica positiva;",
-        "\u2022 esporsi ulteriormente all\u2019aumento dei costi dell\u2019energia.",
-        "",
-        "Questa dinamica si traduce in un costo opportunit\u00e0 concreto, che cresce con "
-        "l\u2019aumento dei prezzi e con l\u2019allungamento dell\u2019orizzonte temporale. "
-        "In pi\u00f9, \u00e8 possibile strutturare l\u2019investimento con soluzioni di "
-        "finanziamento dedicate, che consentono di distribuire la spesa nel tempo, spesso in "
-        "modo sostenibile rispetto al flusso economico annuo generato dalla Rendita Energetica "
-        "Attiva.",
-        "",
-        "Scegliere di attivare il Sistema di Rendita Energetica Attiva Next significa "
-        "trasformare una spesa energetica futura incerta in un flusso di valore definito "
-        "e progressivamente crescente nel tempo.",
-        "",
-        "NEXT SRL \u2014 Report simulazione",
-        "Valori indicativi",
-        f"Data {oggi}",
-    ]
-    for p in testo_chiusura:
-        st_p = SBU if p.startswith("\u2022") else SB
-        story.append(Paragraph(p, st_p))
-        story.append(Spacer(1,2*mm))
+    story += _pagine_sezione("chiusura", _sezione_chiusura,
+                             _campi_chiusura(van10, costo_impianto, differenza_netto, incremento, oggi),
+                             pagine_modello)
 
     # ââ BUILD ââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââââ
-    frame=Frame(ML,MB+FTR_H,BW,
-                PH-HDR_H-HDR_LINE-MT-MB-FTR_H,
-                leftPadding=0,rightPadding=0,topPadding=0,bottomPadding=0)
+    frame=_frame()
 
     def on_page(c,doc):
         if doc.page==1:
@@ -1521,15 +1577,10 @@ def build_pdf(
             page_deco(c,doc,num_off,oggi,cliente,doc.page,tot_pag)
 
     pt=PageTemplate(id="nxt",frames=[frame],onPage=on_page)
-    doc=BaseDocTemplate(filename,pagesize=A4,
-        leftMargin=ML,rightMargin=MR,
-        topMargin=HDR_H+HDR_LINE+MT,bottomMargin=MB+FTR_H)
+    uscita = io.BytesIO() if destinazione is None else destinazione
+    doc=_documento(uscita)
     doc.addPageTemplates([pt])
     story.insert(0,PageBreak())
     doc.build(story)
 
-    for tmp in [g_f1,g_f2,g_irr,g_bvoci,g_pay,g_cmp]:
-        try: os.remove(tmp)
-        except: pass
-
-    return filename
+    return uscita.getvalue() if destinazione is None else destinazione
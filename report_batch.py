@@ -0,0 +1,346 @@
+# report_batch.py
+
+"""
+Report PDF in serie da un file di clienti (CSV o JSON Lines).
+
+Ogni riga ha il nome del cliente (`cliente`), un identificativo
+facoltativo (`id`, default il numero di riga) e gli argomenti di
+compute_benefits con gli stessi nomi (calculator.COLONNE_INPUT;
+autoc_bonus_perc e incremento_prezzo_annuo sono facoltativi).
+
+I calcoli girano tutti insieme con compute_benefits_batch; i PDF su un
+pool di processi che vengono sostituiti ogni --ricicla-dopo report, cosi'
+la memoria che matplotlib e reportlab accumulano nei processi lunghi
+torna al sistema.
+
+Ogni PDF completato viene annotato nel file di checkpoint della cartella
+di lavoro: rilanciando lo stesso comando dopo un'interruzione si riparte
+dai report mancanti. Con uscita .zip i PDF si accumulano in
+<uscita>.parti/ e l'archivio viene scritto alla fine.
+
+Uso:
+    python report_batch.py clienti.csv cartella/ [--processi N] [--ricicla-dopo N]
+    python report_batch.py clienti.jsonl report.zip
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from calculator import (
+    COLONNE_INPUT, _DEFAULT_BATCH, compute_benefits_batch, quota_copertura_batch,
+    risultati_scenario,
+)
+
+
+CHECKPOINT = ".checkpoint.jsonl"
+
+# Clienti calcolati insieme da compute_benefits_batch
+BLOCCO_CALCOLO = 2048
+
+
+# ---------------------------------------------------------
+# INGRESSO
+# ---------------------------------------------------------
+
+def leggi_clienti(percorso):
+    """
+    Righe del file clienti come dict {id, cliente, <COLONNE_INPUT>}.
+    CSV o JSON Lines secondo l'estensione; i valori vuoti delle colonne
+    facoltative diventano NaN (calcolo automatico).
+    """
+    with open(percorso, encoding="utf-8", newline="") as f:
+        if percorso.lower().endswith((".jsonl", ".json")):
+            grezze = [json.loads(r) for r in f if r.strip()]
+        else:
+            grezze = list(csv.DictReader(f))
+
+    return clienti_da_righe(grezze, percorso)
+
+
+def clienti_da_righe(righe, origine="ingresso"):
+    """
+    Converte e controlla righe gia' lette (dict con i nomi delle colonne):
+    ValueError con origine e numero di riga se manca una colonna, un valore
+    non e' numerico o un id si ripete.
+    """
+    clienti, visti = [], set()
+    for n, riga in enumerate(righe, start=1):
+        try:
+            cliente = _riga_cliente(n, riga)
+        except KeyError as e:
+            raise ValueError(f"{origine}, riga {n}: manca la colonna {e.args[0]}") from None
+        except (AttributeError, TypeError, ValueError) as e:
+            raise ValueError(f"{origine}, riga {n}: {e}") from None
+        if cliente["id"] in visti:
+            raise ValueError(f"{origine}, riga {n}: id duplicato {cliente['id']!r}")
+        visti.add(cliente["id"])
+        clienti.append(cliente)
+
+    return clienti
+
+
+def _riga_cliente(n, riga):
+    id_cliente = riga.get("id")
+    # da JSON: numeri interi o stringhe, non liste, oggetti o booleani
+    if id_cliente is not None and (
+        isinstance(id_cliente, bool) or not isinstance(id_cliente, (str, int))
+    ):
+        raise TypeError(f"id deve essere una stringa o un intero, non {json.dumps(id_cliente)}")
+    cliente = {
+        "id": str(n if id_cliente is None or id_cliente == "" else id_cliente),
+        "cliente": str(riga["cliente"]).strip(),
+    }
+    for k in COLONNE_INPUT:
+        v = riga.get(k)
+        if v is None or v == "":
+            if k not in _DEFAULT_BATCH:
+                raise KeyError(k)
+            v = _DEFAULT_BATCH[k]
+        cliente[k] = float(v)
+
+    return cliente
+
+
+def calcola(clienti):
+    """Risultati di compute_benefits per cliente, calcolati a blocchi."""
+    risultati = []
+    for inizio in range(0, len(clienti), BLOCCO_CALCOLO):
+        blocco = clienti[inizio:inizio + BLOCCO_CALCOLO]
+        colonne = {k: np.array([c[k] for c in blocco]) for k in COLONNE_INPUT}
+
+        # la copertura automatica serve anche al report
+        colonne["autoc_bonus_perc"] = np.where(
+            np.isnan(colonne["autoc_bonus_perc"]),
+            quota_copertura_batch(colonne["bonus_kwp"]),
+            colonne["autoc_bonus_perc"],
+        )
+        for c, copertura in zip(blocco, colonne["autoc_bonus_perc"]):
+            c["autoc_bonus_perc"] = float(copertura)
+
+        batch = compute_benefits_batch(**colonne)
+        risultati.extend(risultati_scenario(batch, i) for i in range(len(blocco)))
+
+    return risultati
+
+
+# ---------------------------------------------------------
+# REPORT
+# ---------------------------------------------------------
+
+_RE_NON_FILE = re.compile(r"[^\w-]+")
+
+
+def nome_file(cliente):
+    """Nome del PDF: id e nome del cliente ripuliti per il filesystem."""
+    nome = _RE_NON_FILE.sub("_", cliente["cliente"]).strip("_")[:60] or "cliente"
+    return f"{_RE_NON_FILE.sub('_', cliente['id'])}_{nome}.pdf"
+
+
+def genera_report(cliente, res):
+    """PDF in byte per un cliente (gira nei worker)."""
+    from pdf_report import build_pdf
+
+    c = cliente
+    return build_pdf(
+        c["cliente"], res, c["costo_impianto"], c["consumo_kwh"], c["base_kwp"], c["bonus_kwp"],
+        c["resa_kwh_kwp"], c["prezzo_energia"], c["rid_eur_kwh"], c["cer_eur_kwh"],
+        c["quota_condivisa"], c["autoc_base_perc"], c["autoc_bonus_perc"],
+        c["incremento_prezzo_annuo"],
+        # un pool per volta: i grafici si disegnano nel worker
+        processi_grafici=0,
+    )
+
+
+def _permessi_utente(percorso):
+    """
+    mkstemp crea i file con 0600: prima di os.replace si danno i permessi
+    di un file nuovo qualsiasi (0666 meno la umask dell'utente).
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(percorso, 0o666 & ~umask)
+
+
+def _scrivi(cartella, nome, dati):
+    fd, tmp = tempfile.mkstemp(dir=cartella, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(dati)
+    _permessi_utente(tmp)
+    os.replace(tmp, os.path.join(cartella, nome))
+
+
+class Checkpoint:
+    """
+    Registro dei report completati (una riga JSON per PDF), scritto dopo
+    che il file e' al suo posto: una riga presente vale un PDF completo.
+    """
+
+    def __init__(self, cartella):
+        self.percorso = os.path.join(cartella, CHECKPOINT)
+        self.completati = {}
+        try:
+            with open(self.percorso, encoding="utf-8") as f:
+                for riga in f:
+                    try:
+                        voce = json.loads(riga)
+                    except ValueError:
+                        continue   # ultima riga troncata da un'interruzione
+                    if os.path.exists(os.path.join(cartella, voce["file"])):
+                        self.completati[voce["id"]] = voce["file"]
+        except OSError:
+            pass
+        self._file = open(self.percorso, "a", encoding="utf-8")
+
+    def registra(self, id_cliente, file):
+        self._file.write(json.dumps({"id": id_cliente, "file": file}) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.completati[id_cliente] = file
+
+    def chiudi(self):
+        self._file.close()
+
+
+def _esegui_lavori(lavori, processi, ricicla_dopo):
+    """
+    Genera (cliente, pdf o eccezione) per ogni lavoro (cliente, res), non in
+    ordine. In volo al massimo due lavori per worker; se un worker muore
+    (per esempio per memoria) il pool viene ricreato e i lavori rimessi in coda.
+    """
+    if processi == 0:
+        for cliente, res in lavori:
+            try:
+                yield cliente, genera_report(cliente, res)
+            except Exception as e:
+                yield cliente, e
+        return
+
+    coda = list(lavori)
+    coda.reverse()
+    tentativi = 3
+
+    while coda:
+        in_corso = {}
+        try:
+            with ProcessPoolExecutor(max_workers=processi, max_tasks_per_child=ricicla_dopo) as pool:
+                while coda or in_corso:
+                    while coda and len(in_corso) < 2 * processi:
+                        cliente, res = coda.pop()
+                        in_corso[pool.submit(genera_report, cliente, res)] = (cliente, res)
+
+                    pronti, _ = wait(in_corso, return_when=FIRST_COMPLETED)
+                    for futuro in pronti:
+                        cliente, res = in_corso.pop(futuro)
+                        try:
+                            yield cliente, futuro.result()
+                        except BrokenProcessPool:
+                            in_corso[futuro] = (cliente, res)
+                            raise
+                        except Exception as e:
+                            yield cliente, e
+        except BrokenProcessPool:
+            tentativi -= 1
+            if not tentativi:
+                raise
+            coda.extend(in_corso.values())
+            print("worker terminato in modo anomalo: riavvio del pool", file=sys.stderr)
+
+
+def esegui(ingresso, uscita, processi=None, ricicla_dopo=50, avanzamento=100):
+    """
+    Report di tutti i clienti di `ingresso` in `uscita` (cartella o .zip).
+    Ritorna (generati, gia' presenti, errori).
+    """
+    clienti = leggi_clienti(ingresso)
+
+    archivio = uscita.lower().endswith(".zip")
+    cartella = uscita + ".parti" if archivio else uscita
+    os.makedirs(cartella, exist_ok=True)
+
+    checkpoint = Checkpoint(cartella)
+    da_fare = [c for c in clienti if c["id"] not in checkpoint.completati]
+    gia_fatti = len(clienti) - len(da_fare)
+    if gia_fatti:
+        print(f"ripresa: {gia_fatti} report gia' presenti, {len(da_fare)} da generare")
+
+    if processi is None:
+        processi = os.cpu_count() or 1
+    generati, errori = 0, []
+    t0 = time.perf_counter()
+
+    try:
+        lavori = zip(da_fare, calcola(da_fare))
+        for cliente, esito in _esegui_lavori(lavori, processi, ricicla_dopo):
+            if isinstance(esito, Exception):
+                errori.append((cliente["id"], esito))
+                print(f"ERRORE {cliente['id']} ({cliente['cliente']}): {esito!r}", file=sys.stderr)
+                continue
+
+            nome = nome_file(cliente)
+            _scrivi(cartella, nome, esito)
+            checkpoint.registra(cliente["id"], nome)
+            generati += 1
+
+            if avanzamento and generati % avanzamento == 0:
+                al_secondo = generati / (time.perf_counter() - t0)
+                print(f"{gia_fatti + generati}/{len(clienti)} report ({al_secondo:.1f}/s)")
+    finally:
+        checkpoint.chiudi()
+
+    if archivio and not errori:
+        _scrivi_zip(uscita, cartella, [checkpoint.completati[c["id"]] for c in clienti])
+        shutil.rmtree(cartella)
+
+    return generati, gia_fatti, errori
+
+
+def _scrivi_zip(uscita, cartella, nomi):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(uscita)), suffix=".tmp")
+    os.close(fd)
+    # i PDF sono gia' compressi: ZIP_STORED evita di ricomprimerli
+    with zipfile.ZipFile(tmp, "w", zipfile.ZIP_STORED) as z:
+        for nome in nomi:
+            z.write(os.path.join(cartella, nome), nome)
+    _permessi_utente(tmp)
+    os.replace(tmp, uscita)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("ingresso", help="file clienti .csv o .jsonl")
+    parser.add_argument("uscita", help="cartella dei PDF o archivio .zip")
+    parser.add_argument("--processi", type=int, default=None,
+                        help="worker (default: tutti i core, 0 = nel processo corrente)")
+    parser.add_argument("--ricicla-dopo", type=int, default=50,
+                        help="report per worker prima di sostituirlo")
+    opzioni = parser.parse_args()
+
+    try:
+        generati, gia_fatti, errori = esegui(
+            opzioni.ingresso, opzioni.uscita, opzioni.processi, opzioni.ricicla_dopo
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(f"{generati} report generati, {gia_fatti} gia' presenti, {len(errori)} errori")
+    if errori and opzioni.uscita.lower().endswith(".zip"):
+        print(f"archivio non scritto: rilanciare per riprovare i report mancanti "
+              f"(i completati restano in {opzioni.uscita}.parti)")
+
+    sys.exit(1 if errori else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,400 @@
+# servizio_api.py
+
+"""
+Servizio HTTP/JSON locale per calcoli e report, per il CRM.
+
+    POST /simulate         un cliente (oggetto JSON)  -> risultati JSON
+    POST /simulate/batch   array di clienti           -> array di risultati
+    POST /report           un cliente                 -> PDF
+    POST /report/batch     array di clienti           -> zip dei PDF
+    GET  /salute           stato del servizio
+
+I clienti hanno gli stessi campi del file di report_batch: gli argomenti
+di compute_benefits per nome (calculator.COLONNE_INPUT), `cliente` per il
+nome (obbligatorio per i report) e un `id` facoltativo.
+
+Front end asyncio (HTTP/1.1 della libreria standard, keep-alive, limiti
+su intestazioni, corpo e dimensione dei batch); calcoli e PDF girano su
+un pool di processi, riciclati come in report_batch. Oltre `--max-lavori`
+lavori in attesa il servizio risponde 503 invece di accodare all'infinito.
+Non importa streamlit, quindi parte in fretta.
+
+Uso:
+    python servizio_api.py [--host 127.0.0.1] [--porta 8765] [--processi N]
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import io
+import json
+import math
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from calculator import COLONNE_INPUT, compute_benefits
+from report_batch import calcola, clienti_da_righe, genera_report, nome_file
+
+
+# Limiti delle richieste
+MAX_INTESTAZIONI = 16 << 10     # byte, riga di richiesta compresa
+MAX_CORPO = 4 << 20             # byte
+MAX_BATCH_SIMULAZIONI = 10000
+MAX_BATCH_REPORT = 50
+
+# Secondi di attesa: connessione inattiva tra due richieste, lettura di una richiesta
+TIMEOUT_INATTIVO = 15
+TIMEOUT_LETTURA = 30
+
+# Report per worker prima di sostituirlo (vedi report_batch)
+RICICLA_DOPO = 200
+
+MOTIVI = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    408: "Request Timeout", 411: "Length Required", 413: "Payload Too Large",
+    431: "Request Header Fields Too Large", 500: "Internal Server Error",
+    501: "Not Implemented", 503: "Service Unavailable",
+}
+
+
+class _ErroreHTTP(Exception):
+    def __init__(self, stato, messaggio, chiudi=False):
+        super().__init__(messaggio)
+        self.stato = stato
+        self.chiudi = chiudi
+
+
+# ---------------------------------------------------------
+# LAVORI (nei processi del pool)
+# ---------------------------------------------------------
+
+def _in_json(valore):
+    """Risultati del calcolatore in tipi JSON; NaN e infiniti diventano null."""
+    if isinstance(valore, dict):
+        return {k: _in_json(v) for k, v in valore.items()}
+    if dataclasses.is_dataclass(valore):
+        return {c.name: _in_json(getattr(valore, c.name)) for c in dataclasses.fields(valore)}
+    if isinstance(valore, np.ndarray):
+        return [_in_json(v) for v in valore.tolist()]
+    if isinstance(valore, (list, tuple)):
+        return [_in_json(v) for v in valore]
+    if isinstance(valore, np.generic):
+        valore = valore.item()
+    if isinstance(valore, float) and not math.isfinite(valore):
+        return None
+    return valore
+
+
+def _json(dati):
+    return json.dumps(dati, ensure_ascii=False, allow_nan=False).encode()
+
+
+def _simula(cliente):
+    argomenti = {k: cliente[k] for k in COLONNE_INPUT}
+    if math.isnan(argomenti["autoc_bonus_perc"]):
+        argomenti["autoc_bonus_perc"] = None
+    res = compute_benefits(**argomenti)
+
+    return _json({"id": cliente["id"], **_in_json(res)})
+
+
+def _simula_batch(clienti):
+    risultati = calcola(clienti)
+    return _json([
+        {"id": c["id"], **_in_json(res)} for c, res in zip(clienti, risultati)
+    ])
+
+
+def _report(cliente):
+    return genera_report(cliente, calcola([cliente])[0])
+
+
+# ---------------------------------------------------------
+# SERVIZIO
+# ---------------------------------------------------------
+
+class ServizioAPI:
+    """
+    Server HTTP/1.1 asyncio; un'istanza possiede il pool di processi.
+    """
+
+    def __init__(self, processi=None, max_lavori=None, max_corpo=MAX_CORPO):
+        self.processi = processi or os.cpu_count() or 1
+        self.max_lavori = max_lavori or 4 * self.processi
+        self.max_corpo = max_corpo
+        self.in_corso = 0
+        self._pool = None
+        self._rotte = {
+            "/simulate": self._simulate,
+            "/simulate/batch": self._simulate_batch,
+            "/report": self._report,
+            "/report/batch": self._report_batch,
+        }
+
+    # -- pool
+
+    def _nuovo_pool(self):
+        return ProcessPoolExecutor(max_workers=self.processi, max_tasks_per_child=RICICLA_DOPO)
+
+    async def _esegui(self, funzione, *args):
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._pool, funzione, *args)
+        except BrokenProcessPool:
+            # un worker e' morto (per esempio per memoria): pool nuovo per le prossime richieste
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = self._nuovo_pool()
+            raise _ErroreHTTP(503, "worker terminato in modo anomalo, riprovare")
+
+    def _ammetti(self, lavori):
+        if self.in_corso + lavori > self.max_lavori:
+            raise _ErroreHTTP(503, "servizio occupato, riprovare tra poco")
+        self.in_corso += lavori
+
+    # -- endpoint: (tipo del contenuto, corpo)
+
+    def _clienti(self, dati, batch, massimo, con_nome):
+        if batch:
+            if not isinstance(dati, list):
+                raise _ErroreHTTP(400, "atteso un array JSON di clienti")
+            if len(dati) > massimo:
+                raise _ErroreHTTP(413, f"al massimo {massimo} clienti per richiesta")
+            righe = dati
+        else:
+            if not isinstance(dati, dict):
+                raise _ErroreHTTP(400, "atteso un oggetto JSON")
+            righe = [dati]
+
+        if not con_nome:
+            righe = [
+                {"cliente": "", **r} if isinstance(r, dict) else r for r in righe
+            ]
+        try:
+            return clienti_da_righe(righe, "richiesta")
+        except ValueError as e:
+            raise _ErroreHTTP(400, str(e))
+
+    async def _simulate(self, dati):
+        (cliente,) = self._clienti(dati, False, 1, con_nome=False)
+        self._ammetti(1)
+        try:
+            return "application/json", await self._esegui(_simula, cliente)
+        finally:
+            self.in_corso -= 1
+
+    async def _simulate_batch(self, dati):
+        clienti = self._clienti(dati, True, MAX_BATCH_SIMULAZIONI, con_nome=False)
+        self._ammetti(1)
+        try:
+            return "application/json", await self._esegui(_simula_batch, clienti)
+        finally:
+            self.in_corso -= 1
+
+    async def _report(self, dati):
+        (cliente,) = self._clienti(dati, False, 1, con_nome=True)
+        self._ammetti(1)
+        try:
+            return "application/pdf", await self._esegui(_report, cliente)
+        finally:
+            self.in_corso -= 1
+
+    async def _report_batch(self, dati):
+        # un report per lavoro: oltre max_lavori il batch non verrebbe mai ammesso
+        massimo = min(MAX_BATCH_REPORT, self.max_lavori)
+        clienti = self._clienti(dati, True, massimo, con_nome=True)
+        self._ammetti(len(clienti))
+        try:
+            pdf = await asyncio.gather(*(self._esegui(_report, c) for c in clienti))
+        finally:
+            self.in_corso -= len(clienti)
+
+        buf = io.BytesIO()
+        # i PDF sono gia' compressi: ZIP_STORED evita di ricomprimerli
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as z:
+            for c, dati_pdf in zip(clienti, pdf):
+                z.writestr(nome_file(c), dati_pdf)
+        return "application/zip", buf.getvalue()
+
+    def _salute(self):
+        return "application/json", _json({
+            "stato": "ok", "processi": self.processi,
+            "in_corso": self.in_corso, "max_lavori": self.max_lavori,
+            "max_batch_report": min(MAX_BATCH_REPORT, self.max_lavori),
+        })
+
+    # -- HTTP
+
+    async def _leggi_richiesta(self, reader, writer):
+        """
+        (metodo, percorso, versione, intestazioni, corpo) della prossima
+        richiesta; None se il client ha chiuso la connessione.
+        """
+        try:
+            riga = await asyncio.wait_for(reader.readline(), TIMEOUT_INATTIVO)
+        except (asyncio.TimeoutError, ConnectionError):
+            return None
+        except (asyncio.LimitOverrunError, ValueError):
+            raise _ErroreHTTP(431, "riga di richiesta troppo lunga", chiudi=True)
+        if not riga.strip():
+            return None
+
+        try:
+            metodo, percorso, versione = riga.decode("latin-1").split()
+        except ValueError:
+            raise _ErroreHTTP(400, "riga di richiesta non valida", chiudi=True)
+
+        intestazioni = {}
+        letti = len(riga)
+        while True:
+            try:
+                riga = await asyncio.wait_for(reader.readline(), TIMEOUT_LETTURA)
+            except asyncio.TimeoutError:
+                raise _ErroreHTTP(408, "intestazioni incomplete", chiudi=True)
+            except (asyncio.LimitOverrunError, ValueError):
+                raise _ErroreHTTP(431, "intestazione troppo lunga", chiudi=True)
+            letti += len(riga)
+            if letti > MAX_INTESTAZIONI:
+                raise _ErroreHTTP(431, "intestazioni troppo lunghe", chiudi=True)
+            if riga in (b"\r\n", b"\n", b""):
+                break
+            nome, _, valore = riga.decode("latin-1").partition(":")
+            intestazioni[nome.strip().lower()] = valore.strip()
+
+        if "transfer-encoding" in intestazioni:
+            raise _ErroreHTTP(501, "transfer-encoding non supportato: usare Content-Length", chiudi=True)
+
+        # anche il corpo di un GET va consumato, o sul keep-alive diventerebbe
+        # l'inizio della richiesta successiva
+        corpo = b""
+        if metodo == "POST" or "content-length" in intestazioni:
+            try:
+                lunghezza = int(intestazioni["content-length"])
+            except (KeyError, ValueError):
+                raise _ErroreHTTP(411, "Content-Length mancante o non valido", chiudi=True)
+            if lunghezza < 0:
+                raise _ErroreHTTP(400, "Content-Length non valido", chiudi=True)
+            if lunghezza > self.max_corpo:
+                raise _ErroreHTTP(413, f"corpo oltre {self.max_corpo} byte", chiudi=True)
+            if intestazioni.get("expect", "").lower() == "100-continue":
+                writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+            try:
+                corpo = await asyncio.wait_for(reader.readexactly(lunghezza), TIMEOUT_LETTURA)
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+                raise _ErroreHTTP(408, "corpo incompleto", chiudi=True)
+
+        return metodo, percorso.split("?", 1)[0], versione, intestazioni, corpo
+
+    async def _rispondi(self, metodo, percorso, corpo):
+        if percorso == "/salute":
+            if metodo != "GET":
+                raise _ErroreHTTP(405, "usare GET")
+            return self._salute()
+
+        gestore = self._rotte.get(percorso)
+        if gestore is None:
+            raise _ErroreHTTP(404, f"percorso sconosciuto: {percorso}")
+        if metodo != "POST":
+            raise _ErroreHTTP(405, "usare POST")
+        try:
+            dati = json.loads(corpo)
+        except ValueError as e:
+            raise _ErroreHTTP(400, f"JSON non valido: {e}")
+
+        return await gestore(dati)
+
+    async def connessione(self, reader, writer):
+        """Una connessione: richieste in sequenza finche' resta aperta."""
+        try:
+            while True:
+                chiudi = False
+                try:
+                    richiesta = await self._leggi_richiesta(reader, writer)
+                    if richiesta is None:
+                        break
+                    metodo, percorso, versione, intestazioni, corpo = richiesta
+                    connessione = intestazioni.get("connection", "").lower()
+                    chiudi = connessione == "close" or (
+                        versione == "HTTP/1.0" and connessione != "keep-alive"
+                    )
+                    stato = 200
+                    tipo, risposta = await self._rispondi(metodo, percorso, corpo)
+                except _ErroreHTTP as e:
+                    stato, tipo, risposta = e.stato, "application/json", _json({"errore": str(e)})
+                    chiudi = chiudi or e.chiudi
+                except Exception as e:
+                    stato, tipo = 500, "application/json"
+                    risposta = _json({"errore": f"{type(e).__name__}: {e}"})
+
+                intestazioni_risposta = [
+                    f"HTTP/1.1 {stato} {MOTIVI[stato]}",
+                    f"Content-Type: {tipo}",
+                    f"Content-Length: {len(risposta)}",
+                ]
+                if chiudi:
+                    intestazioni_risposta.append("Connection: close")
+                else:
+                    intestazioni_risposta += ["Connection: keep-alive", f"Keep-Alive: timeout={TIMEOUT_INATTIVO}"]
+                if stato == 405:
+                    intestazioni_risposta.append("Allow: GET" if percorso == "/salute" else "Allow: POST")
+                if stato == 503:
+                    intestazioni_risposta.append("Retry-After: 1")
+                writer.write(("\r\n".join(intestazioni_risposta) + "\r\n\r\n").encode("latin-1"))
+                writer.write(risposta)
+                await writer.drain()
+
+                if chiudi:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def servi(self, host="127.0.0.1", porta=8765, pronto=None):
+        """Avvia il server e serve fino alla cancellazione del task."""
+        self._pool = self._nuovo_pool()
+        server = await asyncio.start_server(
+            self.connessione, host, porta, limit=MAX_INTESTAZIONI
+        )
+        if pronto is not None:
+            pronto(server)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--processi", type=int, default=None,
+                        help="worker per calcoli e PDF (default: tutti i core)")
+    parser.add_argument("--max-lavori", type=int, default=None,
+                        help="lavori in attesa oltre i quali si risponde 503 (default: 4 per worker)")
+    parser.add_argument("--max-corpo", type=int, default=MAX_CORPO,
+                        help="byte massimi del corpo di una richiesta")
+    opzioni = parser.parse_args()
+
+    servizio = ServizioAPI(opzioni.processi, opzioni.max_lavori, opzioni.max_corpo)
+
+    def pronto(server):
+        indirizzi = ", ".join(f"{s.getsockname()[0]}:{s.getsockname()[1]}" for s in server.sockets)
+        print(f"in ascolto su {indirizzi} ({servizio.processi} processi)")
+
+    try:
+        asyncio.run(servizio.servi(opzioni.host, opzioni.porta, pronto))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
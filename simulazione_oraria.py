@@ -0,0 +1,305 @@
+# simulazione_oraria.py
+
+"""
+Simulazione oraria (8760 ore) di fotovoltaico, accumulo e inverter ibrido.
+
+Per ogni ora e ogni cliente:
+  1. il FV copre il carico attraverso l'inverter (limite potenza_inverter_kw);
+  2. il surplus DC carica la batteria (limite potenza_batteria_kw);
+  3. il carico residuo viene coperto dalla batteria, nei limiti
+     dell'inverter ancora libero;
+  4. il resto del surplus va in rete fin dove l'inverter lo consente,
+     quello che avanza e' clipping.
+
+Tutti i passi tranne lo stato di carica sono calcolati su matrici
+clienti x ore; lo stato di carica e' una somma cumulata limitata a
+[0, capacita] e richiede un passo per ora, fatto in NumPy su blocchi
+di clienti (o con itertools.accumulate quando i clienti sono pochi).
+"""
+
+from functools import lru_cache
+from itertools import accumulate
+
+import numpy as np
+
+from config import CFG
+
+
+ORE_ANNO = 8760
+
+# Zona -> (latitudine, resa tipica kWh/kWp)
+ZONE = {
+    "nord": (45.5, 1200),
+    "centro": (42.0, 1325),
+    "sud": (38.5, 1450),
+}
+
+# Forma giornaliera del carico domestico (ore 0..23), normalizzata dopo
+_CARICO_ORARIO = np.array([
+    0.45, 0.40, 0.38, 0.37, 0.38, 0.45, 0.70, 1.00,
+    1.05, 0.85, 0.75, 0.75, 0.85, 0.90, 0.75, 0.70,
+    0.75, 0.95, 1.30, 1.55, 1.50, 1.30, 0.95, 0.65,
+])
+
+# Sotto questo numero di clienti il passo orario in puro Python e' piu' veloce
+_SOGLIA_SCALARE = 8
+
+CHIAVI = (
+    "produzione",
+    "autoconsumo",
+    "immessa",
+    "clipping",
+    "prelievo",
+    "carica_batteria",
+    "scarica_batteria",
+    "perdite_batteria",
+    "quota_autoconsumo",
+    "quota_copertura",
+)
+
+
+# ---------------------------------------------------------
+# PROFILI
+# ---------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def profilo_fv(zona="nord"):
+    """
+    Produzione oraria di 1 kWp (kWh) nella zona, normalizzata alla resa
+    tipica della zona: altezza solare da declinazione e angolo orario,
+    attenuata da una nuvolosita' media stagionale.
+    """
+    latitudine, resa = ZONE[zona]
+
+    ore = np.arange(ORE_ANNO)
+    giorno = ore // 24
+    ora = ore % 24 + 0.5
+
+    declinazione = np.radians(23.45) * np.sin(2 * np.pi * (284 + giorno + 1) / 365)
+    lat = np.radians(latitudine)
+    angolo_orario = np.radians(15 * (ora - 12))
+
+    seno_altezza = (
+        np.sin(lat) * np.sin(declinazione)
+        + np.cos(lat) * np.cos(declinazione) * np.cos(angolo_orario)
+    )
+    sereno = np.clip(seno_altezza, 0, None) ** 1.2
+
+    # piu' nuvole d'inverno, meno al sud
+    nuvolosita = 0.55 + 0.25 * np.cos(2 * np.pi * (giorno - 172) / 365) + (45.5 - latitudine) * 0.02
+    profilo = sereno * np.clip(nuvolosita, 0.3, 1.0)
+
+    profilo *= resa / profilo.sum()
+    profilo.flags.writeable = False
+
+    return profilo
+
+
+@lru_cache(maxsize=None)
+def profilo_carico():
+    """
+    Quota oraria del consumo annuo (somma 1): forma giornaliera domestica,
+    consumi piu' alti d'inverno e nel fine settimana.
+    """
+    ore = np.arange(ORE_ANNO)
+    giorno = ore // 24
+
+    stagione = 1 + 0.20 * np.cos(2 * np.pi * (giorno - 15) / 365)
+    weekend = np.where(giorno % 7 >= 5, 1.10, 1.0)
+
+    profilo = _CARICO_ORARIO[ore % 24] * stagione * weekend
+
+    profilo = profilo / profilo.sum()
+    profilo.flags.writeable = False
+
+    return profilo
+
+
+# ---------------------------------------------------------
+# STATO DI CARICA
+# ---------------------------------------------------------
+
+def _stato_carica(flusso, capacita, soc_iniziale):
+    """
+    Stato di carica a fine ora: soc[t] = clip(soc[t-1] + flusso[t], 0, capacita).
+    flusso: (clienti, ore); capacita e soc_iniziale: (clienti,).
+    """
+    n, ore = flusso.shape
+    soc = np.empty_like(flusso)
+
+    if n < _SOGLIA_SCALARE:
+        for i in range(n):
+            c = float(capacita[i])
+            soc[i] = list(accumulate(
+                flusso[i].tolist(),
+                lambda s, f: min(max(s + f, 0.0), c),
+                initial=float(soc_iniziale[i]),
+            ))[1:]
+        return soc
+
+    # ore sulle righe: ogni passo legge e scrive memoria contigua
+    flusso_t = np.ascontiguousarray(flusso.T)
+    soc_t = np.empty_like(flusso_t)
+    stato = np.array(soc_iniziale, dtype=float)
+
+    for t in range(ore):
+        stato += flusso_t[t]
+        np.clip(stato, 0.0, capacita, out=stato)
+        soc_t[t] = stato
+
+    soc[:] = soc_t.T
+
+    return soc
+
+
+# ---------------------------------------------------------
+# SIMULAZIONE
+# ---------------------------------------------------------
+
+def _simula_blocco(fv, carico, capacita, p_batt, p_inv, rendimento, soc_iniziale):
+    # 1. FV -> carico attraverso l'inverter
+    diretto = np.minimum(np.minimum(fv, carico), p_inv)
+    surplus = fv - diretto
+    residuo = carico - diretto
+    inverter_libero = p_inv - diretto
+
+    # 2-3. richiesta di carica (DC) e di scarica (AC) della batteria
+    carica_max = np.minimum(surplus, p_batt) * rendimento
+    scarica_max = np.minimum(np.minimum(residuo, inverter_libero), p_batt) / rendimento
+
+    soc = _stato_carica(carica_max - scarica_max, capacita, soc_iniziale)
+    delta = np.diff(soc, axis=1, prepend=soc_iniziale[:, None])
+
+    carica = np.maximum(delta, 0) / rendimento
+    scarica = np.maximum(-delta, 0) * rendimento
+
+    # 4. surplus non accumulato: rete fin dove c'e' inverter, poi clipping
+    avanzo = surplus - carica
+    immessa = np.minimum(avanzo, inverter_libero)
+
+    autoconsumo = diretto + scarica
+
+    return {
+        "produzione": fv.sum(axis=1),
+        "autoconsumo": autoconsumo.sum(axis=1),
+        "immessa": immessa.sum(axis=1),
+        "clipping": (avanzo - immessa).sum(axis=1),
+        "prelievo": (carico - autoconsumo).sum(axis=1),
+        "carica_batteria": carica.sum(axis=1),
+        "scarica_batteria": scarica.sum(axis=1),
+        # energia caricata meno quella restituita e rimasta in batteria
+        "perdite_batteria": carica.sum(axis=1) - scarica.sum(axis=1) - (soc[:, -1] - soc_iniziale),
+    }
+
+
+def simula_anno(
+    kwp,
+    consumo_kwh,
+    zona="nord",
+    resa_kwh_kwp=None,
+    fv=None,
+    carico=None,
+    capacita_kwh=CFG.BATTERIA_KWH,
+    potenza_batteria_kw=CFG.BATTERIA_KW,
+    potenza_inverter_kw=CFG.INVERTER_KW,
+    rendimento=CFG.RENDIMENTO_BATTERIA,
+    soc_iniziale=0.0,
+    blocco=512,
+):
+    """
+    Un anno ora per ora per uno o piu' clienti.
+
+    kwp, consumo_kwh, resa_kwh_kwp, capacita_kwh, ...: scalari o array
+    (un valore per cliente, broadcast tra loro).
+    fv:     profilo orario di 1 kWp (8760,) o (clienti, 8760); default
+            profilo_fv(zona) riscalato a resa_kwh_kwp se indicata.
+    carico: quota oraria del consumo annuo (8760,) o (clienti, 8760);
+            default profilo_carico().
+    blocco: clienti simulati insieme (limita la memoria: ~70 kB per
+            cliente e per matrice oraria).
+
+    Ritorna un dict di energie annue in kWh (vedi CHIAVI) piu'
+    quota_autoconsumo (autoconsumo / produzione) e quota_copertura
+    (autoconsumo / consumo). Scalari se tutti gli input sono scalari.
+    """
+    if fv is None:
+        fv = profilo_fv(zona)
+        if resa_kwh_kwp is not None:
+            fv = fv / fv.sum() * np.asarray(resa_kwh_kwp, dtype=float)[..., None]
+    if carico is None:
+        carico = profilo_carico()
+
+    fv = np.asarray(fv, dtype=float)
+    carico = np.asarray(carico, dtype=float)
+    if fv.shape[-1] != ORE_ANNO or carico.shape[-1] != ORE_ANNO:
+        raise ValueError(f"i profili devono avere {ORE_ANNO} ore")
+
+    parametri = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in
+          (kwp, consumo_kwh, capacita_kwh, potenza_batteria_kw,
+           potenza_inverter_kw, rendimento, soc_iniziale)),
+        fv[..., 0], carico[..., 0],
+    )
+    scalare = parametri[0].ndim == 0
+    n = parametri[0].size
+    kwp, consumo_kwh, capacita, p_batt, p_inv, rendimento, soc0 = (
+        p.reshape(n) for p in parametri[:7]
+    )
+    fv = np.broadcast_to(fv, parametri[0].shape + (ORE_ANNO,)).reshape(n, ORE_ANNO)
+    carico = np.broadcast_to(carico, parametri[0].shape + (ORE_ANNO,)).reshape(n, ORE_ANNO)
+
+    risultati = {k: np.empty(n) for k in CHIAVI}
+
+    for inizio in range(0, n, blocco):
+        s = slice(inizio, min(inizio + blocco, n))
+        parziali = _simula_blocco(
+            fv[s] * kwp[s, None],
+            carico[s] * consumo_kwh[s, None],
+            capacita[s],
+            p_batt[s, None],
+            p_inv[s, None],
+            rendimento[s, None],
+            soc0[s],
+        )
+        for k, v in parziali.items():
+            risultati[k][s] = v
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        risultati["quota_autoconsumo"] = np.where(
+            risultati["produzione"] > 0, risultati["autoconsumo"] / risultati["produzione"], 0.0
+        )
+        risultati["quota_copertura"] = np.where(
+            consumo_kwh > 0, risultati["autoconsumo"] / consumo_kwh, 0.0
+        )
+
+    forma = parametri[0].shape
+    if scalare:
+        return {k: float(v[0]) for k, v in risultati.items()}
+
+    return {k: v.reshape(forma) for k, v in risultati.items()}
+
+
+def zona_da_resa(resa_kwh_kwp):
+    """Zona con la resa tipica piu' vicina."""
+    return min(ZONE, key=lambda z: abs(ZONE[z][1] - resa_kwh_kwp))
+
+
+def parametri_autoconsumo(consumo_kwh, base_kwp, bonus_kwp, resa_kwh_kwp, zona="nord", **opzioni):
+    """
+    Quote di copertura dei consumi per compute_benefits, dalla simulazione
+    oraria della configurazione base e di quella bonus (stessa batteria).
+
+    Ritorna {"autoc_base_perc", "autoc_bonus_perc"}: scalari o array.
+    """
+    kwp = np.stack(np.broadcast_arrays(
+        np.asarray(base_kwp, dtype=float), np.asarray(bonus_kwp, dtype=float)
+    ))
+    sim = simula_anno(
+        kwp, consumo_kwh, zona=zona, resa_kwh_kwp=resa_kwh_kwp, **opzioni
+    )
+    copertura = sim["quota_copertura"]
+
+    if np.ndim(copertura) == 1:
+        return {"autoc_base_perc": float(copertura[0]), "autoc_bonus_perc": float(copertura[1])}
+
+    return {"autoc_base_perc": copertura[0], "autoc_bonus_perc": copertura[1]}
@@ -0,0 +1,49 @@
+# test_montecarlo.py
+
+"""
+Quantili del Monte Carlo con percorsi che non rientrano dal costo.
+
+Uso:
+    python -m pytest -q test_montecarlo.py
+"""
+
+import math
+
+from montecarlo import METRICHE, simula_monte_carlo
+
+
+CLIENTE = {
+    "consumo_kwh": 5400,
+    "base_kwp": 6.56,
+    "bonus_kwp": 9.02,
+    "prezzo_energia": 0.30,
+    "rid_eur_kwh": 0.137,
+    "cer_eur_kwh": 0.06,
+    "quota_condivisa": 0.5,
+    "costo_impianto": 13560,
+    "resa_kwh_kwp": 1200,
+    "autoc_base_perc": 0.80,
+    "autoc_bonus_perc": None,
+    "incremento_prezzo_annuo": 0.03,
+}
+
+
+def _nessun_nan(risultato):
+    return all(not math.isnan(v) for m in METRICHE for v in risultato[m].values())
+
+
+def test_payback_senza_rientro_e_infinito():
+    # costo che nessun percorso recupera entro l'orizzonte del piano
+    r = simula_monte_carlo({**CLIENTE, "costo_impianto": 400_000}, n_percorsi=2000)
+
+    assert r["payback_anni"] == {"p10": math.inf, "p50": math.inf, "p90": math.inf}
+    assert _nessun_nan(r)
+
+
+def test_payback_in_parte_oltre_orizzonte():
+    # una parte dei percorsi rientra, gli altri no: P90 tra due +inf
+    r = simula_monte_carlo({**CLIENTE, "costo_impianto": 200_000}, n_percorsi=2000)
+
+    assert math.isfinite(r["payback_anni"]["p10"])
+    assert r["payback_anni"]["p90"] == math.inf
+    assert _nessun_nan(r)